@@ -47,9 +47,25 @@ class AerodynamicsHighSpeed(Group):
         self.options.declare("propulsion_id", default="", types=str)
         self.options.declare("use_openvsp", default=False, types=bool)
         self.options.declare("compute_mach_interpolation", default=False, types=bool)
+        self.options.declare(
+            "mach_interpolation_workers",
+            default=1,
+            types=int,
+            lower=1,
+            desc="Number of processes used to compute the points of the Cl_alpha interpolation "
+            "in Mach, 1 means they are computed sequentially",
+        )
         self.options.declare("compute_slipstream", default=False, types=bool)
         self.options.declare("result_folder_path", default="", types=str)
         self.options.declare("openvsp_exe_path", default="", types=str, allow_none=True)
+        self.options.declare(
+            "openvsp_case_workers",
+            default=1,
+            types=int,
+            lower=1,
+            desc="Number of processes used to run the independent OpenVSP cases of an aerodynamic "
+            "computation, 1 means they are run sequentially",
+        )
         self.options.declare("airfoil_folder_path", default=None, types=str, allow_none=True)
         self.options.declare("wing_airfoil", default="naca23012.af", types=str, allow_none=True)
         self.options.declare("htp_airfoil", default="naca0012.af", types=str, allow_none=True)
@@ -65,6 +81,7 @@ class AerodynamicsHighSpeed(Group):
                         low_speed_aero=False,
                         result_folder_path=self.options["result_folder_path"],
                         compute_mach_interpolation=True,
+                        mach_interpolation_workers=self.options["mach_interpolation_workers"],
                         airfoil_folder_path=self.options["airfoil_folder_path"],
                         wing_airfoil_file=self.options["wing_airfoil"],
                         htp_airfoil_file=self.options["htp_airfoil"],
@@ -100,8 +117,10 @@ class AerodynamicsHighSpeed(Group):
                     ComputeAEROopenvsp(
                         low_speed_aero=False,
                         compute_mach_interpolation=True,
+                        mach_interpolation_workers=self.options["mach_interpolation_workers"],
                         result_folder_path=self.options["result_folder_path"],
                         openvsp_exe_path=self.options["openvsp_exe_path"],
+                        openvsp_case_workers=self.options["openvsp_case_workers"],
                         airfoil_folder_path=self.options["airfoil_folder_path"],
                         wing_airfoil_file=self.options["wing_airfoil"],
                         htp_airfoil_file=self.options["htp_airfoil"],
@@ -117,6 +136,7 @@ class AerodynamicsHighSpeed(Group):
                         result_folder_path=self.options["result_folder_path"],
                         airfoil_folder_path=self.options["airfoil_folder_path"],
                         openvsp_exe_path=self.options["openvsp_exe_path"],
+                        openvsp_case_workers=self.options["openvsp_case_workers"],
                         wing_airfoil_file=self.options["wing_airfoil"],
                         htp_airfoil_file=self.options["htp_airfoil"],
                     ),
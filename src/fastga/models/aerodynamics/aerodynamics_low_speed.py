@@ -51,6 +51,14 @@ class AerodynamicsLowSpeed(om.Group):
         self.options.declare("compute_slipstream", default=False, types=bool)
         self.options.declare("result_folder_path", default="", types=str)
         self.options.declare("openvsp_exe_path", default="", types=str, allow_none=True)
+        self.options.declare(
+            "openvsp_case_workers",
+            default=1,
+            types=int,
+            lower=1,
+            desc="Number of processes used to run the independent OpenVSP cases of an aerodynamic "
+            "computation, 1 means they are run sequentially",
+        )
         self.options.declare("airfoil_folder_path", default=None, types=str, allow_none=True)
         self.options.declare("wing_airfoil", default="naca23012.af", types=str, allow_none=True)
         self.options.declare("htp_airfoil", default="naca0012.af", types=str, allow_none=True)
@@ -79,6 +87,7 @@ class AerodynamicsLowSpeed(om.Group):
                     compute_mach_interpolation=False,
                     result_folder_path=self.options["result_folder_path"],
                     openvsp_exe_path=self.options["openvsp_exe_path"],
+                    openvsp_case_workers=self.options["openvsp_case_workers"],
                     airfoil_folder_path=self.options["airfoil_folder_path"],
                     wing_airfoil_file=self.options["wing_airfoil"],
                     htp_airfoil_file=self.options["htp_airfoil"],
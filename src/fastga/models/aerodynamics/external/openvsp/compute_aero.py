@@ -33,6 +33,22 @@ class ComputeAEROopenvsp(Group):
     def initialize(self):
         self.options.declare("low_speed_aero", default=False, types=bool)
         self.options.declare("compute_mach_interpolation", default=False, types=bool)
+        self.options.declare(
+            "mach_interpolation_workers",
+            default=1,
+            types=int,
+            lower=1,
+            desc="Number of processes used to compute the points of the Cl_alpha interpolation "
+            "in Mach, 1 means they are computed sequentially",
+        )
+        self.options.declare(
+            "openvsp_case_workers",
+            default=1,
+            types=int,
+            lower=1,
+            desc="Number of processes used to run the independent OpenVSP cases of an aerodynamic "
+            "computation, 1 means they are run sequentially",
+        )
         self.options.declare("result_folder_path", default="", types=str)
         self.options.declare("openvsp_exe_path", default="", types=str, allow_none=True)
         self.options.declare("airfoil_folder_path", default=None, types=str, allow_none=True)
@@ -54,8 +70,10 @@ class ComputeAEROopenvsp(Group):
             _ComputeAEROopenvsp(
                 low_speed_aero=self.options["low_speed_aero"],
                 compute_mach_interpolation=self.options["compute_mach_interpolation"],
+                mach_interpolation_workers=self.options["mach_interpolation_workers"],
                 result_folder_path=self.options["result_folder_path"],
                 openvsp_exe_path=self.options["openvsp_exe_path"],
+                openvsp_case_workers=self.options["openvsp_case_workers"],
                 airfoil_folder_path=self.options["airfoil_folder_path"],
                 wing_airfoil_file=self.options["wing_airfoil_file"],
                 htp_airfoil_file=self.options["htp_airfoil_file"],
@@ -15,25 +15,24 @@
 import os
 import os.path as pth
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from importlib.resources import path
 
 import numpy as np
-import pandas as pd
 
 # noinspection PyProtectedMember
-from fastoad._utils.resource_management.copy import copy_resource, copy_resource_folder
+from fastoad._utils.resource_management.copy import copy_resource
 
 from openmdao.components.external_code_comp import ExternalCodeComp
 from openmdao.utils.file_wrap import InputFileGenerator
 from stdatm import Atmosphere
 
-# noinspection PyProtectedMember
-from fastga.command.api import _create_tmp_directory
 from fastga.utils.resource_management.copy import copy_resource_from_path
-from . import openvsp3201
 from . import resources as local_resources
+from .openvsp_workspace import OpenVSPWorkspace
 from ... import airfoil_folder
 from ...constants import SPAN_MESH_POINT, MACH_NB_PTS
+from ..result_store import AeroResultStore
 
 DEFAULT_WING_AIRFOIL = "naca23012.af"
 DEFAULT_HTP_AIRFOIL = "naca0012.af"
@@ -63,6 +62,23 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         self.options.declare(
             "htp_airfoil_file", default=DEFAULT_HTP_AIRFOIL, types=str, allow_none=True
         )
+        self.options.declare(
+            "mach_interpolation_workers",
+            default=1,
+            types=int,
+            lower=1,
+            desc="Number of processes used to compute the points of the Cl_alpha interpolation "
+            "in Mach, 1 means they are computed sequentially",
+        )
+        self.options.declare(
+            "openvsp_case_workers",
+            default=1,
+            types=int,
+            lower=1,
+            desc="Number of processes used to run the independent OpenVSP cases of an aerodynamic "
+            "computation, 1 means they are run sequentially. Cases are always run sequentially if "
+            "openvsp_exe_path is specified since they share its folder",
+        )
 
     def setup(self):
         self.add_input("data:geometry:wing:sweep_25", val=np.nan, units="deg")
@@ -139,10 +155,36 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         """
         mach_interp = np.log(np.linspace(np.exp(0.15), np.exp(1.55 * cruise_mach), MACH_NB_PTS))
         cl_alpha_interp = np.zeros_like(mach_interp)
-        for idx, mach in enumerate(mach_interp):
-            cl_alpha_interp[idx] = self.compute_cl_alpha_aircraft(
-                inputs, outputs, altitude, mach, aoa_angle
+        workers = min(self.options["mach_interpolation_workers"], MACH_NB_PTS)
+        if workers > 1:
+            # Each process works on its own copy of the component, and in its own temporary
+            # directories
+            component_options = dict(self.options.items())
+            # Processes are not multiplied by running the cases of each Mach in parallel too
+            component_options["openvsp_case_workers"] = 1
+            component_inputs = {name: np.copy(inputs[name]) for name in inputs}
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        _compute_cl_alpha_aircraft,
+                        type(self),
+                        component_options,
+                        component_inputs,
+                        altitude,
+                        mach,
+                        aoa_angle,
+                    )
+                    for mach in mach_interp
+                ]
+                for idx, future in enumerate(futures):
+                    cl_alpha_interp[idx] = future.result()
+        else:
+            # All the mach numbers are computed by a single OpenVSP run of each geometry
+            aero_coeff_list = self.compute_aero_coeff_sweep(
+                inputs, outputs, altitude, mach_interp, aoa_angle
             )
+            for idx, aero_coeff in enumerate(aero_coeff_list):
+                cl_alpha_interp[idx] = float(aero_coeff[2] + aero_coeff[10])
 
         # We add the case were M=0, for thoroughness and since we are in an incompressible flow,
         # the Cl_alpha is approximately the same as for the first Mach of the interpolation
@@ -167,8 +209,24 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         coeff_k_htp parameters.
         """
 
+        return self.compute_aero_coeff_sweep(inputs, outputs, altitude, [mach], aoa_angle)[0]
+
+    def compute_aero_coeff_sweep(self, inputs, outputs, altitude, mach_list, aoa_angle):
+        """
+        Function that computes in OpenVSP environment all the aerodynamic parameters of
+        compute_aero_coeff for several mach numbers. The mach numbers without saved results are
+        computed together, with one OpenVSP run for each geometry (wing, aircraft and HTP).
+
+        @param inputs: inputs parameters defined within FAST-OAD-GA
+        @param outputs: outputs parameters defined within FAST-OAD-GA
+        @param altitude: altitude for aerodynamic calculation in meters
+        @param mach_list: list of air speeds expressed in mach
+        @param aoa_angle: air speed angle of attack with respect to aircraft
+        @return: list of the compute_aero_coeff parameters for each mach number.
+        """
+
         # Fix mach number of digits to consider similar results
-        mach = round(float(mach) * 1e3) / 1e3
+        mach_list = [round(float(mach) * 1e3) / 1e3 for mach in mach_list]
 
         # Get inputs necessary to define global geometry
         s_ref_wing = float(inputs["data:geometry:wing:area"])
@@ -182,118 +240,180 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         taper_ratio_htp = float(inputs["data:geometry:horizontal_tail:taper_ratio"])
         dihedral_angle = float(inputs["data:geometry:wing:dihedral"])
         twist_angle = float(inputs["data:geometry:wing:twist"])
-        geometry_set = np.around(
-            np.array(
-                [
-                    sweep25_wing,
-                    taper_ratio_wing,
-                    aspect_ratio_wing,
-                    dihedral_angle,
-                    twist_angle,
-                    sweep25_htp,
-                    taper_ratio_htp,
-                    aspect_ratio_htp,
-                    mach,
-                    area_ratio,
-                ]
-            ),
-            decimals=6,
-        )
+        geometry_sets = [
+            np.around(
+                np.array(
+                    [
+                        sweep25_wing,
+                        taper_ratio_wing,
+                        aspect_ratio_wing,
+                        dihedral_angle,
+                        twist_angle,
+                        sweep25_htp,
+                        taper_ratio_htp,
+                        aspect_ratio_htp,
+                        mach,
+                        area_ratio,
+                    ]
+                ),
+                decimals=6,
+            )
+            for mach in mach_list
+        ]
 
         # Search if results already exist:
         result_folder_path = self.options["result_folder_path"]
-        result_file_path = None
-        saved_area_ratio = 1.0
+        saved_results = [(None, 1.0)] * len(mach_list)
         if result_folder_path != "":
-            result_file_path, saved_area_ratio = self.search_results(
-                result_folder_path, geometry_set
-            )
+            result_store = AeroResultStore(result_folder_path, "openvsp")
+            saved_results = [result_store.search(geometry_set) for geometry_set in geometry_sets]
 
-        # If no result saved for that geometry under this mach condition, computation is done
-        if result_file_path is None:
+        # If no result saved for that geometry under a mach condition, computation is done for all
+        # those mach numbers at once
+        computed_mach_list = sorted(
+            {mach for mach, (results, _) in zip(mach_list, saved_results) if results is None}
+        )
+        if computed_mach_list:
 
             # Create result folder first (if it must fail, let it fail as soon as possible)
             if result_folder_path != "":
                 if not os.path.exists(result_folder_path):
                     os.makedirs(pth.join(result_folder_path), exist_ok=True)
 
-            # Save the geometry (result_file_path is None entering the function)
-            if self.options["result_folder_path"] != "":
-                result_file_path = self.save_geometry(result_folder_path, geometry_set)
-
-            # Compute wing alone @ 0°/X° angle of attack
-            wing_0 = self.compute_wing(inputs, outputs, altitude, mach, 0.0)
-            wing_aoa = self.compute_wing(inputs, outputs, altitude, mach, aoa_angle)
-
-            # Compute complete aircraft @ 0°/X° angle of attack
-            _, htp_0, _ = self.compute_aircraft(inputs, outputs, altitude, mach, 0.0)
-            _, htp_aoa, _ = self.compute_aircraft(inputs, outputs, altitude, mach, aoa_angle)
-
-            # Compute isolated HTP @ 0°/X° angle of attack
-            htp_0_isolated = self.compute_isolated_htp(inputs, outputs, altitude, mach, 0.0)
-            htp_aoa_isolated = self.compute_isolated_htp(inputs, outputs, altitude, mach, aoa_angle)
-
-            # Post-process wing data ---------------------------------------------------------------
-            width_max = inputs["data:geometry:fuselage:maximum_width"]
-            span_wing = inputs["data:geometry:wing:span"]
-            k_fus = 1 + 0.025 * width_max / span_wing - 0.025 * (width_max / span_wing) ** 2
-            cl_0_wing = float(wing_0["cl"] * k_fus)
-            cl_x_wing = float(wing_aoa["cl"] * k_fus)
-            cm_0_wing = float(wing_0["cm"] * k_fus)
-            cl_alpha_wing = (cl_x_wing - cl_0_wing) / (aoa_angle * np.pi / 180)
-            y_vector_wing = wing_aoa["y_vector"]
-            cl_vector_wing = (np.array(wing_aoa["cl_vector"]) * k_fus).tolist()
-            chord_vector_wing = wing_aoa["chord_vector"]
-            k_fus = 1 - 2 * (width_max / span_wing) ** 2  # Fuselage correction
-            # Full aircraft correction: Wing lift is 105% of total lift, so: CDi = (CL*1.05)^2/(
-            # piAe) -> e' = e/1.05^2
-            coeff_e = float(wing_aoa["coeff_e"] * k_fus / 1.05 ** 2)
-            coeff_k_wing = float(1.0 / (np.pi * span_wing ** 2 / s_ref_wing * coeff_e))
-
-            # Post-process HTP-aircraft data -------------------------------------------------------
-            cl_0_htp = float(htp_0["cl"])
-            cl_aoa_htp = float(htp_aoa["cl"])
-            cl_alpha_htp = float((cl_aoa_htp - cl_0_htp) / (aoa_angle * np.pi / 180))
-            coeff_k_htp = float(htp_aoa["cdi"]) / cl_aoa_htp ** 2
-            y_vector_htp = htp_aoa["y_vector"]
-            cl_vector_htp = (np.array(htp_aoa["cl_vector"]) * area_ratio).tolist()
-
-            # Post-process HTP-isolated data -------------------------------------------------------
-            cl_alpha_htp_isolated = (
-                float(htp_aoa_isolated["cl"] - htp_0_isolated["cl"])
-                * area_ratio
-                / (aoa_angle * np.pi / 180)
+            # Compute wing alone, complete aircraft and isolated HTP @ 0°/X° angle of attack, the
+            # cases of each geometry being ordered by mach number, then angle of attack
+            wing_cases, aircraft_cases, htp_isolated_cases = self.compute_cases(
+                inputs,
+                outputs,
+                altitude,
+                computed_mach_list,
+                [
+                    ("compute_wing_sweep", [0.0, aoa_angle]),
+                    ("compute_aircraft_sweep", [0.0, aoa_angle]),
+                    ("compute_isolated_htp_sweep", [0.0, aoa_angle]),
+                ],
             )
 
-            # Resize vectors -----------------------------------------------------------------------
-            if SPAN_MESH_POINT < len(y_vector_wing):
-                y_interp = np.linspace(y_vector_wing[0], y_vector_wing[-1], SPAN_MESH_POINT)
-                cl_vector_wing = np.interp(y_interp, y_vector_wing, cl_vector_wing)
-                chord_vector_wing = np.interp(y_interp, y_vector_wing, chord_vector_wing)
-                y_vector_wing = y_interp
-                warnings.warn(
-                    "Defined maximum span mesh in fast aerodynamics\\constants.py exceeded!"
+        aero_coeff_list = []
+        for mach, geometry_set, (results, saved_area_ratio) in zip(
+            mach_list, geometry_sets, saved_results
+        ):
+            if results is None:
+                mach_idx = computed_mach_list.index(mach)
+                wing_0, wing_aoa = wing_cases[2 * mach_idx : 2 * mach_idx + 2]
+                (_, htp_0, _), (_, htp_aoa, _) = aircraft_cases[2 * mach_idx : 2 * mach_idx + 2]
+                htp_0_isolated, htp_aoa_isolated = htp_isolated_cases[
+                    2 * mach_idx : 2 * mach_idx + 2
+                ]
+
+                # Post-process wing data -----------------------------------------------------------
+                width_max = inputs["data:geometry:fuselage:maximum_width"]
+                span_wing = inputs["data:geometry:wing:span"]
+                k_fus = 1 + 0.025 * width_max / span_wing - 0.025 * (width_max / span_wing) ** 2
+                cl_0_wing = float(wing_0["cl"] * k_fus)
+                cl_x_wing = float(wing_aoa["cl"] * k_fus)
+                cm_0_wing = float(wing_0["cm"] * k_fus)
+                cl_alpha_wing = (cl_x_wing - cl_0_wing) / (aoa_angle * np.pi / 180)
+                y_vector_wing = list(wing_aoa["y_vector"])
+                cl_vector_wing = (np.array(wing_aoa["cl_vector"]) * k_fus).tolist()
+                chord_vector_wing = list(wing_aoa["chord_vector"])
+                k_fus = 1 - 2 * (width_max / span_wing) ** 2  # Fuselage correction
+                # Full aircraft correction: Wing lift is 105% of total lift, so: CDi = (CL*1.05)^2/(
+                # piAe) -> e' = e/1.05^2
+                coeff_e = float(wing_aoa["coeff_e"] * k_fus / 1.05 ** 2)
+                coeff_k_wing = float(1.0 / (np.pi * span_wing ** 2 / s_ref_wing * coeff_e))
+
+                # Post-process HTP-aircraft data ---------------------------------------------------
+                cl_0_htp = float(htp_0["cl"])
+                cl_aoa_htp = float(htp_aoa["cl"])
+                cl_alpha_htp = float((cl_aoa_htp - cl_0_htp) / (aoa_angle * np.pi / 180))
+                coeff_k_htp = float(htp_aoa["cdi"]) / cl_aoa_htp ** 2
+                y_vector_htp = list(htp_aoa["y_vector"])
+                cl_vector_htp = (np.array(htp_aoa["cl_vector"]) * area_ratio).tolist()
+
+                # Post-process HTP-isolated data ---------------------------------------------------
+                cl_alpha_htp_isolated = (
+                    float(htp_aoa_isolated["cl"] - htp_0_isolated["cl"])
+                    * area_ratio
+                    / (aoa_angle * np.pi / 180)
                 )
+
+                # Resize vectors -------------------------------------------------------------------
+                if SPAN_MESH_POINT < len(y_vector_wing):
+                    y_interp = np.linspace(y_vector_wing[0], y_vector_wing[-1], SPAN_MESH_POINT)
+                    cl_vector_wing = np.interp(y_interp, y_vector_wing, cl_vector_wing)
+                    chord_vector_wing = np.interp(y_interp, y_vector_wing, chord_vector_wing)
+                    y_vector_wing = y_interp
+                    warnings.warn(
+                        "Defined maximum span mesh in fast aerodynamics\\constants.py exceeded!"
+                    )
+                else:
+                    additional_zeros = list(np.zeros(SPAN_MESH_POINT - len(y_vector_wing)))
+                    y_vector_wing.extend(additional_zeros)
+                    cl_vector_wing.extend(additional_zeros)
+                    chord_vector_wing.extend(additional_zeros)
+                if SPAN_MESH_POINT < len(y_vector_htp):
+                    y_interp = np.linspace(y_vector_htp[0], y_vector_htp[-1], SPAN_MESH_POINT)
+                    cl_vector_htp = np.interp(y_interp, y_vector_htp, cl_vector_htp)
+                    y_vector_htp = y_interp
+                    warnings.warn(
+                        "Defined maximum span mesh in fast aerodynamics\\constants.py exceeded!"
+                    )
+                else:
+                    additional_zeros = list(np.zeros(SPAN_MESH_POINT - len(y_vector_htp)))
+                    y_vector_htp.extend(additional_zeros)
+                    cl_vector_htp.extend(additional_zeros)
+
+                # Save results to defined path -----------------------------------------------------
+                if result_folder_path != "":
+                    results = {
+                        "cl_0_wing": cl_0_wing,
+                        "cl_X_wing": cl_x_wing,
+                        "cl_alpha_wing": cl_alpha_wing,
+                        "cm_0_wing": cm_0_wing,
+                        "y_vector_wing": y_vector_wing,
+                        "cl_vector_wing": cl_vector_wing,
+                        "chord_vector_wing": chord_vector_wing,
+                        "coeff_k_wing": coeff_k_wing,
+                        "cl_0_htp": cl_0_htp,
+                        "cl_X_htp": cl_aoa_htp,
+                        "cl_alpha_htp": cl_alpha_htp,
+                        "cl_alpha_htp_isolated": cl_alpha_htp_isolated,
+                        "y_vector_htp": y_vector_htp,
+                        "cl_vector_htp": cl_vector_htp,
+                        "coeff_k_htp": coeff_k_htp,
+                        "saved_ref_area": s_ref_wing,
+                    }
+                    result_store.save(geometry_set, results)
+
+            # Else retrieved results are used, eventually adapted with new area ratio
             else:
-                additional_zeros = list(np.zeros(SPAN_MESH_POINT - len(y_vector_wing)))
-                y_vector_wing.extend(additional_zeros)
-                cl_vector_wing.extend(additional_zeros)
-                chord_vector_wing.extend(additional_zeros)
-            if SPAN_MESH_POINT < len(y_vector_htp):
-                y_interp = np.linspace(y_vector_htp[0], y_vector_htp[-1], SPAN_MESH_POINT)
-                cl_vector_htp = np.interp(y_interp, y_vector_htp, cl_vector_htp)
-                y_vector_htp = y_interp
-                warnings.warn(
-                    "Defined maximum span mesh in fast aerodynamics\\constants.py exceeded!"
+                # Read values from result database -------------------------------------------------
+                saved_area_wing = float(results["saved_ref_area"])
+                cl_0_wing = float(results["cl_0_wing"])
+                cl_x_wing = float(results["cl_X_wing"])
+                cl_alpha_wing = float(results["cl_alpha_wing"])
+                cm_0_wing = float(results["cm_0_wing"])
+                y_vector_wing = np.array(results["y_vector_wing"]) * np.sqrt(
+                    s_ref_wing / saved_area_wing
                 )
-            else:
-                additional_zeros = list(np.zeros(SPAN_MESH_POINT - len(y_vector_htp)))
-                y_vector_htp.extend(additional_zeros)
-                cl_vector_htp.extend(additional_zeros)
+                cl_vector_wing = np.array(results["cl_vector_wing"])
+                chord_vector_wing = np.array(results["chord_vector_wing"]) * np.sqrt(
+                    s_ref_wing / saved_area_wing
+                )
+                coeff_k_wing = float(results["coeff_k_wing"])
+                cl_0_htp = float(results["cl_0_htp"]) * (area_ratio / saved_area_ratio)
+                cl_aoa_htp = float(results["cl_X_htp"]) * (area_ratio / saved_area_ratio)
+                cl_alpha_htp = float(results["cl_alpha_htp"]) * (area_ratio / saved_area_ratio)
+                cl_alpha_htp_isolated = float(results["cl_alpha_htp_isolated"]) * (
+                    area_ratio / saved_area_ratio
+                )
+                y_vector_htp = np.array(results["y_vector_htp"])
+                cl_vector_htp = np.array(results["cl_vector_htp"]) * (area_ratio / saved_area_ratio)
+                coeff_k_htp = float(results["coeff_k_htp"]) * (area_ratio / saved_area_ratio)
 
-            # Save results to defined path ---------------------------------------------------------
-            if self.options["result_folder_path"] != "":
-                results = [
+            aero_coeff_list.append(
+                (
                     cl_0_wing,
                     cl_x_wing,
                     cl_alpha_wing,
@@ -309,60 +429,50 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
                     y_vector_htp,
                     cl_vector_htp,
                     coeff_k_htp,
-                    s_ref_wing,
+                )
+            )
+
+        return aero_coeff_list
+
+    def compute_cases(self, inputs, outputs, altitude, mach_list, cases):
+        """
+        Function that runs independent OpenVSP cases, in parallel processes if allowed by the
+        openvsp_case_workers option, each case having its own working directory.
+
+        @param inputs: inputs parameters defined within FAST-OAD-GA
+        @param outputs: outputs parameters defined within FAST-OAD-GA
+        @param altitude: altitude for aerodynamic calculation in meters
+        @param mach_list: list of air speeds expressed in mach, shared by all the cases
+        @param cases: list of (name of the compute method, list of angles of attack in degree)
+        @return: list of the results of the compute method of each case
+        """
+
+        workers = min(self.options["openvsp_case_workers"], len(cases))
+        if workers > 1 and not self.options["openvsp_exe_path"]:
+            # Each process works on its own copy of the component, the wall time being the one of
+            # the slowest cases
+            component_options = dict(self.options.items())
+            component_inputs = {name: np.copy(inputs[name]) for name in inputs}
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        _compute_case,
+                        type(self),
+                        component_options,
+                        component_inputs,
+                        method_name,
+                        altitude,
+                        mach_list,
+                        aoa_list,
+                    )
+                    for method_name, aoa_list in cases
                 ]
-                self.save_results(result_file_path, results)
+                return [future.result() for future in futures]
 
-        # Else retrieved results are used, eventually adapted with new area ratio
-        else:
-            # Read values from result file ---------------------------------------------------------
-            data = self.read_results(result_file_path)
-            saved_area_wing = float(data.loc["saved_ref_area", 0])
-            cl_0_wing = float(data.loc["cl_0_wing", 0])
-            cl_x_wing = float(data.loc["cl_X_wing", 0])
-            cl_alpha_wing = float(data.loc["cl_alpha_wing", 0])
-            cm_0_wing = float(data.loc["cm_0_wing", 0])
-            y_vector_wing = np.array(
-                [float(i) for i in data.loc["y_vector_wing", 0][1:-2].split(",")]
-            ) * np.sqrt(s_ref_wing / saved_area_wing)
-            cl_vector_wing = np.array(
-                [float(i) for i in data.loc["cl_vector_wing", 0][1:-2].split(",")]
-            )
-            chord_vector_wing = np.array(
-                [float(i) for i in data.loc["chord_vector_wing", 0][1:-2].split(",")]
-            ) * np.sqrt(s_ref_wing / saved_area_wing)
-            coeff_k_wing = float(data.loc["coeff_k_wing", 0])
-            cl_0_htp = float(data.loc["cl_0_htp", 0]) * (area_ratio / saved_area_ratio)
-            cl_aoa_htp = float(data.loc["cl_X_htp", 0]) * (area_ratio / saved_area_ratio)
-            cl_alpha_htp = float(data.loc["cl_alpha_htp", 0]) * (area_ratio / saved_area_ratio)
-            cl_alpha_htp_isolated = float(data.loc["cl_alpha_htp_isolated", 0]) * (
-                area_ratio / saved_area_ratio
-            )
-            y_vector_htp = np.array(
-                [float(i) for i in data.loc["y_vector_htp", 0][1:-2].split(",")]
-            )
-            cl_vector_htp = np.array(
-                [float(i) for i in data.loc["cl_vector_htp", 0][1:-2].split(",")]
-            ) * (area_ratio / saved_area_ratio)
-            coeff_k_htp = float(data.loc["coeff_k_htp", 0]) * (area_ratio / saved_area_ratio)
-
-        return (
-            cl_0_wing,
-            cl_x_wing,
-            cl_alpha_wing,
-            cm_0_wing,
-            y_vector_wing,
-            cl_vector_wing,
-            chord_vector_wing,
-            coeff_k_wing,
-            cl_0_htp,
-            cl_aoa_htp,
-            cl_alpha_htp,
-            cl_alpha_htp_isolated,
-            y_vector_htp,
-            cl_vector_htp,
-            coeff_k_htp,
-        )
+        return [
+            getattr(self, method_name)(inputs, outputs, altitude, mach_list, aoa_list)
+            for method_name, aoa_list in cases
+        ]
 
     def compute_wing(self, inputs, outputs, altitude, mach, aoa_angle):
         """
@@ -378,6 +488,23 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         cm_vector, cl, cdi, cm, coeff_e
         """
 
+        return self.compute_wing_sweep(inputs, outputs, altitude, [mach], [aoa_angle])[0]
+
+    def compute_wing_sweep(self, inputs, outputs, altitude, mach_list, aoa_list):
+        """
+        Function that computes in OpenVSP environment the wing alone for several mach numbers and
+        angles of attack, with a single vspaero run, and returns the different aerodynamic
+        parameters of each case.
+
+        @param inputs: inputs parameters defined within FAST-OAD-GA
+        @param outputs: outputs parameters defined within FAST-OAD-GA
+        @param altitude: altitude for aerodynamic calculation in meters
+        @param mach_list: list of air speeds expressed in mach
+        @param aoa_list: list of air speed angles of attack with respect to wing (degree)
+        @return: list of the compute_wing dictionaries of each mach number and angle of attack,
+        ordered by mach number, then angle of attack
+        """
+
         # STEP 1/XX - DEFINE OR CALCULATE INPUT DATA FOR AERODYNAMIC EVALUATION ####################
         ############################################################################################
 
@@ -405,19 +532,19 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         z_wing = -inputs["data:geometry:wing:root:z"]
         span2_wing = y4_wing - y2_wing
         rho = atm.density
-        v_inf = max(atm.speed_of_sound * mach, 0.01)  # avoid V=0 m/s crashes
+        # Speed and Reynolds number are only used for viscous drag, they are computed for the
+        # first mach number of the sweep
+        v_inf = max(atm.speed_of_sound * mach_list[0], 0.01)  # avoid V=0 m/s crashes
         reynolds = v_inf * l0_wing / atm.kinematic_viscosity
 
         # STEP 2/XX - DEFINE WORK DIRECTORY, COPY RESOURCES AND CREATE COMMAND BATCH ###############
         ############################################################################################
 
         # If a folder path is specified for openvsp .exe, it becomes working directory (target),
-        # if not temporary folder is created
-        if self.options["openvsp_exe_path"]:
-            target_directory = pth.abspath(self.options["openvsp_exe_path"])
-        else:
-            tmp_directory = _create_tmp_directory()
-            target_directory = tmp_directory.name
+        # if not a scratch folder is created next to the OpenVSP installation of the process
+        workspace = OpenVSPWorkspace.get_workspace(self.options["openvsp_exe_path"])
+        target_directory = workspace.create_run_directory()
+        exe_directory = workspace.install_directory
         # Define the list of necessary input files: geometry script and foil file for both wing/HTP
         input_file_list = [
             pth.join(target_directory, INPUT_WING_SCRIPT),
@@ -426,9 +553,7 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         self.options["external_input_files"] = input_file_list
         # Define standard error file by default to avoid error code return
         self.stderr = pth.join(target_directory, STDERR_FILE_NAME)
-        # Copy resource in working (target) directory
-        # noinspection PyTypeChecker
-        copy_resource_folder(openvsp3201, target_directory)
+        # Copy airfoils in working (target) directory
         # noinspection PyTypeChecker
         if self.options["airfoil_folder_path"] is None:
             copy_resource(airfoil_folder, self.options["wing_airfoil_file"], target_directory)
@@ -443,7 +568,7 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         batch_file = open(self.options["command"][0], "w+")
         batch_file.write("@echo off\n")
         command = (
-            pth.join(target_directory, VSPSCRIPT_EXE_NAME)
+            pth.join(exe_directory, VSPSCRIPT_EXE_NAME)
             + " -script "
             + pth.join(target_directory, INPUT_WING_SCRIPT)
             + " >nul 2>nul\n"
@@ -514,7 +639,7 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         batch_file = open(self.options["command"][0], "w+")
         batch_file.write("@echo off\n")
         command = (
-            pth.join(target_directory, VSPAERO_EXE_NAME)
+            pth.join(exe_directory, VSPAERO_EXE_NAME)
             + " "
             + input_file_list[1].replace(".vspaero", "")
             + " >nul 2>nul\n"
@@ -540,9 +665,9 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
             parser.mark_anchor("X_cg")
             parser.transfer_var(float(fa_length), 0, 3)
             parser.mark_anchor("Mach")
-            parser.transfer_var(float(mach), 0, 3)
+            parser.transfer_var(_sweep_values(mach_list), 0, 3)
             parser.mark_anchor("AOA")
-            parser.transfer_var(float(aoa_angle), 0, 3)
+            parser.transfer_var(_sweep_values(aoa_list), 0, 3)
             parser.mark_anchor("Vinf")
             parser.transfer_var(float(v_inf), 0, 3)
             parser.mark_anchor("Rho")
@@ -559,55 +684,31 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         # STEP 8/XX - READ FILES, RETURN RESULTS (AND CLEAR TEMPORARY WORKDIR) #####################
         ############################################################################################
 
-        # Open .lod file and extract data
-        wing_y_vect = []
-        wing_chord_vect = []
-        wing_cl_vect = []
-        wing_cd_vect = []
-        wing_cm_vect = []
-        with open(output_file_list[0], "r") as file_stream:
-            data = file_stream.readlines()
-            for i, _ in enumerate(data):
-                line = data[i].split()
-                line.append("**")
-                if line[0] == "1":
-                    wing_y_vect.append(float(line[2]))
-                    wing_chord_vect.append(float(line[3]))
-                    wing_cl_vect.append(float(line[5]))
-                    wing_cd_vect.append(float(line[6]))
-                    wing_cm_vect.append(float(line[12]))
-                if line[0] == "Comp":
-                    cl_wing = float(data[i + 1].split()[5]) + float(
-                        data[i + 2].split()[5]
-                    )  # sum CL left/right
-                    cdi_wing = float(data[i + 1].split()[6]) + float(
-                        data[i + 2].split()[6]
-                    )  # sum CDi left/right
-                    cm_wing = float(data[i + 1].split()[12]) + float(
-                        data[i + 2].split()[12]
-                    )  # sum CM left/right
-                    break
-        # Open .polar file and extract data
-        with open(output_file_list[1], "r") as file_stream:
-            data = file_stream.readlines()
-            wing_e = float(data[1].split()[10])
-        # Delete temporary directory
-        if not self.options["openvsp_exe_path"]:
-            # noinspection PyUnboundLocalVariable
-            tmp_directory.cleanup()
+        # Open .lod and .polar files and extract data of each case
+        lod_cases = _read_lod_file(output_file_list[0])
+        polar_header, polar_rows = _read_polar_file(output_file_list[1])
+        # Delete scratch folder
+        workspace.release_run_directory(target_directory)
         # Return values
-        wing = {
-            "y_vector": wing_y_vect,
-            "cl_vector": wing_cl_vect,
-            "chord_vector": wing_chord_vect,
-            "cd_vector": wing_cd_vect,
-            "cm_vector": wing_cm_vect,
-            "cl": cl_wing,
-            "cdi": cdi_wing,
-            "cm": cm_wing,
-            "coeff_e": wing_e,
-        }
-        return wing
+        wing_list = []
+        for case_idx in _sweep_case_indices(polar_header, polar_rows, mach_list, aoa_list):
+            strips, components = lod_cases[case_idx]
+            wing_strips = strips.get("1", [])
+            wing_list.append(
+                {
+                    "y_vector": [float(line[2]) for line in wing_strips],
+                    "cl_vector": [float(line[5]) for line in wing_strips],
+                    "chord_vector": [float(line[3]) for line in wing_strips],
+                    "cd_vector": [float(line[6]) for line in wing_strips],
+                    "cm_vector": [float(line[12]) for line in wing_strips],
+                    # sum CL/CDi/CM left/right
+                    "cl": float(components[0][5]) + float(components[1][5]),
+                    "cdi": float(components[0][6]) + float(components[1][6]),
+                    "cm": float(components[0][12]) + float(components[1][12]),
+                    "coeff_e": float(polar_rows[case_idx][10]),
+                }
+            )
+        return wing_list
 
     def compute_isolated_htp(self, inputs, outputs, altitude, mach, aoa_angle):
         """
@@ -623,6 +724,23 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         cm_vector, cl, cdi, cm, coeff_e
         """
 
+        return self.compute_isolated_htp_sweep(inputs, outputs, altitude, [mach], [aoa_angle])[0]
+
+    def compute_isolated_htp_sweep(self, inputs, outputs, altitude, mach_list, aoa_list):
+        """
+        Function that computes in OpenVSP environment the HTP alone for several mach numbers and
+        angles of attack, with a single vspaero run, and returns the different aerodynamic
+        parameters of each case.
+
+        @param inputs: inputs parameters defined within FAST-OAD-GA
+        @param outputs: outputs parameters defined within FAST-OAD-GA
+        @param altitude: altitude for aerodynamic calculation in meters
+        @param mach_list: list of air speeds expressed in mach
+        @param aoa_list: list of air speed angles of attack with respect to htp (degree)
+        @return: list of the compute_isolated_htp dictionaries of each mach number and angle of
+        attack, ordered by mach number, then angle of attack
+        """
+
         # STEP 1/XX - DEFINE OR CALCULATE INPUT DATA FOR AERODYNAMIC EVALUATION ####################
         ############################################################################################
 
@@ -643,19 +761,19 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         x_htp = fa_length + lp_htp - x0_htp - 0.25 * l0_htp
         z_htp = -(height_max - 0.12 * l0_htp) * 0.5 - height_htp
         rho = atm.density
-        v_inf = max(atm.speed_of_sound * mach, 0.01)  # avoid V=0 m/s crashes
+        # Speed and Reynolds number are only used for viscous drag, they are computed for the
+        # first mach number of the sweep
+        v_inf = max(atm.speed_of_sound * mach_list[0], 0.01)  # avoid V=0 m/s crashes
         reynolds = v_inf * l0_htp / atm.kinematic_viscosity
 
         # STEP 2/XX - DEFINE WORK DIRECTORY, COPY RESOURCES AND CREATE COMMAND BATCH ###############
         ############################################################################################
 
         # If a folder path is specified for openvsp .exe, it becomes working directory (target),
-        # if not temporary folder is created
-        if self.options["openvsp_exe_path"]:
-            target_directory = pth.abspath(self.options["openvsp_exe_path"])
-        else:
-            tmp_directory = _create_tmp_directory()
-            target_directory = tmp_directory.name
+        # if not a scratch folder is created next to the OpenVSP installation of the process
+        workspace = OpenVSPWorkspace.get_workspace(self.options["openvsp_exe_path"])
+        target_directory = workspace.create_run_directory()
+        exe_directory = workspace.install_directory
         # Define the list of necessary input files: geometry script and foil file for both wing/HTP
         input_file_list = [
             pth.join(target_directory, INPUT_HTP_SCRIPT),
@@ -664,9 +782,7 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         self.options["external_input_files"] = input_file_list
         # Define standard error file by default to avoid error code return
         self.stderr = pth.join(target_directory, STDERR_FILE_NAME)
-        # Copy resource in working (target) directory
-        # noinspection PyTypeChecker
-        copy_resource_folder(openvsp3201, target_directory)
+        # Copy airfoils in working (target) directory
         # noinspection PyTypeChecker
         if self.options["airfoil_folder_path"] is None:
             copy_resource(airfoil_folder, self.options["htp_airfoil_file"], target_directory)
@@ -681,7 +797,7 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         batch_file = open(self.options["command"][0], "w+")
         batch_file.write("@echo off\n")
         command = (
-            pth.join(target_directory, VSPSCRIPT_EXE_NAME)
+            pth.join(exe_directory, VSPSCRIPT_EXE_NAME)
             + " -script "
             + pth.join(target_directory, INPUT_HTP_SCRIPT)
             + " >nul 2>nul\n"
@@ -742,7 +858,7 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         batch_file = open(self.options["command"][0], "w+")
         batch_file.write("@echo off\n")
         command = (
-            pth.join(target_directory, VSPAERO_EXE_NAME)
+            pth.join(exe_directory, VSPAERO_EXE_NAME)
             + " "
             + input_file_list[1].replace(".vspaero", "")
             + " >nul 2>nul\n"
@@ -768,9 +884,9 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
             parser.mark_anchor("X_cg")
             parser.transfer_var(float(fa_length + lp_htp), 0, 3)
             parser.mark_anchor("Mach")
-            parser.transfer_var(float(mach), 0, 3)
+            parser.transfer_var(_sweep_values(mach_list), 0, 3)
             parser.mark_anchor("AOA")
-            parser.transfer_var(float(aoa_angle), 0, 3)
+            parser.transfer_var(_sweep_values(aoa_list), 0, 3)
             parser.mark_anchor("Vinf")
             parser.transfer_var(float(v_inf), 0, 3)
             parser.mark_anchor("Rho")
@@ -787,52 +903,30 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         # STEP 8/XX - READ FILES, RETURN RESULTS (AND CLEAR TEMPORARY WORKDIR) #####################
         ############################################################################################
 
-        # Open .lod file and extract data
-        htp_y_vect = []
-        htp_cl_vect = []
-        htp_cd_vect = []
-        htp_cm_vect = []
-        with open(output_file_list[0], "r") as lf:
-            data = lf.readlines()
-            for i in range(len(data)):
-                line = data[i].split()
-                line.append("**")
-                if line[0] == "1":
-                    htp_y_vect.append(float(line[2]))
-                    htp_cl_vect.append(float(line[5]))
-                    htp_cd_vect.append(float(line[6]))
-                    htp_cm_vect.append(float(line[12]))
-                if line[0] == "Comp":
-                    cl_htp = float(data[i + 1].split()[5]) + float(
-                        data[i + 2].split()[5]
-                    )  # sum CL left/right
-                    cdi_htp = float(data[i + 1].split()[6]) + float(
-                        data[i + 2].split()[6]
-                    )  # sum CDi left/right
-                    cm_htp = float(data[i + 1].split()[12]) + float(
-                        data[i + 2].split()[12]
-                    )  # sum CM left/right
-                    break
-        # Open .polar file and extract data
-        with open(output_file_list[1], "r") as lf:
-            data = lf.readlines()
-            htp_e = float(data[1].split()[10])
-        # Delete temporary directory
-        if not (self.options["openvsp_exe_path"]):
-            # noinspection PyUnboundLocalVariable
-            tmp_directory.cleanup()
+        # Open .lod and .polar files and extract data of each case
+        lod_cases = _read_lod_file(output_file_list[0])
+        polar_header, polar_rows = _read_polar_file(output_file_list[1])
+        # Delete scratch folder
+        workspace.release_run_directory(target_directory)
         # Return values
-        htp = {
-            "y_vector": htp_y_vect,
-            "cl_vector": htp_cl_vect,
-            "cd_vector": htp_cd_vect,
-            "cm_vector": htp_cm_vect,
-            "cl": cl_htp,
-            "cdi": cdi_htp,
-            "cm": cm_htp,
-            "coeff_e": htp_e,
-        }
-        return htp
+        htp_list = []
+        for case_idx in _sweep_case_indices(polar_header, polar_rows, mach_list, aoa_list):
+            strips, components = lod_cases[case_idx]
+            htp_strips = strips.get("1", [])
+            htp_list.append(
+                {
+                    "y_vector": [float(line[2]) for line in htp_strips],
+                    "cl_vector": [float(line[5]) for line in htp_strips],
+                    "cd_vector": [float(line[6]) for line in htp_strips],
+                    "cm_vector": [float(line[12]) for line in htp_strips],
+                    # sum CL/CDi/CM left/right
+                    "cl": float(components[0][5]) + float(components[1][5]),
+                    "cdi": float(components[0][6]) + float(components[1][6]),
+                    "cm": float(components[0][12]) + float(components[1][12]),
+                    "coeff_e": float(polar_rows[case_idx][10]),
+                }
+            )
+        return htp_list
 
     def compute_aircraft(self, inputs, outputs, altitude, mach, aoa_angle):
         """
@@ -849,6 +943,24 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         coefficients
         """
 
+        return self.compute_aircraft_sweep(inputs, outputs, altitude, [mach], [aoa_angle])[0]
+
+    def compute_aircraft_sweep(self, inputs, outputs, altitude, mach_list, aoa_list):
+        """
+        Function that computes in OpenVSP environment the complete aircraft (considering wing and
+        horizontal tail plan) for several mach numbers and angles of attack, with a single vspaero
+        run, and returns the different aerodynamic parameters of each case. The downwash is done
+        by OpenVSP considering far field.
+
+        @param inputs: inputs parameters defined within FAST-OAD-GA
+        @param outputs: outputs parameters defined within FAST-OAD-GA
+        @param altitude: altitude for aerodynamic calculation in meters
+        @param mach_list: list of air speeds expressed in mach
+        @param aoa_list: list of air speed angles of attack with respect to aircraft
+        @return: list of the compute_aircraft dictionaries of each mach number and angle of
+        attack, ordered by mach number, then angle of attack
+        """
+
         # STEP 1/XX - DEFINE OR CALCULATE INPUT DATA FOR AERODYNAMIC EVALUATION ####################
         ############################################################################################
 
@@ -885,19 +997,19 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         span2_wing = y4_wing - y2_wing
         distance_htp = fa_length + lp_htp - 0.25 * l0_htp - x0_htp
         rho = atm.density
-        v_inf = max(atm.speed_of_sound * mach, 0.01)  # avoid V=0 m/s crashes
+        # Speed and Reynolds number are only used for viscous drag, they are computed for the
+        # first mach number of the sweep
+        v_inf = max(atm.speed_of_sound * mach_list[0], 0.01)  # avoid V=0 m/s crashes
         reynolds = v_inf * l0_wing / atm.kinematic_viscosity
 
         # STEP 2/XX - DEFINE WORK DIRECTORY, COPY RESOURCES AND CREATE COMMAND BATCH ###############
         ############################################################################################
 
         # If a folder path is specified for openvsp .exe, it becomes working directory (target),
-        # if not temporary folder is created
-        if self.options["openvsp_exe_path"]:
-            target_directory = pth.abspath(self.options["openvsp_exe_path"])
-        else:
-            tmp_directory = _create_tmp_directory()
-            target_directory = tmp_directory.name
+        # if not a scratch folder is created next to the OpenVSP installation of the process
+        workspace = OpenVSPWorkspace.get_workspace(self.options["openvsp_exe_path"])
+        target_directory = workspace.create_run_directory()
+        exe_directory = workspace.install_directory
         # Define the list of necessary input files: geometry script and foil file for both wing/HTP
         input_file_list = [
             pth.join(target_directory, INPUT_AIRCRAFT_SCRIPT),
@@ -907,9 +1019,7 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         self.options["external_input_files"] = input_file_list
         # Define standard error file by default to avoid error code return
         self.stderr = pth.join(target_directory, STDERR_FILE_NAME)
-        # Copy resource in working (target) directory
-        # noinspection PyTypeChecker
-        copy_resource_folder(openvsp3201, target_directory)
+        # Copy airfoils in working (target) directory
         if self.options["airfoil_folder_path"] is None:
             # noinspection PyTypeChecker
             copy_resource(airfoil_folder, self.options["wing_airfoil_file"], target_directory)
@@ -933,7 +1043,7 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         batch_file = open(self.options["command"][0], "w+")
         batch_file.write("@echo off\n")
         command = (
-            pth.join(target_directory, VSPSCRIPT_EXE_NAME)
+            pth.join(exe_directory, VSPSCRIPT_EXE_NAME)
             + " -script "
             + pth.join(target_directory, INPUT_AIRCRAFT_SCRIPT)
             + " >nul 2>nul\n"
@@ -1023,7 +1133,7 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         batch_file = open(self.options["command"][0], "w+")
         batch_file.write("@echo off\n")
         command = (
-            pth.join(target_directory, VSPAERO_EXE_NAME)
+            pth.join(exe_directory, VSPAERO_EXE_NAME)
             + " "
             + input_file_list[1].replace(".vspaero", "")
             + " >nul 2>nul\n"
@@ -1049,9 +1159,9 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
             parser.mark_anchor("X_cg")
             parser.transfer_var(float(fa_length), 0, 3)
             parser.mark_anchor("Mach")
-            parser.transfer_var(float(mach), 0, 3)
+            parser.transfer_var(_sweep_values(mach_list), 0, 3)
             parser.mark_anchor("AOA")
-            parser.transfer_var(float(aoa_angle), 0, 3)
+            parser.transfer_var(_sweep_values(aoa_list), 0, 3)
             parser.mark_anchor("Vinf")
             parser.transfer_var(float(v_inf), 0, 3)
             parser.mark_anchor("Rho")
@@ -1068,195 +1178,45 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         # STEP 8/XX - READ FILES, RETURN RESULTS (AND CLEAR TEMPORARY WORKDIR) #####################
         ############################################################################################
 
-        # Open .lod file and extract data
-        wing_y_vect = []
-        wing_cl_vect = []
-        wing_cd_vect = []
-        wing_cm_vect = []
-        htp_y_vect = []
-        htp_cl_vect = []
-        htp_cd_vect = []
-        htp_cm_vect = []
-        with open(output_file_list[0], "r") as lf:
-            data = lf.readlines()
-            for i in range(len(data)):
-                line = data[i].split()
-                line.append("**")
-                if line[0] == "1":
-                    wing_y_vect.append(float(line[2]))
-                    wing_cl_vect.append(float(line[5]))
-                    wing_cd_vect.append(float(line[6]))
-                    wing_cm_vect.append(float(line[12]))
-                elif line[0] == "3":
-                    htp_y_vect.append(float(line[2]))
-                    htp_cl_vect.append(float(line[5]))
-                    htp_cd_vect.append(float(line[6]))
-                    htp_cm_vect.append(float(line[12]))
-                if line[0] == "Comp":
-                    cl_wing = float(data[i + 1].split()[5]) + float(
-                        data[i + 2].split()[5]
-                    )  # sum CL left/right
-                    cdi_wing = float(data[i + 1].split()[6]) + float(
-                        data[i + 2].split()[6]
-                    )  # sum CDi left/right
-                    cm_wing = float(data[i + 1].split()[12]) + float(
-                        data[i + 2].split()[12]
-                    )  # sum CM left/right
-                    cl_htp = float(data[i + 3].split()[5]) + float(
-                        data[i + 4].split()[5]
-                    )  # sum CL left/right
-                    cdi_htp = float(data[i + 3].split()[6]) + float(
-                        data[i + 4].split()[6]
-                    )  # sum CDi left/right
-                    cm_htp = float(data[i + 3].split()[12]) + float(
-                        data[i + 4].split()[12]
-                    )  # sum CM left/right
-                    break
-        # Open .polar file and extract data
-        with open(output_file_list[1], "r") as lf:
-            data = lf.readlines()
-            aircraft_cl = float(data[1].split()[4])
-            aircraft_cd0 = float(data[1].split()[5])
-            aircraft_cdi = float(data[1].split()[6])
-            aircraft_e = float(data[1].split()[10])
-        # Delete temporary directory
-        if not (self.options["openvsp_exe_path"]):
-            # noinspection PyUnboundLocalVariable
-            tmp_directory.cleanup()
+        # Open .lod and .polar files and extract data of each case
+        lod_cases = _read_lod_file(output_file_list[0])
+        polar_header, polar_rows = _read_polar_file(output_file_list[1])
+        # Delete scratch folder
+        workspace.release_run_directory(target_directory)
         # Return values
-        wing = {
-            "y_vector": wing_y_vect,
-            "cl_vector": wing_cl_vect,
-            "cd_vector": wing_cd_vect,
-            "cm_vector": wing_cm_vect,
-            "cl": cl_wing,
-            "cdi": cdi_wing,
-            "cm": cm_wing,
-        }
-        htp = {
-            "y_vector": htp_y_vect,
-            "cl_vector": htp_cl_vect,
-            "cd_vector": htp_cd_vect,
-            "cm_vector": htp_cm_vect,
-            "cl": cl_htp,
-            "cdi": cdi_htp,
-            "cm": cm_htp,
-        }
-        aircraft = {
-            "cl": aircraft_cl,
-            "cd0": aircraft_cd0,
-            "cdi": aircraft_cdi,
-            "coeff_e": aircraft_e,
-        }
-        return wing, htp, aircraft
-
-    @staticmethod
-    def search_results(result_folder_path, geometry_set):
-        """Search the results folder to see if the geometry has already been calculated."""
-        if os.path.exists(result_folder_path):
-            geometry_set_labels = [
-                "sweep25_wing",
-                "taper_ratio_wing",
-                "aspect_ratio_wing",
-                "dihedral_angle_wing",
-                "twist_angle_wing",
-                "sweep25_htp",
-                "taper_ratio_htp",
-                "aspect_ratio_htp",
-                "mach",
-                "area_ratio",
-            ]
-            # If some results already stored search for corresponding geometry
-            if pth.exists(pth.join(result_folder_path, "geometry_0.csv")):
-                idx = 0
-                while pth.exists(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")):
-                    if pth.exists(pth.join(result_folder_path, "openvsp_" + str(idx) + ".csv")):
-                        data = pd.read_csv(
-                            pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")
-                        )
-                        values = data.to_numpy()[:, 1].tolist()
-                        labels = data.to_numpy()[:, 0].tolist()
-                        data = pd.DataFrame(values, index=labels)
-                        # noinspection PyBroadException
-                        try:
-                            if (
-                                np.size(data.loc[geometry_set_labels[0:-1], 0].to_numpy())
-                                == len(geometry_set_labels) - 1
-                            ):
-                                saved_set = np.around(
-                                    data.loc[geometry_set_labels[0:-1], 0].to_numpy(), decimals=6
-                                )
-                                if (
-                                    np.sum(saved_set == geometry_set[0:-1])
-                                    == len(geometry_set_labels) - 1
-                                ):
-                                    result_file_path = pth.join(
-                                        result_folder_path, "openvsp_" + str(idx) + ".csv"
-                                    )
-                                    saved_area_ratio = data.loc["area_ratio", 0]
-                                    return result_file_path, saved_area_ratio
-                        except Exception:
-                            break
-                    idx += 1
-
-        return None, 1.0
-
-    @staticmethod
-    def save_geometry(result_folder_path, geometry_set):
-        """Save geometry if not already computed by finding first available index."""
-        geometry_set_labels = [
-            "sweep25_wing",
-            "taper_ratio_wing",
-            "aspect_ratio_wing",
-            "dihedral_angle_wing",
-            "twist_angle_wing",
-            "sweep25_htp",
-            "taper_ratio_htp",
-            "aspect_ratio_htp",
-            "mach",
-            "area_ratio",
-        ]
-        data = pd.DataFrame(geometry_set, index=geometry_set_labels)
-        idx = 0
-        while pth.exists(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")):
-            idx += 1
-        data.to_csv(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv"))
-        result_file_path = pth.join(result_folder_path, "openvsp_" + str(idx) + ".csv")
-
-        return result_file_path
-
-    @staticmethod
-    def save_results(result_file_path, results):
-        """Reads saved results."""
-        labels = [
-            "cl_0_wing",
-            "cl_X_wing",
-            "cl_alpha_wing",
-            "cm_0_wing",
-            "y_vector_wing",
-            "cl_vector_wing",
-            "chord_vector_wing",
-            "coeff_k_wing",
-            "cl_0_htp",
-            "cl_X_htp",
-            "cl_alpha_htp",
-            "cl_alpha_htp_isolated",
-            "y_vector_htp",
-            "cl_vector_htp",
-            "coeff_k_htp",
-            "saved_ref_area",
-        ]
-        data = pd.DataFrame(results, index=labels)
-        data.to_csv(result_file_path)
-
-    @staticmethod
-    def read_results(result_file_path):
-
-        data = pd.read_csv(result_file_path)
-        values = data.to_numpy()[:, 1].tolist()
-        labels = data.to_numpy()[:, 0].tolist()
-
-        return pd.DataFrame(values, index=labels)
+        aircraft_list = []
+        for case_idx in _sweep_case_indices(polar_header, polar_rows, mach_list, aoa_list):
+            strips, components = lod_cases[case_idx]
+            wing_strips = strips.get("1", [])
+            htp_strips = strips.get("3", [])
+            wing = {
+                "y_vector": [float(line[2]) for line in wing_strips],
+                "cl_vector": [float(line[5]) for line in wing_strips],
+                "cd_vector": [float(line[6]) for line in wing_strips],
+                "cm_vector": [float(line[12]) for line in wing_strips],
+                # sum CL/CDi/CM left/right
+                "cl": float(components[0][5]) + float(components[1][5]),
+                "cdi": float(components[0][6]) + float(components[1][6]),
+                "cm": float(components[0][12]) + float(components[1][12]),
+            }
+            htp = {
+                "y_vector": [float(line[2]) for line in htp_strips],
+                "cl_vector": [float(line[5]) for line in htp_strips],
+                "cd_vector": [float(line[6]) for line in htp_strips],
+                "cm_vector": [float(line[12]) for line in htp_strips],
+                # sum CL/CDi/CM left/right
+                "cl": float(components[2][5]) + float(components[3][5]),
+                "cdi": float(components[2][6]) + float(components[3][6]),
+                "cm": float(components[2][12]) + float(components[3][12]),
+            }
+            aircraft = {
+                "cl": float(polar_rows[case_idx][4]),
+                "cd0": float(polar_rows[case_idx][5]),
+                "cdi": float(polar_rows[case_idx][6]),
+                "coeff_e": float(polar_rows[case_idx][10]),
+            }
+            aircraft_list.append((wing, htp, aircraft))
+        return aircraft_list
 
 
 class OPENVSPSimpleGeometryDP(OPENVSPSimpleGeometry):
@@ -1435,12 +1395,10 @@ class OPENVSPSimpleGeometryDP(OPENVSPSimpleGeometry):
         ############################################################################################
 
         # If a folder path is specified for openvsp .exe, it becomes working directory (target),
-        # if not temporary folder is created
-        if self.options["openvsp_exe_path"]:
-            target_directory = pth.abspath(self.options["openvsp_exe_path"])
-        else:
-            tmp_directory = _create_tmp_directory()
-            target_directory = tmp_directory.name
+        # if not a scratch folder is created next to the OpenVSP installation of the process
+        workspace = OpenVSPWorkspace.get_workspace(self.options["openvsp_exe_path"])
+        target_directory = workspace.create_run_directory()
+        exe_directory = workspace.install_directory
         # Define the list of necessary input files: geometry script and foil file for both wing/HTP
         input_file_list = [
             pth.join(target_directory, INPUT_WING_ROTOR_SCRIPT),
@@ -1449,9 +1407,7 @@ class OPENVSPSimpleGeometryDP(OPENVSPSimpleGeometry):
         self.options["external_input_files"] = input_file_list
         # Define standard error file by default to avoid error code return
         self.stderr = pth.join(target_directory, STDERR_FILE_NAME)
-        # Copy resource in working (target) directory
-        # noinspection PyTypeChecker
-        copy_resource_folder(openvsp3201, target_directory)
+        # Copy airfoils in working (target) directory
         # noinspection PyTypeChecker
         if self.options["airfoil_folder_path"] is None:
             copy_resource(airfoil_folder, self.options["wing_airfoil_file"], target_directory)
@@ -1466,7 +1422,7 @@ class OPENVSPSimpleGeometryDP(OPENVSPSimpleGeometry):
         batch_file = open(self.options["command"][0], "w+")
         batch_file.write("@echo off\n")
         command = (
-            pth.join(target_directory, VSPSCRIPT_EXE_NAME)
+            pth.join(exe_directory, VSPSCRIPT_EXE_NAME)
             + " -script "
             + pth.join(target_directory, INPUT_WING_ROTOR_SCRIPT)
             + " >nul 2>nul\n"
@@ -1539,7 +1495,7 @@ class OPENVSPSimpleGeometryDP(OPENVSPSimpleGeometry):
         batch_file = open(self.options["command"][0], "w+")
         batch_file.write("@echo off\n")
         command = (
-            pth.join(target_directory, VSPAERO_EXE_NAME)
+            pth.join(exe_directory, VSPAERO_EXE_NAME)
             + " "
             + input_file_list[1].replace(".vspaero", "")
             + " >nul 2>nul\n"
@@ -1646,10 +1602,8 @@ class OPENVSPSimpleGeometryDP(OPENVSPSimpleGeometry):
         with open(output_file_list[1], "r") as lf:
             data = lf.readlines()
             wing_e = float(data[1].split()[10])
-        # Delete temporary directory
-        if not (self.options["openvsp_exe_path"]):
-            # noinspection PyUnboundLocalVariable
-            tmp_directory.cleanup()
+        # Delete scratch folder
+        workspace.release_run_directory(target_directory)
         # Return values
         wing_rotor = {
             "y_vector": wing_y_vect,
@@ -1666,6 +1620,91 @@ class OPENVSPSimpleGeometryDP(OPENVSPSimpleGeometry):
         return wing_rotor
 
 
+def _compute_cl_alpha_aircraft(component_class, options, inputs, altitude, mach, aoa_angle):
+    """Computes cl_alpha_aircraft with a new component, used for parallel Mach computations."""
+    component = component_class(**options)
+
+    return component.compute_cl_alpha_aircraft(inputs, None, altitude, mach, aoa_angle)
+
+
+def _compute_case(component_class, options, inputs, method_name, altitude, mach, aoa_angle):
+    """Runs an OpenVSP case with a new component, used for parallel case computations."""
+    component = component_class(**options)
+
+    return getattr(component, method_name)(inputs, None, altitude, mach, aoa_angle)
+
+
+def _sweep_values(values) -> str:
+    """Writes the values of a vspaero sweep, separated by commas."""
+    return ",".join("%f" % float(value) for value in values)
+
+
+def _read_lod_file(lod_file_path: str) -> list:
+    """
+    Reads the spanwise and component loads of each case of a .lod file.
+
+    :param lod_file_path: path of the .lod file
+    :return: list of (strips, components) for each case, strips being a dictionary with the split
+    lines of each wing number and components the split lines of the component loads
+    """
+    with open(lod_file_path, "r") as file_stream:
+        data = file_stream.readlines()
+
+    lod_cases = []
+    strips = {}
+    line_idx = 0
+    while line_idx < len(data):
+        line = data[line_idx].split()
+        line_idx += 1
+        if not line:
+            continue
+        if line[0] == "Comp":
+            # Component lines have the same columns as their header and end the case
+            components = []
+            while line_idx < len(data) and len(data[line_idx].split()) == len(line):
+                components.append(data[line_idx].split())
+                line_idx += 1
+            lod_cases.append((strips, components))
+            strips = {}
+        elif line[0].isdigit():
+            strips.setdefault(line[0], []).append(line)
+
+    return lod_cases
+
+
+def _read_polar_file(polar_file_path: str) -> tuple:
+    """Reads the split header and the split lines of each case of a .polar file."""
+    with open(polar_file_path, "r") as file_stream:
+        data = file_stream.readlines()
+    header = data[0].split()
+
+    return header, [line.split() for line in data[1:] if line.split() not in ([], header)]
+
+
+def _sweep_case_indices(polar_header: list, polar_rows: list, mach_list, aoa_list) -> list:
+    """
+    Finds the case of each point of a vspaero sweep from the Mach and AoA columns of the .polar
+    file, so that results do not depend on the order in which vspaero runs the cases.
+
+    :return: list of the case indices, ordered by mach number, then angle of attack
+    """
+    mach_column = polar_header.index("Mach") if "Mach" in polar_header else 1
+    aoa_column = polar_header.index("AoA") if "AoA" in polar_header else 2
+    polar_points = np.array(
+        [[float(row[mach_column]), float(row[aoa_column])] for row in polar_rows]
+    )
+
+    return [
+        int(
+            np.argmin(
+                np.abs(polar_points[:, 0] - float(mach)) + np.abs(polar_points[:, 1] - float(aoa))
+            )
+        )
+        for mach in mach_list
+        for aoa in aoa_list
+    ]
+
+
 def generate_wing_rotor_file(engine_count: int):
 
     """
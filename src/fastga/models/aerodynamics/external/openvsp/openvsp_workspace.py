@@ -0,0 +1,132 @@
+"""Working directories for the OpenVSP computations."""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import multiprocessing.util
+import os
+import os.path as pth
+import shutil
+import tempfile
+import threading
+from typing import Optional
+
+# noinspection PyProtectedMember
+from fastoad._utils.resource_management.copy import copy_resource_folder
+
+# noinspection PyProtectedMember
+from fastga.command.api import _create_tmp_directory
+from . import openvsp3201
+
+RUN_DIRECTORY_PREFIX = "run_"
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class OpenVSPWorkspace:
+    """
+    OpenVSP installation shared by the computations of the process. The executables are installed
+    once, when the workspace is first used, and each computation gets its own scratch folder for
+    its scripts, airfoils and results. Since executables are called with absolute paths and write
+    their results next to their input files, they do not need to be in the scratch folder.
+
+    If a folder is specified for the OpenVSP executables, they are installed in it if needed and it
+    is used as working directory by all the computations, as before, so that the files of the last
+    computation can be checked.
+    """
+
+    _workspaces = {}
+    _workspaces_lock = threading.Lock()
+
+    def __init__(self, openvsp_exe_path: Optional[str] = None):
+        """
+        :param openvsp_exe_path: folder of the OpenVSP executables, defaults to a temporary folder
+        in which the embedded ones are installed.
+        """
+        self.openvsp_exe_path = pth.abspath(openvsp_exe_path) if openvsp_exe_path else None
+        self.install_count = 0
+
+        self._lock = threading.Lock()
+        self._tmp_directory = None
+        self._install_directory = None
+
+    @classmethod
+    def get_workspace(cls, openvsp_exe_path: Optional[str] = None) -> "OpenVSPWorkspace":
+        """Returns the workspace of the process for the executable folder, created if needed."""
+        key = pth.abspath(openvsp_exe_path) if openvsp_exe_path else None
+        with cls._workspaces_lock:
+            # Workspaces inherited from a parent process are not used, their temporary folder
+            # belonging to the parent
+            if key not in cls._workspaces or cls._workspaces[key][0] != os.getpid():
+                cls._workspaces[key] = (os.getpid(), cls(openvsp_exe_path))
+            return cls._workspaces[key][1]
+
+    @classmethod
+    def clear_workspaces(cls):
+        """Removes the temporary installations of the process."""
+        with cls._workspaces_lock:
+            for pid, workspace in cls._workspaces.values():
+                if pid == os.getpid():
+                    workspace.cleanup()
+            cls._workspaces.clear()
+
+    @property
+    def install_directory(self) -> str:
+        """Folder of the OpenVSP executables, installed at first call."""
+        with self._lock:
+            if self._install_directory is None or not pth.isdir(self._install_directory):
+                if self.openvsp_exe_path:
+                    install_directory = self.openvsp_exe_path
+                else:
+                    self._tmp_directory = _create_tmp_directory()
+                    install_directory = self._tmp_directory.name
+                    # Also run when a worker process of a pool ends, unlike the finalizer of the
+                    # temporary directory
+                    multiprocessing.util.Finalize(None, self.cleanup, exitpriority=0)
+                # noinspection PyTypeChecker
+                copy_resource_folder(openvsp3201, install_directory)
+                self.install_count += 1
+                self._install_directory = install_directory
+            return self._install_directory
+
+    def create_run_directory(self) -> str:
+        """Returns an empty folder for the files of a computation."""
+        install_directory = self.install_directory
+        if self.openvsp_exe_path:
+            return install_directory
+        return tempfile.mkdtemp(prefix=RUN_DIRECTORY_PREFIX, dir=install_directory)
+
+    def release_run_directory(self, run_directory: str):
+        """Removes the folder of a computation, unless it is the specified executable folder."""
+        if self.openvsp_exe_path:
+            return
+        # noinspection PyBroadException
+        try:
+            shutil.rmtree(run_directory)
+        except Exception:
+            _LOGGER.info("Error while trying to erase %s temporary directory!", run_directory)
+
+    def cleanup(self):
+        """Removes the temporary installation, a new one being done at next use."""
+        with self._lock:
+            if self._tmp_directory is not None:
+                # noinspection PyBroadException
+                try:
+                    self._tmp_directory.cleanup()
+                except Exception:
+                    _LOGGER.info(
+                        "Error while trying to erase %s temporary directory!",
+                        self._tmp_directory.name,
+                    )
+                self._tmp_directory = None
+            self._install_directory = None
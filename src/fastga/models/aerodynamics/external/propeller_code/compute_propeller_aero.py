@@ -13,6 +13,7 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import logging
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 
@@ -21,6 +22,7 @@ import openmdao.api as om
 import fastoad.api as oad
 from fastoad.module_management.constants import ModelDomain
 
+from fastga.models.aerodynamics.external.xfoil.xfoil_batch import XfoilPolarBatch
 from fastga.models.aerodynamics.external.xfoil.xfoil_polar import XfoilPolar
 
 from .propeller_core import PropellerCoreModule
@@ -29,6 +31,8 @@ _LOGGER = logging.getLogger(__name__)
 
 THRUST_PTS_NB = 30
 SPEED_PTS_NB = 10
+PITCH_PTS_NB = 100
+PITCH_BLOCK_PTS_NB = 10
 
 
 @oad.RegisterOpenMDAOSystem("fastga.aerodynamics.propeller", domain=ModelDomain.AERODYNAMICS)
@@ -49,23 +53,66 @@ class ComputePropellerPerformance(om.Group):
             types=list,
         )
         self.options.declare("elements_number", default=20, types=int)
+        self.options.declare(
+            "xfoil_workers",
+            default=1,
+            types=int,
+            lower=1,
+            desc="Number of XFOIL runs done at the same time for the polars of the sections, "
+            "1 meaning they are computed one after the other",
+        )
+        self.options.declare(
+            "result_folder_path",
+            default="",
+            types=str,
+            desc="Folder of the database in which the computed propeller maps are saved, so that "
+            "they are read instead of being computed again for the same inputs, no database if "
+            "empty",
+        )
+        self.options.declare(
+            "table_workers",
+            default=1,
+            types=int,
+            lower=1,
+            desc="Number of processes computing the cells of the propeller tables, i.e. each "
+            "flight speed at sea level and cruise altitude, at the same time, 1 meaning they are "
+            "computed one after the other",
+        )
 
     def setup(self):
         ivc = om.IndepVarComp()
         ivc.add_output("data:aerodynamics:propeller:mach", val=0.0)
         ivc.add_output("data:aerodynamics:propeller:reynolds", val=1e6)
         self.add_subsystem("propeller_efficiency_aero_conditions", ivc, promotes=["*"])
-        for profile in self.options["sections_profile_name_list"]:
+        polar_options_list = [
+            dict(
+                airfoil_folder_path=self.options["airfoil_folder_path"],
+                airfoil_file=profile + ".af",
+                alpha_end=30.0,
+                activate_negative_angle=True,
+            )
+            for profile in self.options["sections_profile_name_list"]
+        ]
+        if self.options["xfoil_workers"] > 1:
             self.add_subsystem(
-                profile + "_polar_efficiency",
-                XfoilPolar(
-                    airfoil_folder_path=self.options["airfoil_folder_path"],
-                    airfoil_file=profile + ".af",
-                    alpha_end=30.0,
-                    activate_negative_angle=True,
+                "sections_polar_efficiency",
+                XfoilPolarBatch(
+                    polar_options_list=polar_options_list,
+                    max_workers=self.options["xfoil_workers"],
                 ),
                 promotes=[],
             )
+            self.connect("data:aerodynamics:propeller:mach", "sections_polar_efficiency.xfoil:mach")
+            self.connect(
+                "data:aerodynamics:propeller:reynolds",
+                "sections_polar_efficiency.xfoil:reynolds",
+            )
+        for profile, polar_options in zip(
+            self.options["sections_profile_name_list"], polar_options_list
+        ):
+            self.add_subsystem(
+                profile + "_polar_efficiency", XfoilPolar(**polar_options), promotes=[]
+            )
             self.connect(
                 "data:aerodynamics:propeller:mach",
                 profile + "_polar_efficiency.xfoil:mach",
@@ -80,6 +127,8 @@ class ComputePropellerPerformance(om.Group):
                 sections_profile_position_list=self.options["sections_profile_position_list"],
                 sections_profile_name_list=self.options["sections_profile_name_list"],
                 elements_number=self.options["elements_number"],
+                result_folder_path=self.options["result_folder_path"],
+                table_workers=self.options["table_workers"],
             ),
             promotes_inputs=["data:*"],
             promotes_outputs=["*"],
@@ -100,6 +149,19 @@ class ComputePropellerPerformance(om.Group):
 
 
 class _ComputePropellerPerformance(PropellerCoreModule):
+    def initialize(self):
+
+        super().initialize()
+        self.options.declare(
+            "table_workers",
+            default=1,
+            types=int,
+            lower=1,
+            desc="Number of processes computing the cells of the propeller tables, i.e. each "
+            "flight speed at sea level and cruise altitude, at the same time, 1 meaning they are "
+            "computed one after the other",
+        )
+
     def setup(self):
 
         super().setup()
@@ -139,18 +201,27 @@ class _ComputePropellerPerformance(PropellerCoreModule):
 
         _LOGGER.debug("Entering propeller computation")
 
+        # Maps computed for the same inputs are read instead
+        if self.read_saved_map(inputs, outputs):
+            return
+
         # Define init values
         omega = inputs["data:geometry:propeller:average_rpm"]
         v_min = 5.0
         v_max = inputs["data:TLAR:v_cruise"] * 1.2
         speed_interp = np.linspace(v_min, v_max, SPEED_PTS_NB)
 
-        # Construct table for init of climb
-        altitude = 0.0
-        thrust_vect, _, eta_vect = self.construct_table(inputs, speed_interp, altitude, omega)
+        # Construct tables for init of climb and for cruise, theta_vect can be obtained with
+        # construct table, it is the second output, not used as of now
+        altitude_list = [0.0, inputs["data:mission:sizing:main_route:cruise:altitude"]]
+        (thrust_vect_sl, _, eta_vect_sl), (thrust_vect, _, eta_vect) = self.construct_tables(
+            inputs, speed_interp, altitude_list, omega
+        )
 
         # Reformat table
-        thrust_limit, thrust_interp, efficiency_interp = self.reformat_table(thrust_vect, eta_vect)
+        thrust_limit, thrust_interp, efficiency_interp = self.reformat_table(
+            thrust_vect_sl, eta_vect_sl
+        )
 
         # Save results
         outputs["data:aerodynamics:propeller:sea_level:efficiency"] = efficiency_interp
@@ -158,11 +229,6 @@ class _ComputePropellerPerformance(PropellerCoreModule):
         outputs["data:aerodynamics:propeller:sea_level:thrust_limit"] = thrust_limit
         outputs["data:aerodynamics:propeller:sea_level:speed"] = speed_interp
 
-        # construct table for cruise
-        altitude = inputs["data:mission:sizing:main_route:cruise:altitude"]
-        # theta_vect can be obtained with construct table, it is the second input, not used as of
-        # now
-        thrust_vect, _, eta_vect = self.construct_table(inputs, speed_interp, altitude, omega)
         # Reformat table
         thrust_limit, thrust_interp, efficiency_interp = self.reformat_table(thrust_vect, eta_vect)
 
@@ -177,6 +243,8 @@ class _ComputePropellerPerformance(PropellerCoreModule):
             "data:mission:sizing:main_route:cruise:altitude"
         ]
 
+        self.save_map(inputs, outputs)
+
     def construct_table(self, inputs, speed_interp, altitude, omega):
         """
         Computes the propeller characteristics in the given flight conditions for various
@@ -188,9 +256,101 @@ class _ComputePropellerPerformance(PropellerCoreModule):
         :param altitude: the altitude for the propeller computation, in m.
         :param omega: the propeller rotation speed, in rpm.
         """
-        thrust_vect = []
-        theta_vect = []
-        eta_vect = []
+
+        return self.construct_tables(inputs, speed_interp, [altitude], omega)[0]
+
+    def construct_tables(self, inputs, speed_interp, altitude_list, omega):
+        """
+        Computes the tables of construct_table at several altitudes. The cells of the tables,
+        i.e. the flight speeds at each altitude, are independent and are computed in parallel
+        processes if allowed by the table_workers option.
+
+        :param inputs: the inputs containing the propeller geometry.
+        :param speed_interp: the array containing the flight speed at which we compute the
+        propeller thrust and efficiency, in m/s.
+        :param altitude_list: the altitudes for the propeller computation, in m.
+        :param omega: the propeller rotation speed, in rpm.
+        :return: list of the thrust, theta and efficiency tables of construct_table at each
+        altitude.
+        """
+
+        radius, alpha_list, cl_list, cd_list = self.compute_elements_polar(inputs)
+        cells = [(altitude, v_inf) for altitude in altitude_list for v_inf in speed_interp]
+
+        workers = min(self.options["table_workers"], len(cells))
+        if workers > 1:
+            # Each process works on its own copy of the component
+            component_options = dict(self.options.items())
+            component_inputs = {name: np.copy(inputs[name]) for name in inputs}
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        _compute_speed_performance,
+                        type(self),
+                        component_options,
+                        component_inputs,
+                        v_inf,
+                        altitude,
+                        omega,
+                        radius,
+                        alpha_list,
+                        cl_list,
+                        cd_list,
+                    )
+                    for altitude, v_inf in cells
+                ]
+                cells_performance = []
+                for future in futures:
+                    performance, solve_counts = future.result()
+                    cells_performance.append(performance)
+                    for name, count in solve_counts.items():
+                        self.solve_counts[name] += count
+        else:
+            # Each flight speed starts from the induced speeds of the previous one at same altitude
+            cells_performance = []
+            speed_vect = None
+            for idx, (altitude, v_inf) in enumerate(cells):
+                if idx % len(speed_interp) == 0:
+                    speed_vect = None
+                performance = self.compute_speed_performance(
+                    inputs,
+                    v_inf,
+                    altitude,
+                    omega,
+                    radius,
+                    alpha_list,
+                    cl_list,
+                    cd_list,
+                    initial_speed_vect=speed_vect,
+                )
+                speed_vect = performance[3]
+                cells_performance.append(performance)
+
+        # Reassemble the tables of each altitude, cells being ordered by altitude then speed
+        tables = []
+        for idx, _ in enumerate(altitude_list):
+            altitude_performance = cells_performance[
+                idx * len(speed_interp) : (idx + 1) * len(speed_interp)
+            ]
+            tables.append(
+                (
+                    [performance[0] for performance in altitude_performance],
+                    [performance[1] for performance in altitude_performance],
+                    [performance[2] for performance in altitude_performance],
+                )
+            )
+
+        return tables
+
+    def compute_elements_polar(self, inputs):
+        """
+        Computes the radius of the blade elements and their polars, interpolated on the angles
+        of attack of all the section profiles.
+
+        :param inputs: the inputs containing the propeller geometry.
+        :return: the radius of the elements in m and their angle of attack, lift and drag
+        coefficient lists, with one row per element.
+        """
 
         radius_min = inputs["data:geometry:propeller:hub_diameter"] / 2.0
         radius_max = inputs["data:geometry:propeller:diameter"] / 2.0
@@ -229,87 +389,119 @@ class _ComputePropellerPerformance(PropellerCoreModule):
             cl_list[idx, :] = np.interp(alpha_interp, alpha_element, cl_element)
             cd_list[idx, :] = np.interp(alpha_interp, alpha_element, cd_element)
 
-        for v_inf in speed_interp:
-            self.compute_extreme_pitch(inputs, v_inf)
-            theta_interp = np.linspace(self.theta_min, self.theta_max, 100)
-            local_thrust_vect = []
-            local_theta_vect = []
-            local_eta_vect = []
-            for theta_75 in theta_interp:
-                thrust, eta, _ = self.compute_pitch_performance(
-                    inputs, theta_75, v_inf, altitude, omega, radius, alpha_list, cl_list, cd_list
-                )
-                local_thrust_vect.append(thrust)
-                local_theta_vect.append(theta_75)
-                local_eta_vect.append(eta)
-
-            # Find first the "monotone" zone (10 points of increase)
-            idx_in_zone = 0
-            thrust_difference = np.array(local_thrust_vect[1:]) - np.array(local_thrust_vect[0:-1])
-            for idx in range(5, len(thrust_difference)):
-                if np.sum(np.array(thrust_difference[idx - 5 : idx + 5]) > 0.0) == len(
-                    thrust_difference[idx - 5 : idx + 5]
-                ):
-                    idx_in_zone = idx + 1
-                    break
-            # Erase end of the curve if thrust decreases
-            # Testing a non empty sequence with an if will return True if it is not empty see
-            # PEP8 recommended method
-            if list(np.where(thrust_difference[idx_in_zone:] < 0.0)[0]):
-                idx_end = np.min(np.where(thrust_difference[idx_in_zone:] < 0.0)) + idx_in_zone
-                local_thrust_vect = local_thrust_vect[0 : idx_end + 1]
-                local_theta_vect = local_theta_vect[0 : idx_end + 1]
-                local_eta_vect = local_eta_vect[0 : idx_end + 1]
-            # Erase start of the curve if thrust is negative or decreases
-            idx_start = 0
-            thrust_difference = np.array(local_thrust_vect[1:]) - np.array(local_thrust_vect[0:-1])
-            # Testing a non empty sequence with an if will return True if it is not empty see
-            # PEP8 recommended method
-            if list(np.where(np.array(local_thrust_vect) < 0.0)[0]):
-                idx_start = int(np.max(np.where(np.array(local_thrust_vect) < 0.0)))
-            # Testing a non empty sequence with an if will return True if it is not empty see
-            # PEP8 recommended method
-            if list(np.where(thrust_difference < 0.0)[0]):
-                idx_start = max(idx_start, int(np.max(np.where(thrust_difference < 0.0)) + 1))
-            local_thrust_vect = local_thrust_vect[idx_start:]
-            local_theta_vect = local_theta_vect[idx_start:]
-            local_eta_vect = local_eta_vect[idx_start:]
-            # Erase remaining points with negative or >1.0 efficiency
-            idx_drop = np.where(
-                (np.array(local_eta_vect) <= 0.0) + (np.array(local_eta_vect) > 1.0)
-            )[0].tolist()
-            for idx in sorted(idx_drop, reverse=True):
-                del local_thrust_vect[idx]
-                del local_theta_vect[idx]
-                del local_eta_vect[idx]
-
-            # Save vectors
-            thrust_vect.append(local_thrust_vect)
-            theta_vect.append(local_theta_vect)
-            eta_vect.append(local_eta_vect)
-
-            # # Plot graphs
-            # thrust_vect.append(local_thrust_vect)
-            # theta_vect.append(local_theta_vect)
-            # eta_vect.append(local_eta_vect)
-            # plt.figure(1)
-            # plt.subplot(311)
-            # plt.xlabel("0.75R pitch angle [°]")
-            # plt.ylabel("Thrust [N]")
-            # plt.plot(local_theta_vect, local_thrust_vect)
-            # plt.subplot(312)
-            # plt.xlabel("0.75R pitch angle [°]")
-            # plt.ylabel("Efficiency [-]")
-            # plt.plot(local_theta_vect, local_eta_vect)
-            # plt.subplot(313)
-            # plt.xlabel("0.75R pitch angle [°]")
-            # plt.ylabel("Torque [-]")
-            # plt.plot(local_theta_vect,
-            #          v_inf * np.array(local_thrust_vect)
-            #          /
-            #          (np.array(local_eta_vect) * omega * np.pi / 30.0))
-
-        return thrust_vect, theta_vect, eta_vect
+        return radius, alpha_list, cl_list, cd_list
+
+    def compute_speed_performance(
+        self,
+        inputs,
+        v_inf,
+        altitude,
+        omega,
+        radius,
+        alpha_list,
+        cl_list,
+        cd_list,
+        initial_speed_vect=None,
+    ):
+        """
+        Computes the propeller characteristics at a flight speed for various pitches, keeping only
+        the pitches of increasing thrust and valid efficiency.
+
+        Pitches are computed by blocks of PITCH_BLOCK_PTS_NB, each block starting from the induced
+        speeds of the last pitch of the previous one, and the sweep is stopped once the thrust
+        decreases after the "monotone" zone since the next pitches would be erased.
+
+        :param inputs: the inputs containing the propeller geometry.
+        :param v_inf: the flight speed, in m/s.
+        :param altitude: the altitude for the propeller computation, in m.
+        :param omega: the propeller rotation speed, in rpm.
+        :param radius: the radius of the blade elements, in m.
+        :param alpha_list: the angle of attack list of the element polars, in deg.
+        :param cl_list: the lift coefficient list of the element polars.
+        :param cd_list: the drag coefficient list of the element polars.
+        :param initial_speed_vect: the induced speeds of the first block of pitches of a previous
+        flight speed, used as initial guess, in m/s.
+        :return: the thrust, theta and efficiency vectors and the induced speeds of the first
+        block of pitches, in m/s.
+        """
+
+        self.compute_extreme_pitch(inputs, v_inf)
+        theta_interp = np.linspace(self.theta_min, self.theta_max, PITCH_PTS_NB)
+        local_thrust_vect = []
+        local_eta_vect = []
+        first_speed_vect = None
+        speed_vect = initial_speed_vect
+        for idx_block in range(0, PITCH_PTS_NB, PITCH_BLOCK_PTS_NB):
+            thrust, eta, _, speed_vect = self.solve_pitch_performance(
+                inputs,
+                theta_interp[idx_block : idx_block + PITCH_BLOCK_PTS_NB],
+                v_inf,
+                altitude,
+                omega,
+                radius,
+                alpha_list,
+                cl_list,
+                cd_list,
+                initial_speed_vect=speed_vect,
+            )
+            local_thrust_vect.extend(thrust)
+            local_eta_vect.extend(eta)
+            if first_speed_vect is None:
+                first_speed_vect = speed_vect
+            speed_vect = speed_vect[:, -1:, :]
+            if _thrust_decrease_index(local_thrust_vect, complete=False) is not None:
+                self.solve_counts["skipped_pitches"] += PITCH_PTS_NB - len(local_thrust_vect)
+                break
+        local_theta_vect = list(theta_interp[0 : len(local_thrust_vect)])
+
+        # Erase end of the curve if thrust decreases after the "monotone" zone
+        idx_end = _thrust_decrease_index(local_thrust_vect)
+        if idx_end is not None:
+            local_thrust_vect = local_thrust_vect[0 : idx_end + 1]
+            local_theta_vect = local_theta_vect[0 : idx_end + 1]
+            local_eta_vect = local_eta_vect[0 : idx_end + 1]
+        # Erase start of the curve if thrust is negative or decreases
+        idx_start = 0
+        thrust_difference = np.array(local_thrust_vect[1:]) - np.array(local_thrust_vect[0:-1])
+        # Testing a non empty sequence with an if will return True if it is not empty see
+        # PEP8 recommended method
+        if list(np.where(np.array(local_thrust_vect) < 0.0)[0]):
+            idx_start = int(np.max(np.where(np.array(local_thrust_vect) < 0.0)))
+        # Testing a non empty sequence with an if will return True if it is not empty see
+        # PEP8 recommended method
+        if list(np.where(thrust_difference < 0.0)[0]):
+            idx_start = max(idx_start, int(np.max(np.where(thrust_difference < 0.0)) + 1))
+        local_thrust_vect = local_thrust_vect[idx_start:]
+        local_theta_vect = local_theta_vect[idx_start:]
+        local_eta_vect = local_eta_vect[idx_start:]
+        # Erase remaining points with negative or >1.0 efficiency
+        idx_drop = np.where((np.array(local_eta_vect) <= 0.0) + (np.array(local_eta_vect) > 1.0))[
+            0
+        ].tolist()
+        for idx in sorted(idx_drop, reverse=True):
+            del local_thrust_vect[idx]
+            del local_theta_vect[idx]
+            del local_eta_vect[idx]
+
+        # # Plot graphs
+        # plt.figure(1)
+        # plt.subplot(311)
+        # plt.xlabel("0.75R pitch angle [°]")
+        # plt.ylabel("Thrust [N]")
+        # plt.plot(local_theta_vect, local_thrust_vect)
+        # plt.subplot(312)
+        # plt.xlabel("0.75R pitch angle [°]")
+        # plt.ylabel("Efficiency [-]")
+        # plt.plot(local_theta_vect, local_eta_vect)
+        # plt.subplot(313)
+        # plt.xlabel("0.75R pitch angle [°]")
+        # plt.ylabel("Torque [-]")
+        # plt.plot(local_theta_vect,
+        #          v_inf * np.array(local_thrust_vect)
+        #          /
+        #          (np.array(local_eta_vect) * omega * np.pi / 30.0))
+
+        return local_thrust_vect, local_theta_vect, local_eta_vect, first_speed_vect
 
     @staticmethod
     def reformat_table(thrust_vect, eta_vect):
@@ -335,3 +527,53 @@ class _ComputePropellerPerformance(PropellerCoreModule):
             )
 
         return thrust_limit, thrust_interp, efficiency_interp
+
+
+def _compute_speed_performance(
+    component_class, options, inputs, v_inf, altitude, omega, radius, alpha_list, cl_list, cd_list
+):
+    """
+    Computes a cell of the propeller tables with a new component, used for parallel runs. The
+    solve counts of the component are returned with the cell performance.
+    """
+    component = component_class(**options)
+    performance = component.compute_speed_performance(
+        inputs, v_inf, altitude, omega, radius, alpha_list, cl_list, cd_list
+    )
+
+    return performance, component.solve_counts
+
+
+def _thrust_decrease_index(thrust_vect, complete=True):
+    """
+    Finds the first thrust decrease after the "monotone" zone (10 points of increase), which
+    marks the end of the useful pitches, and returns its index.
+
+    :param thrust_vect: the thrust vector of a pitch sweep, in N.
+    :param complete: False if the sweep is not finished, the zones depending on the next points
+    being then considered as unknown.
+    :return: the index of the last useful pitch, None if thrust does not decrease or, for an
+    incomplete sweep, if it may change with the next points.
+    """
+
+    # Find first the "monotone" zone (10 points of increase)
+    idx_in_zone = 0
+    thrust_difference = np.array(thrust_vect[1:]) - np.array(thrust_vect[0:-1])
+    for idx in range(5, len(thrust_difference)):
+        if not complete and idx + 5 > len(thrust_difference):
+            return None
+        if np.sum(np.array(thrust_difference[idx - 5 : idx + 5]) > 0.0) == len(
+            thrust_difference[idx - 5 : idx + 5]
+        ):
+            idx_in_zone = idx + 1
+            break
+    else:
+        if not complete:
+            return None
+
+    # Testing a non empty sequence with an if will return True if it is not empty see
+    # PEP8 recommended method
+    if list(np.where(thrust_difference[idx_in_zone:] < 0.0)[0]):
+        return int(np.min(np.where(thrust_difference[idx_in_zone:] < 0.0)) + idx_in_zone)
+
+    return None
@@ -22,6 +22,7 @@ import fastoad.api as oad
 from fastoad.module_management.constants import ModelDomain
 from stdatm import Atmosphere
 
+from fastga.models.aerodynamics.external.xfoil.xfoil_batch import XfoilPolarBatch
 from fastga.models.aerodynamics.external.xfoil.xfoil_polar import XfoilPolar
 from .propeller_core import PropellerCoreModule
 
@@ -51,23 +52,60 @@ class ComputePropellerCoefficientMap(om.Group):
             types=list,
         )
         self.options.declare("elements_number", default=20, types=int)
+        self.options.declare(
+            "xfoil_workers",
+            default=1,
+            types=int,
+            lower=1,
+            desc="Number of XFOIL runs done at the same time for the polars of the sections, "
+            "1 meaning they are computed one after the other",
+        )
+        self.options.declare(
+            "result_folder_path",
+            default="",
+            types=str,
+            desc="Folder of the database in which the computed propeller maps are saved, so that "
+            "they are read instead of being computed again for the same inputs, no database if "
+            "empty",
+        )
 
     def setup(self):
         ivc = om.IndepVarComp()
         ivc.add_output("data:aerodynamics:propeller:coefficient_map:mach", val=0.0)
         ivc.add_output("data:aerodynamics:propeller:coefficient_map:reynolds", val=1e6)
         self.add_subsystem("propeller_coeff_map_aero_conditions", ivc, promotes=["*"])
-        for profile in self.options["sections_profile_name_list"]:
+        polar_options_list = [
+            dict(
+                airfoil_folder_path=self.options["airfoil_folder_path"],
+                airfoil_file=profile + ".af",
+                alpha_end=30.0,
+                activate_negative_angle=True,
+            )
+            for profile in self.options["sections_profile_name_list"]
+        ]
+        if self.options["xfoil_workers"] > 1:
             self.add_subsystem(
-                profile + "_polar_coeff_map",
-                XfoilPolar(
-                    airfoil_folder_path=self.options["airfoil_folder_path"],
-                    airfoil_file=profile + ".af",
-                    alpha_end=30.0,
-                    activate_negative_angle=True,
+                "sections_polar_coeff_map",
+                XfoilPolarBatch(
+                    polar_options_list=polar_options_list,
+                    max_workers=self.options["xfoil_workers"],
                 ),
                 promotes=[],
             )
+            self.connect(
+                "data:aerodynamics:propeller:coefficient_map:mach",
+                "sections_polar_coeff_map.xfoil:mach",
+            )
+            self.connect(
+                "data:aerodynamics:propeller:coefficient_map:reynolds",
+                "sections_polar_coeff_map.xfoil:reynolds",
+            )
+        for profile, polar_options in zip(
+            self.options["sections_profile_name_list"], polar_options_list
+        ):
+            self.add_subsystem(
+                profile + "_polar_coeff_map", XfoilPolar(**polar_options), promotes=[]
+            )
             self.connect(
                 "data:aerodynamics:propeller:coefficient_map:mach",
                 profile + "_polar_coeff_map.xfoil:mach",
@@ -82,6 +120,7 @@ class ComputePropellerCoefficientMap(om.Group):
                 sections_profile_position_list=self.options["sections_profile_position_list"],
                 sections_profile_name_list=self.options["sections_profile_name_list"],
                 elements_number=self.options["elements_number"],
+                result_folder_path=self.options["result_folder_path"],
             ),
             promotes_inputs=["data:*"],
             promotes_outputs=["*"],
@@ -142,6 +181,10 @@ class _ComputePropellerCoefficientMap(PropellerCoreModule):
 
         _LOGGER.debug("Entering propeller computation")
 
+        # Maps computed for the same inputs are read instead
+        if self.read_saved_map(inputs, outputs):
+            return
+
         # Define init values
         omega = inputs["data:geometry:propeller:average_rpm"]
         altitude = inputs["data:aerodynamics:propeller:coefficient_map:altitude"]
@@ -212,3 +255,5 @@ class _ComputePropellerCoefficientMap(PropellerCoreModule):
         outputs["data:aerodynamics:propeller:coefficient_map:advance_ratio"] = j_list
         outputs["data:aerodynamics:propeller:coefficient_map:power_coefficient"] = cp_list
         outputs["data:aerodynamics:propeller:coefficient_map:thrust_coefficient"] = ct_list
+
+        self.save_map(inputs, outputs)
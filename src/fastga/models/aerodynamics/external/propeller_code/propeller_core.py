@@ -15,13 +15,13 @@
 import logging
 
 import numpy as np
-from scipy.optimize import root
 
 import openmdao.api as om
 
 from stdatm import Atmosphere
 
 from fastga.models.aerodynamics.external.xfoil.xfoil_polar import POLAR_POINT_COUNT
+from .propeller_map_store import PropellerMapStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,11 +41,22 @@ class PropellerCoreModule(om.ExplicitComponent):
         super().__init__(**kwargs)
         self.theta_min = 0.0
         self.theta_max = 0.0
+        # Number of blade element systems solved, of those started from a previous solution, of
+        # Newton iterations (done for all the elements solved together) and of pitches of a sweep
+        # not computed since thrust stopped increasing
+        self.solve_counts = dict(solves=0, warm_starts=0, iterations=0, skipped_pitches=0)
 
     def initialize(self):
         self.options.declare("sections_profile_position_list", types=list)
         self.options.declare("sections_profile_name_list", types=list)
         self.options.declare("elements_number", default=20, types=int)
+        self.options.declare(
+            "result_folder_path",
+            default="",
+            types=str,
+            desc="Folder of the database in which the computed maps are saved, so that they are "
+            "read instead of being computed again for the same inputs, no database if empty",
+        )
 
     def setup(self):
         self.add_input("reference_reynolds", val=1e6)
@@ -89,6 +100,50 @@ class PropellerCoreModule(om.ExplicitComponent):
 
         self.declare_partials(of="*", wrt="*", method="fd")
 
+    def read_saved_map(self, inputs, outputs) -> bool:
+        """
+        Fills the outputs with the map saved in the result folder for the same inputs, if any.
+
+        :return: True if a saved map has been found.
+        """
+        if self.options["result_folder_path"] == "":
+            return False
+
+        map_store = PropellerMapStore(self.options["result_folder_path"])
+        results = map_store.search(self._map_key(inputs))
+        if results is None:
+            return False
+
+        for name, value in results.items():
+            outputs[name] = value
+        _LOGGER.debug("Propeller map read from %s", map_store.database_path)
+
+        return True
+
+    def save_map(self, inputs, outputs):
+        """Saves the outputs in the result folder, if defined."""
+        if self.options["result_folder_path"] == "":
+            return
+
+        PropellerMapStore(self.options["result_folder_path"]).save(
+            self._map_key(inputs),
+            type(self).__name__,
+            {name: outputs[name] for name in outputs},
+        )
+
+    def _map_key(self, inputs) -> str:
+
+        options = {
+            name: self.options[name]
+            for name in [
+                "sections_profile_position_list",
+                "sections_profile_name_list",
+                "elements_number",
+            ]
+        }
+
+        return PropellerMapStore.map_key(type(self).__name__, inputs, options)
+
     def compute_extreme_pitch(self, inputs, v_inf):
         """For a given flight speed computes the min and max possible value of theta at .75 r/R."""
         radius_ratio_vect = inputs["data:geometry:propeller:radius_ratio_vect"]
@@ -108,10 +163,11 @@ class PropellerCoreModule(om.ExplicitComponent):
 
         """
         This function calculates the thrust, efficiency and power at a given flight speed,
-        altitude h and propeller angular speed.
+        altitude h and propeller angular speed. The induced speeds of all the blade elements, and
+        of all the pitches if several are given, are solved at once.
 
         :param inputs: structure of data relative to the blade geometry available from setup
-        :param theta_75: pitch defined at r = 0.75*R radial position [deg].
+        :param theta_75: pitch defined at r = 0.75*R radial position [deg], or array of pitches.
         :param v_inf: flight speeds [m/s].
         :param altitude: flight altitude [m].
         :param omega: angular velocity of the propeller [RPM].
@@ -123,7 +179,55 @@ class PropellerCoreModule(om.ExplicitComponent):
         :param cd_list: cd list for aerodynamic coefficient of profile at discretized blade
         element [-].
 
-        :return: thrust [N], eta (efficiency) [-] and power [W].
+        :return: thrust [N], eta (efficiency) [-] and power [W], as arrays with a value per pitch
+        if several pitches are given.
+        """
+
+        thrust, eta, torque, _ = self.solve_pitch_performance(
+            inputs, theta_75, v_inf, altitude, omega, radius, alpha_list, cl_list, cd_list
+        )
+
+        if np.size(theta_75) == 1:
+            return float(thrust[0]), float(eta[0]), float(torque[0])
+
+        return thrust, eta, torque
+
+    def solve_pitch_performance(
+        self,
+        inputs,
+        theta_75,
+        v_inf,
+        altitude,
+        omega,
+        radius,
+        alpha_list,
+        cl_list,
+        cd_list,
+        initial_speed_vect=None,
+    ):
+        """
+        Computes the performance of compute_pitch_performance for an array of pitches and returns
+        the induced speeds found, so that they can be used as initial guess of a close computation
+        (next pitches or flight speed).
+
+        :param inputs: structure of data relative to the blade geometry available from setup
+        :param theta_75: array of pitches defined at r = 0.75*R radial position [deg].
+        :param v_inf: flight speeds [m/s].
+        :param altitude: flight altitude [m].
+        :param omega: angular velocity of the propeller [RPM].
+        :param radius: array of radius of discretized blade elements [m].
+        :param alpha_list: angle of attack list for aerodynamic coefficient of profile at
+        discretized blade element [deg].
+        :param cl_list: cl list for aerodynamic coefficient of profile at discretized blade
+        element [-].
+        :param cd_list: cd list for aerodynamic coefficient of profile at discretized blade
+        element [-].
+        :param initial_speed_vect: initial axial and tangential induced speeds along the first
+        axis, broadcast to the pitches (second axis) and elements (third axis) [m/s], defaults to
+        a fraction of the flight speed.
+
+        :return: thrust [N], eta (efficiency) [-] and torque [N.m] arrays with a value per pitch,
+        and the induced speeds of the elements [m/s].
         """
 
         blades_number = inputs["data:geometry:propeller:blades_number"]
@@ -140,80 +244,188 @@ class PropellerCoreModule(om.ExplicitComponent):
         atm = Atmosphere(altitude, altitude_in_feet=False)
 
         theta_75_ref = np.interp(0.75, radius_ratio_vect, twist_vect)
-
-        # Initialise vectors
-        vi_vect = np.zeros_like(radius)
-        vt_vect = np.zeros_like(radius)
-        thrust_element_vector = np.zeros_like(radius)
-        torque_element_vector = np.zeros_like(radius)
-        alpha_vect = np.zeros_like(radius)
-        speed_vect = np.array([0.1 * float(v_inf), 1.0])
+        theta_75_vect = np.reshape(np.asarray(theta_75, dtype=float), (-1, 1))
 
         chord = np.interp(radius / radius_max, radius_ratio_vect, chord_vect)
 
+        # Pitches along first axis and blade elements along second one
         theta = np.interp(radius / radius_max, radius_ratio_vect, twist_vect) + (
-            theta_75 - theta_75_ref
+            theta_75_vect - theta_75_ref
         )
         sweep = np.interp(radius / radius_max, radius_ratio_vect, sweep_vect)
 
-        # Loop on element number to compute equations
-        for idx, _ in enumerate(radius):
-
-            # Solve BEM vs. disk theory system of equations
-            speed_vect = root(
-                fun=self.delta,
-                x0=speed_vect,
-                args=(
-                    radius[idx],
-                    radius_min,
-                    radius_max,
-                    chord[idx],
-                    blades_number,
-                    sweep[idx],
-                    omega,
-                    v_inf,
-                    theta[idx],
-                    alpha_list[idx, :],
-                    cl_list[idx, :],
-                    cd_list[idx, :],
-                    atm,
-                    reference_reynolds,
-                ),
-                method="hybr",
-                options={"xtol": 1e-3},
-            ).x
-            vi_vect[idx] = speed_vect[0]
-            vt_vect[idx] = speed_vect[1]
-            results = self.bem_theory(
-                speed_vect,
-                radius[idx],
-                chord[idx],
-                blades_number,
-                sweep[idx],
-                omega,
-                v_inf,
-                theta[idx],
-                alpha_list[idx, :],
-                cl_list[idx, :],
-                cd_list[idx, :],
-                atm,
-                reference_reynolds,
+        # Solve BEM vs. disk theory system of equations, starting from the given induced speeds
+        # if any
+        if initial_speed_vect is None:
+            speed_vect = np.zeros((2,) + theta.shape)
+            speed_vect[0] = 0.1 * float(v_inf)
+            speed_vect[1] = 1.0
+        else:
+            speed_vect = np.array(np.broadcast_to(initial_speed_vect, (2,) + theta.shape))
+            self.solve_counts["warm_starts"] += theta.size
+        speed_vect = self.solve_induced_speeds(
+            speed_vect,
+            radius,
+            radius_min,
+            radius_max,
+            chord,
+            blades_number,
+            sweep,
+            omega,
+            v_inf,
+            theta,
+            alpha_list,
+            cl_list,
+            cd_list,
+            atm,
+            reference_reynolds,
+        )
+        results = self.bem_theory(
+            speed_vect,
+            radius,
+            chord,
+            blades_number,
+            sweep,
+            omega,
+            v_inf,
+            theta,
+            alpha_list,
+            cl_list,
+            cd_list,
+            atm,
+            reference_reynolds,
+        )
+        out_of_polars = results[3] > 0.0
+        thrust_element_vector = np.where(
+            out_of_polars, 0.0, results[0] * element_length * atm.density
+        )
+        torque_element_vector = np.where(
+            out_of_polars, 0.0, results[1] * element_length * atm.density
+        )
+
+        torque = np.sum(torque_element_vector, axis=-1)
+        thrust = np.sum(thrust_element_vector, axis=-1)
+        power = torque * omega
+        eta = v_inf * thrust / power
+
+        return thrust, eta, torque, speed_vect
+
+    def solve_induced_speeds(
+        self,
+        speed_vect: np.array,
+        radius: np.array,
+        radius_min: float,
+        radius_max: float,
+        chord: np.array,
+        blades_number: float,
+        sweep: np.array,
+        omega: float,
+        v_inf: float,
+        theta: np.array,
+        alpha_list: np.array,
+        cl_list: np.array,
+        cd_list: np.array,
+        atm: Atmosphere,
+        reference_reynolds: float,
+        tolerance: float = 1e-9,
+        max_iterations: int = 50,
+    ):
+        """
+        Solves the BEM vs. disk theory system of equations of several blade elements at once,
+        with a damped Newton method: the Newton step of each element is halved until its residual
+        decreases. Element data are given along the last axis.
+
+        :param speed_vect: initial axial and tangential induced speeds, along the first axis [m/s]
+        :param radius: radius position of the elements center  [m]
+        :param radius_min: Hub radius [m]
+        :param radius_max: Max radius [m]
+        :param chord: chord at the center of elements [m]
+        :param blades_number: number of blades [-]
+        :param sweep: sweep angle of elements [deg.]
+        :param omega: angular speed of propeller [rad/sec]
+        :param v_inf: flight speed [m/s]
+        :param theta: profile angle of elements relative to aircraft airflow v_inf [deg.]
+        :param alpha_list: reference angle vectors for element polars [deg.]
+        :param cl_list: cl vectors for elements [-]
+        :param cd_list: cd vectors for elements [-]
+        :param atm: atmosphere properties
+        :param reference_reynolds: Reynolds number at which the aerodynamic properties were computed
+        :param tolerance: relative tolerance on the induced speeds
+        :param max_iterations: maximum number of Newton iterations
+
+        :return: the axial and tangential induced speeds, solutions of the system [m/s].
+        """
+
+        args = (
+            radius,
+            radius_min,
+            radius_max,
+            chord,
+            blades_number,
+            sweep,
+            omega,
+            v_inf,
+            theta,
+            alpha_list,
+            cl_list,
+            cd_list,
+            atm,
+            reference_reynolds,
+        )
+
+        speed_vect = np.array(speed_vect, dtype=float)
+        residual = self.delta(speed_vect, *args)
+        residual_norm = np.sum(residual ** 2.0, axis=0)
+        self.solve_counts["solves"] += speed_vect[0].size
+
+        for _ in range(max_iterations):
+
+            self.solve_counts["iterations"] += 1
+
+            # Jacobian of each element with forward differences
+            jacobian = np.empty((2,) + speed_vect.shape)
+            for idx in range(2):
+                step = 1e-7 * np.maximum(np.abs(speed_vect[idx]), 1.0)
+                shifted_speed_vect = np.copy(speed_vect)
+                shifted_speed_vect[idx] += step
+                jacobian[:, idx] = (self.delta(shifted_speed_vect, *args) - residual) / step
+
+            # Newton step, elements with singular jacobian are not moved
+            determinant = jacobian[0, 0] * jacobian[1, 1] - jacobian[0, 1] * jacobian[1, 0]
+            singular = determinant == 0.0
+            determinant = np.where(singular, 1.0, determinant)
+            newton_step = (
+                np.array(
+                    [
+                        jacobian[0, 1] * residual[1] - jacobian[1, 1] * residual[0],
+                        jacobian[1, 0] * residual[0] - jacobian[0, 0] * residual[1],
+                    ]
+                )
+                / np.where(singular, np.inf, determinant)
             )
-            out_of_polars = results[3]
-            if out_of_polars:
-                thrust_element_vector[idx] = 0.0
-                torque_element_vector[idx] = 0.0
-            else:
-                thrust_element_vector[idx] = results[0] * element_length * atm.density
-                torque_element_vector[idx] = results[1] * element_length * atm.density
-            alpha_vect[idx] = results[2]
-
-        torque = np.sum(torque_element_vector)
-        thrust = float(np.sum(thrust_element_vector))
-        power = float(torque * omega)
-        eta = float(v_inf * thrust / power)
 
-        return thrust, eta, torque
+            # Damping of the steps that do not decrease the residual
+            damping = np.ones_like(determinant)
+            for _ in range(10):
+                new_speed_vect = speed_vect + damping * newton_step
+                new_residual = self.delta(new_speed_vect, *args)
+                new_residual_norm = np.sum(new_residual ** 2.0, axis=0)
+                increasing = ~(new_residual_norm <= residual_norm)
+                if not np.any(increasing):
+                    break
+                damping = np.where(increasing, 0.5 * damping, damping)
+
+            converged = np.all(
+                np.abs(new_speed_vect - speed_vect)
+                <= tolerance * np.maximum(np.abs(speed_vect), 1.0)
+            )
+            speed_vect = new_speed_vect
+            residual = new_residual
+            residual_norm = new_residual_norm
+            if converged:
+                break
+
+        return speed_vect
 
     @staticmethod
     def bem_theory(
@@ -235,6 +447,8 @@ class PropellerCoreModule(om.ExplicitComponent):
         The core of the Propeller code. Given the geometry of a propeller element,
         its aerodynamic polars, flight conditions and axial/tangential velocities it computes the
         thrust and the torque produced using force and momentum with BEM theory.
+        Several elements can be computed at once, their data being given along the last axis of
+        arrays, with a 2D array of polars (one row per element).
 
         :param speed_vect: the vector of axial and tangential induced speed in m/s
         :param radius: radius position of the element center  [m]
@@ -269,19 +483,21 @@ class PropellerCoreModule(om.ExplicitComponent):
         mach_local = atm.mach
 
         # Apply the compressibility corrections for cl and cd
-        out_of_polars = bool((alpha > max(alpha_element)) or (alpha < min(alpha_element)))
+        out_of_polars = np.logical_or(
+            alpha > np.max(alpha_element, axis=-1), alpha < np.min(alpha_element, axis=-1)
+        )
 
-        c_l = np.interp(alpha, alpha_element, cl_element)
-        c_d = np.interp(alpha, alpha_element, cd_element)
+        c_l = _interp_polar(alpha, alpha_element, cl_element)
+        c_d = _interp_polar(alpha, alpha_element, cd_element)
 
-        if mach_local < 1:
-            beta = np.sqrt(1 - mach_local ** 2.0)
-            c_l = c_l / (beta + c_l * mach_local ** 2.0 / (2.0 + 2.0 * beta))
-            c_d = c_d / (beta + c_d * mach_local ** 2.0 / (2.0 + 2.0 * beta))
-        else:
-            beta = np.sqrt(mach_local ** 2.0 - 1)
-            c_l = c_l / beta
-            c_d = c_d / beta
+        beta = np.sqrt(np.abs(1.0 - mach_local ** 2.0))
+        subsonic = mach_local < 1
+        c_l = np.where(
+            subsonic, c_l / (beta + c_l * mach_local ** 2.0 / (2.0 + 2.0 * beta)), c_l / beta
+        )
+        c_d = np.where(
+            subsonic, c_d / (beta + c_d * mach_local ** 2.0 / (2.0 + 2.0 * beta)), c_d / beta
+        )
 
         reynolds = chord * atm.unitary_reynolds
         f_re = (3.46 * np.log(reynolds) - 5.6) ** -2
@@ -306,11 +522,13 @@ class PropellerCoreModule(om.ExplicitComponent):
         )
 
         # Store results
-        output = np.empty(4)
-        output[0] = thrust_element
-        output[1] = torque_element
-        output[2] = alpha
-        output[3] = out_of_polars
+        output = np.array(
+            [
+                np.reshape(value, np.shape(v_i))
+                for value in (thrust_element, torque_element, alpha, out_of_polars)
+            ],
+            dtype=float,
+        )
 
         return output
 
@@ -330,6 +548,8 @@ class PropellerCoreModule(om.ExplicitComponent):
         The core of the Propeller code. Given the geometry of a propeller element,
         its aerodynamic polars, flight conditions and axial/tangential velocities it computes the
         thrust and the torque produced using force and momentum with disk theory.
+        Several elements can be computed at once, their data being given along the last axis of
+        arrays.
 
         :param speed_vect: the vector of axial and tangential induced speed in m/s
         :param radius: radius position of the element center  [m]
@@ -390,9 +610,10 @@ class PropellerCoreModule(om.ExplicitComponent):
         torque_element = 4.0 * np.pi * radius ** 2.0 * (v_inf + v_i) * v_t * f_tip * f_hub
 
         # Store results
-        output = np.empty(2)
-        output[0] = thrust_element
-        output[1] = torque_element
+        output = np.array(
+            [np.reshape(value, np.shape(v_i)) for value in (thrust_element, torque_element)],
+            dtype=float,
+        )
 
         return output
 
@@ -418,6 +639,8 @@ class PropellerCoreModule(om.ExplicitComponent):
         The core of the Propeller code. Given the geometry of a propeller element,
         its aerodynamic polars, flight conditions and axial/tangential velocities it computes the
         thrust and the torque produced using force and momentum with disk theory.
+        Several elements can be computed at once, their data being given along the last axis of
+        arrays, with a 2D array of polars (one row per element).
 
         :param speed_vect: the vector of axial and tangential induced speed in m/s
         :param radius: radius position of the element center  [m]
@@ -476,3 +699,29 @@ class PropellerCoreModule(om.ExplicitComponent):
             c_l[idx_start : idx_end + 1],
             c_d[idx_start : idx_end + 1],
         )
+
+
+def _interp_polar(alpha, alpha_element, coefficient_element):
+    """
+    Linear interpolation of the polars, as np.interp. If the polars are given as 2D arrays, with
+    one element per row, the angles of attack are interpolated in the polar of their element,
+    elements being along the last axis of alpha.
+    """
+
+    if np.ndim(alpha_element) == 1:
+        return np.interp(alpha, alpha_element, coefficient_element)
+
+    alpha = np.asarray(alpha, dtype=float)
+    element_idx = np.arange(np.shape(alpha_element)[0])
+    idx = np.sum(alpha_element <= alpha[..., np.newaxis], axis=-1)
+    idx = np.clip(idx, 1, np.shape(alpha_element)[1] - 1)
+    alpha_0 = alpha_element[element_idx, idx - 1]
+    alpha_1 = alpha_element[element_idx, idx]
+    coefficient_0 = coefficient_element[element_idx, idx - 1]
+    coefficient_1 = coefficient_element[element_idx, idx]
+    # Values are kept constant outside of the polar as with np.interp
+    ratio = np.clip(
+        (alpha - alpha_0) / np.where(alpha_1 == alpha_0, 1.0, alpha_1 - alpha_0), 0.0, 1.0
+    )
+
+    return coefficient_0 + ratio * (coefficient_1 - coefficient_0)
@@ -0,0 +1,117 @@
+"""Persistent storage of the propeller maps computed with the BEM code."""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import os
+import os.path as pth
+import sqlite3
+from typing import Optional
+
+import numpy as np
+
+from fastga.models.aerodynamics.external.result_store import DATABASE_TIMEOUT
+from fastga.utils.resource_management.input_hash import hash_inputs
+
+# To be incremented when the computation of the maps changes, so that the maps saved by previous
+# versions are not used anymore
+PROPELLER_MAP_VERSION = 1
+DATABASE_FILE_NAME = "propeller_maps.db"
+
+
+class PropellerMapStore:
+    """
+    Single file database of the propeller maps (performance tables, coefficient maps) indexed by
+    the hash of everything they are computed from: the propeller geometry (diameters, blade chord,
+    twist and sweep vectors...), the section profiles and their polars, the rotation speed and the
+    flight conditions (altitudes, speeds).
+    """
+
+    def __init__(self, result_folder_path: str):
+        """
+        :param result_folder_path: folder in which the database is saved.
+        """
+        self.result_folder_path = result_folder_path
+        self.database_path = pth.join(result_folder_path, DATABASE_FILE_NAME)
+
+    @staticmethod
+    def map_key(map_name: str, inputs, options: dict) -> str:
+        """
+        Returns the hash identifying a map.
+
+        :param map_name: name of the map, to distinguish the maps computed from the same inputs.
+        :param inputs: the inputs of the map computation, vectors being allowed.
+        :param options: the options of the map computation.
+        """
+        return hash_inputs(
+            inputs, version=PROPELLER_MAP_VERSION, map_name=map_name, options=options
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+
+        connection = sqlite3.connect(self.database_path, timeout=DATABASE_TIMEOUT)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS maps ("
+            "map_key TEXT PRIMARY KEY, "
+            "map_name TEXT NOT NULL, "
+            "results TEXT NOT NULL)"
+        )
+
+        return connection
+
+    def search(self, map_key: str) -> Optional[dict]:
+        """
+        Searches a map.
+
+        :param map_key: the hash of the map, see map_key.
+        :return: dictionary of the saved results, None if not found.
+        """
+        if not pth.exists(self.database_path):
+            return None
+
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                "SELECT results FROM maps WHERE map_key = ?", (map_key,)
+            ).fetchone()
+        finally:
+            connection.close()
+
+        if row is None:
+            return None
+
+        return json.loads(row[0])
+
+    def save(self, map_key: str, map_name: str, results: dict):
+        """
+        Saves a map, in a single transaction so that an interrupted computation never leaves
+        partial results.
+
+        :param map_key: the hash of the map, see map_key.
+        :param map_name: name of the map.
+        :param results: dictionary of the results, values being floats or arrays.
+        """
+        os.makedirs(self.result_folder_path, exist_ok=True)
+        saved_results = {
+            name: np.asarray(value, dtype=float).tolist() for name, value in results.items()
+        }
+
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO maps VALUES (?, ?, ?)",
+                    (map_key, map_name, json.dumps(saved_results)),
+                )
+        finally:
+            connection.close()
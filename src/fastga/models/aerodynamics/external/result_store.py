@@ -0,0 +1,209 @@
+"""Indexed storage of the aerodynamic results computed with the external codes."""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import hashlib
+import json
+import logging
+import os
+import os.path as pth
+import sqlite3
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+GEOMETRY_SET_LABELS = [
+    "sweep25_wing",
+    "taper_ratio_wing",
+    "aspect_ratio_wing",
+    "dihedral_angle_wing",
+    "twist_angle_wing",
+    "sweep25_htp",
+    "taper_ratio_htp",
+    "aspect_ratio_htp",
+    "mach",
+    "area_ratio",
+]
+GEOMETRY_SET_DECIMALS = 6
+
+# Time in seconds a connection waits for another process to release the database
+DATABASE_TIMEOUT = 60.0
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AeroResultStore:
+    """
+    Single file database of the aerodynamic results of an external code (VLM, OpenVSP...) indexed
+    by the hash of the geometry set. The last element of the geometry set, the area ratio, is not
+    part of the key: it is saved along the results so that they can be scaled when retrieved.
+    """
+
+    def __init__(self, result_folder_path: str, code_name: str):
+        """
+        :param result_folder_path: folder in which the database is saved.
+        :param code_name: name of the code, used for the database name and to identify the
+        results of previous versions (<code_name>_<idx>.csv files).
+        """
+        self.result_folder_path = result_folder_path
+        self.code_name = code_name
+        self.database_path = pth.join(result_folder_path, code_name + "_results.db")
+
+    @staticmethod
+    def geometry_key(geometry_set) -> str:
+        """Returns the hash of the geometry set, area ratio excluded."""
+        saved_set = np.around(
+            np.asarray(geometry_set, dtype=float)[: len(GEOMETRY_SET_LABELS) - 1],
+            decimals=GEOMETRY_SET_DECIMALS,
+        )
+        # Adding 0.0 turns -0.0 into 0.0 so that they share the same key
+        key = ",".join("%.*f" % (GEOMETRY_SET_DECIMALS, value + 0.0) for value in saved_set)
+
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+
+        connection = sqlite3.connect(self.database_path, timeout=DATABASE_TIMEOUT)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "geometry_key TEXT PRIMARY KEY, "
+            "geometry_set TEXT NOT NULL, "
+            "area_ratio REAL NOT NULL, "
+            "results TEXT NOT NULL)"
+        )
+
+        return connection
+
+    def search(self, geometry_set) -> Tuple[Optional[dict], float]:
+        """
+        Searches the results computed for the geometry set.
+
+        :param geometry_set: geometry set, see GEOMETRY_SET_LABELS.
+        :return: dictionary of the saved results (None if not found) and saved area ratio.
+        """
+        if not pth.exists(self.database_path):
+            return None, 1.0
+
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                "SELECT area_ratio, results FROM results WHERE geometry_key = ?",
+                (self.geometry_key(geometry_set),),
+            ).fetchone()
+        finally:
+            connection.close()
+
+        if row is None:
+            return None, 1.0
+
+        return json.loads(row[1]), row[0]
+
+    def save(self, geometry_set, results: dict):
+        """
+        Saves the results computed for the geometry set. The write is done in a single
+        transaction so that an interrupted computation never leaves partial results.
+
+        :param geometry_set: geometry set, see GEOMETRY_SET_LABELS.
+        :param results: dictionary of the results, values being floats or vectors.
+        """
+        os.makedirs(self.result_folder_path, exist_ok=True)
+        geometry_set = np.asarray(geometry_set, dtype=float)
+        saved_results = {
+            name: np.asarray(value, dtype=float).tolist() for name, value in results.items()
+        }
+
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                    (
+                        self.geometry_key(geometry_set),
+                        json.dumps(dict(zip(GEOMETRY_SET_LABELS, geometry_set.tolist()))),
+                        float(geometry_set[-1]),
+                        json.dumps(saved_results),
+                    ),
+                )
+        finally:
+            connection.close()
+
+    def import_csv_results(self) -> int:
+        """
+        Imports the results saved by previous versions as geometry_<idx>.csv and
+        <code_name>_<idx>.csv files in the result folder. The .csv files are left untouched.
+
+        :return: number of imported results.
+        """
+        imported_count = 0
+        idx = 0
+        while pth.exists(pth.join(self.result_folder_path, "geometry_" + str(idx) + ".csv")):
+            geometry_file_path = pth.join(self.result_folder_path, "geometry_" + str(idx) + ".csv")
+            result_file_path = pth.join(
+                self.result_folder_path, self.code_name + "_" + str(idx) + ".csv"
+            )
+            idx += 1
+            if not pth.exists(result_file_path):
+                continue
+            # noinspection PyBroadException
+            try:
+                geometry = _read_csv_file(geometry_file_path)
+                geometry_set = np.around(
+                    geometry.loc[GEOMETRY_SET_LABELS, 0].to_numpy(dtype=float),
+                    decimals=GEOMETRY_SET_DECIMALS,
+                )
+                data = _read_csv_file(result_file_path)
+                results = {
+                    name: _parse_csv_value(value) for name, value in zip(data.index, data[0])
+                }
+            except Exception:
+                _LOGGER.warning("Could not import %s, file skipped", result_file_path)
+                continue
+            self.save(geometry_set, results)
+            imported_count += 1
+
+        return imported_count
+
+
+def migrate_result_folder(result_folder_path: str, code_names=("vlm", "openvsp")) -> dict:
+    """
+    Imports the .csv results of previous versions contained in a result folder into the
+    databases of the different codes.
+
+    :param result_folder_path: folder containing the geometry_<idx>.csv files.
+    :param code_names: names of the codes whose results are imported.
+    :return: number of imported results for each code.
+    """
+    return {
+        code_name: AeroResultStore(result_folder_path, code_name).import_csv_results()
+        for code_name in code_names
+    }
+
+
+def _read_csv_file(file_path: str) -> pd.DataFrame:
+
+    data = pd.read_csv(file_path)
+    values = data.to_numpy()[:, 1].tolist()
+    labels = data.to_numpy()[:, 0].tolist()
+
+    return pd.DataFrame(values, index=labels)
+
+
+def _parse_csv_value(value):
+    """Converts a value read in a .csv result file, vectors being written as strings."""
+    if isinstance(value, str):
+        value = value.strip()
+        if value.startswith("["):
+            return np.array(value[1:-1].replace(",", " ").split(), dtype=float).tolist()
+
+    return float(value)
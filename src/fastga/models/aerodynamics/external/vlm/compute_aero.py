@@ -37,6 +37,14 @@ class ComputeAEROvlm(Group):
         self.options.declare("low_speed_aero", default=False, types=bool)
         self.options.declare("result_folder_path", default="", types=str)
         self.options.declare("compute_mach_interpolation", default=False, types=bool)
+        self.options.declare(
+            "mach_interpolation_workers",
+            default=1,
+            types=int,
+            lower=1,
+            desc="Number of processes used to compute the points of the Cl_alpha interpolation "
+            "in Mach, 1 means they are computed sequentially",
+        )
         self.options.declare("airfoil_folder_path", default=None, types=str, allow_none=True)
         self.options.declare(
             "wing_airfoil_file", default=DEFAULT_WING_AIRFOIL, types=str, allow_none=True
@@ -104,6 +112,7 @@ class ComputeAEROvlm(Group):
                 low_speed_aero=self.options["low_speed_aero"],
                 result_folder_path=self.options["result_folder_path"],
                 compute_mach_interpolation=self.options["compute_mach_interpolation"],
+                mach_interpolation_workers=self.options["mach_interpolation_workers"],
                 airfoil_folder_path=self.options["airfoil_folder_path"],
                 wing_airfoil_file=self.options["wing_airfoil_file"],
                 htp_airfoil_file=self.options["htp_airfoil_file"],
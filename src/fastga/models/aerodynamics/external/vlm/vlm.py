@@ -17,20 +17,43 @@ import logging
 import os
 import os.path as pth
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 
 import numpy as np
 import openmdao.api as om
-import pandas as pd
+from scipy.linalg import lu_factor, lu_solve
 from stdatm import Atmosphere
 
 from fastga.models.geometry.profiles.get_profile import get_profile
 from ...constants import SPAN_MESH_POINT, POLAR_POINT_COUNT, MACH_NB_PTS
+from ..result_store import AeroResultStore
 
 DEFAULT_NX = 19
 DEFAULT_NY1 = 3
 DEFAULT_NY2 = 14
 
+# Maximum number of geometries kept in memory and number of decimals of the geometry inputs used
+# to identify them
+GEOMETRY_CACHE_SIZE = 16
+GEOMETRY_CACHE_DECIMALS = 8
+# Geometry inputs that define the wing and htp meshes
+GEOMETRY_CACHE_INPUTS = [
+    "data:geometry:wing:kink:span_ratio",
+    "data:geometry:wing:root:y",
+    "data:geometry:wing:span",
+    "data:geometry:wing:root:chord",
+    "data:geometry:wing:tip:chord",
+    "data:geometry:flap:span_ratio",
+    "data:geometry:horizontal_tail:span",
+    "data:geometry:horizontal_tail:root:chord",
+    "data:geometry:horizontal_tail:tip:chord",
+]
+# Arrays of the geometry dictionaries that are never modified once generated and can thus be
+# shared with the cache instead of being copied
+_SHARED_GEOMETRY_KEYS = ["aic", "aic_wake", "aic_lu"]
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -38,6 +61,12 @@ class VLMSimpleGeometry(om.ExplicitComponent):
 
     """Computation of the aerodynamics properties using the in-house VLM code."""
 
+    # Meshes, influence matrices and their LU factorization, shared by all instances and stored
+    # from the least to the most recently used
+    _geometry_cache = OrderedDict()
+    _geometry_cache_hits = 0
+    _geometry_cache_misses = 0
+
     def __init__(self, **kwargs):
         """Initializing parameters used in VLM computation."""
         super().__init__(**kwargs)
@@ -57,6 +86,21 @@ class VLMSimpleGeometry(om.ExplicitComponent):
             "wing_airfoil_file", default="naca23012.af", types=str, allow_none=True
         )
         self.options.declare("htp_airfoil_file", default="naca0012.af", types=str, allow_none=True)
+        self.options.declare(
+            "vectorized_aic",
+            default=True,
+            types=bool,
+            desc="If False, the aerodynamic influence coefficients are computed panel by panel, "
+            "which is slower but kept as a reference",
+        )
+        self.options.declare(
+            "mach_interpolation_workers",
+            default=1,
+            types=int,
+            lower=1,
+            desc="Number of processes used to compute the points of the Cl_alpha interpolation "
+            "in Mach, 1 means they are computed sequentially",
+        )
 
     def setup(self):
 
@@ -137,10 +181,31 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         """
         mach_interp = np.log(np.linspace(np.exp(0.15), np.exp(1.55 * cruise_mach), MACH_NB_PTS))
         cl_alpha_interp = np.zeros(np.size(mach_interp))
-        for idx, _ in enumerate(mach_interp):
-            cl_alpha_interp[idx] = self.compute_cl_alpha_aircraft(
-                inputs, altitude, mach_interp[idx], aoa_angle
-            )
+        workers = min(self.options["mach_interpolation_workers"], MACH_NB_PTS)
+        if workers > 1:
+            # Each process works on its own copy of the component
+            component_options = dict(self.options.items())
+            component_inputs = {name: np.copy(inputs[name]) for name in inputs}
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        _compute_cl_alpha_aircraft,
+                        type(self),
+                        component_options,
+                        component_inputs,
+                        altitude,
+                        mach,
+                        aoa_angle,
+                    )
+                    for mach in mach_interp
+                ]
+                for idx, future in enumerate(futures):
+                    cl_alpha_interp[idx] = future.result()
+        else:
+            for idx, _ in enumerate(mach_interp):
+                cl_alpha_interp[idx] = self.compute_cl_alpha_aircraft(
+                    inputs, altitude, mach_interp[idx], aoa_angle
+                )
 
         # We add the case were M=0, for thoroughness and since we are in an incompressible flow,
         # the Cl_alpha is approximately the same as for the first Mach of the interpolation
@@ -211,31 +276,23 @@ class VLMSimpleGeometry(om.ExplicitComponent):
 
         # Search if results already exist:
         result_folder_path = self.options["result_folder_path"]
-        result_file_path = None
+        results = None
         saved_area_ratio = 1.0
         if result_folder_path != "":
-            result_file_path, saved_area_ratio = self.search_results(
-                result_folder_path, geometry_set
-            )
+            result_store = AeroResultStore(result_folder_path, "vlm")
+            results, saved_area_ratio = result_store.search(geometry_set)
 
         # If no result saved for that geometry under this mach condition, computation is done
-        if result_file_path is None:
+        if results is None:
 
             # Create result folder first (if it must fail, let it fail as soon as possible)
             if result_folder_path != "":
                 if not os.path.exists(result_folder_path):
                     os.makedirs(pth.join(result_folder_path), exist_ok=True)
 
-            # Save the geometry (result_file_path is None entering the function)
-            if self.options["result_folder_path"] != "":
-                result_file_path = self.save_geometry(result_folder_path, geometry_set)
-
             # Compute wing alone @ 0°/X° angle of attack
-            wing_0 = self.compute_wing(
-                inputs, altitude, mach, 0.0, flaps_angle=0.0, use_airfoil=True
-            )
-            wing_aoa = self.compute_wing(
-                inputs, altitude, mach, aoa_angle, flaps_angle=0.0, use_airfoil=True
+            wing = self.compute_wing_sweep(
+                inputs, altitude, mach, np.array([0.0, aoa_angle]), use_airfoil=True
             )
 
             # Compute complete aircraft @ 0°/X° angle of attack
@@ -253,9 +310,9 @@ class VLMSimpleGeometry(om.ExplicitComponent):
             # Post-process wing data ---------------------------------------------------------------
             k_fus = 1 + 0.025 * width_max / span_wing - 0.025 * (width_max / span_wing) ** 2
             beta = np.sqrt(1 - mach ** 2)  # Prandtl-Glauert
-            cl_0_wing = float((wing_0["cl"] * k_fus / beta) * np.cos(dihedral_angle) ** 2.0)
-            cl_x_wing = float(wing_aoa["cl"] * k_fus / beta)
-            cm_0_wing = float(wing_0["cm"] * k_fus / beta)
+            cl_0_wing = float((wing["cl"][0] * k_fus / beta) * np.cos(dihedral_angle) ** 2.0)
+            cl_x_wing = float(wing["cl"][1] * k_fus / beta)
+            cm_0_wing = float(wing["cm"][0] * k_fus / beta)
             cl_alpha_wing = ((cl_x_wing - cl_0_wing) / (aoa_angle * np.pi / 180)) * np.cos(
                 dihedral_angle
             ) ** 2.0
@@ -265,18 +322,18 @@ class VLMSimpleGeometry(om.ExplicitComponent):
             # aoa impact the computation, so we will stick with this "post processing" of the
             # dihedral
 
-            y_vector_wing = wing_aoa["y_vector"]
-            cl_vector_wing = (np.array(wing_aoa["cl_vector"]) * k_fus / beta).tolist()
-            chord_vector_wing = wing_aoa["chord_vector"]
+            y_vector_wing = wing["y_vector"].tolist()
+            cl_vector_wing = (wing["cl_vector"][1] * k_fus / beta).tolist()
+            chord_vector_wing = wing["chord_vector"].tolist()
             cdp_foil = self._interpolate_cdp(cl_wing_airfoil, cdp_wing_airfoil, cl_x_wing)
             if mach <= 0.4:
-                coef_e = wing_aoa["coef_e"]
+                coef_e = wing["coef_e"][1]
             else:
-                coef_e = wing_aoa["coef_e"] * (
+                coef_e = wing["coef_e"][1] * (
                     -0.001521 * ((mach - 0.05) / 0.3 - 1) ** 10.82 + 1
                 )  # Mach correction
             cdi = cl_x_wing ** 2 / (np.pi * aspect_ratio_wing * coef_e) + cdp_foil
-            coef_e = wing_aoa["cl"] ** 2 / (np.pi * aspect_ratio_wing * cdi)
+            coef_e = wing["cl"][1] ** 2 / (np.pi * aspect_ratio_wing * cdi)
             k_fus = 1 - 2 * (width_max / span_wing) ** 2  # Fuselage correction
             coef_e = float(coef_e * k_fus)
             coef_k_wing = float(1.0 / (np.pi * aspect_ratio_wing * coef_e))
@@ -332,59 +389,52 @@ class VLMSimpleGeometry(om.ExplicitComponent):
                 cl_vector_htp.extend(additional_zeros)
 
             # Save results to defined path ---------------------------------------------------------
-            if self.options["result_folder_path"] != "":
-                results = [
-                    cl_0_wing,
-                    cl_x_wing,
-                    cl_alpha_wing,
-                    cm_0_wing,
-                    y_vector_wing,
-                    cl_vector_wing,
-                    chord_vector_wing,
-                    coef_k_wing,
-                    cl_0_htp,
-                    cl_aoa_htp,
-                    cl_alpha_htp,
-                    cl_alpha_htp_isolated,
-                    y_vector_htp,
-                    cl_vector_htp,
-                    coef_k_htp,
-                    sref_wing,
-                ]
-                self.save_results(result_file_path, results)
+            if result_folder_path != "":
+                results = {
+                    "cl_0_wing": cl_0_wing,
+                    "cl_X_wing": cl_x_wing,
+                    "cl_alpha_wing": cl_alpha_wing,
+                    "cm_0_wing": cm_0_wing,
+                    "y_vector_wing": y_vector_wing,
+                    "cl_vector_wing": cl_vector_wing,
+                    "chord_vector_wing": chord_vector_wing,
+                    "coef_k_wing": coef_k_wing,
+                    "cl_0_htp": cl_0_htp,
+                    "cl_X_htp": cl_aoa_htp,
+                    "cl_alpha_htp": cl_alpha_htp,
+                    "cl_alpha_htp_isolated": cl_alpha_htp_isolated,
+                    "y_vector_htp": y_vector_htp,
+                    "cl_vector_htp": cl_vector_htp,
+                    "coef_k_htp": coef_k_htp,
+                    "saved_ref_area": sref_wing,
+                }
+                result_store.save(geometry_set, results)
 
         # Else retrieved results are used, eventually adapted with new area ratio
         else:
-            # Read values from result file ---------------------------------------------------------
-            data = self.read_results(result_file_path)
-            saved_area_wing = float(data.loc["saved_ref_area", 0])
-            cl_0_wing = float(data.loc["cl_0_wing", 0])
-            cl_x_wing = float(data.loc["cl_X_wing", 0])
-            cl_alpha_wing = float(data.loc["cl_alpha_wing", 0])
-            cm_0_wing = float(data.loc["cm_0_wing", 0])
-            y_vector_wing = np.array(
-                [float(i) for i in data.loc["y_vector_wing", 0][1:-2].split(",")]
-            ) * np.sqrt(sref_wing / saved_area_wing)
-            cl_vector_wing = np.array(
-                [float(i) for i in data.loc["cl_vector_wing", 0][1:-2].split(",")]
+            # Read values from result database -----------------------------------------------------
+            saved_area_wing = float(results["saved_ref_area"])
+            cl_0_wing = float(results["cl_0_wing"])
+            cl_x_wing = float(results["cl_X_wing"])
+            cl_alpha_wing = float(results["cl_alpha_wing"])
+            cm_0_wing = float(results["cm_0_wing"])
+            y_vector_wing = np.array(results["y_vector_wing"]) * np.sqrt(
+                sref_wing / saved_area_wing
             )
-            chord_vector_wing = np.array(
-                [float(i) for i in data.loc["chord_vector_wing", 0][1:-2].split(",")]
-            ) * np.sqrt(sref_wing / saved_area_wing)
-            coef_k_wing = float(data.loc["coef_k_wing", 0])
-            cl_0_htp = float(data.loc["cl_0_htp", 0]) * (area_ratio / saved_area_ratio)
-            cl_aoa_htp = float(data.loc["cl_X_htp", 0]) * (area_ratio / saved_area_ratio)
-            cl_alpha_htp = float(data.loc["cl_alpha_htp", 0]) * (area_ratio / saved_area_ratio)
-            cl_alpha_htp_isolated = float(data.loc["cl_alpha_htp_isolated", 0]) * (
-                area_ratio / saved_area_ratio
+            cl_vector_wing = np.array(results["cl_vector_wing"])
+            chord_vector_wing = np.array(results["chord_vector_wing"]) * np.sqrt(
+                sref_wing / saved_area_wing
             )
-            y_vector_htp = np.array(
-                [float(i) for i in data.loc["y_vector_htp", 0][1:-2].split(",")]
-            )
-            cl_vector_htp = np.array(
-                [float(i) for i in data.loc["cl_vector_htp", 0][1:-2].split(",")]
+            coef_k_wing = float(results["coef_k_wing"])
+            cl_0_htp = float(results["cl_0_htp"]) * (area_ratio / saved_area_ratio)
+            cl_aoa_htp = float(results["cl_X_htp"]) * (area_ratio / saved_area_ratio)
+            cl_alpha_htp = float(results["cl_alpha_htp"]) * (area_ratio / saved_area_ratio)
+            cl_alpha_htp_isolated = float(results["cl_alpha_htp_isolated"]) * (
+                area_ratio / saved_area_ratio
             )
-            coef_k_htp = float(data.loc["coef_k_htp", 0]) * (area_ratio / saved_area_ratio)
+            y_vector_htp = np.array(results["y_vector_htp"])
+            cl_vector_htp = np.array(results["cl_vector_htp"])
+            coef_k_htp = float(results["coef_k_htp"]) * (area_ratio / saved_area_ratio)
 
         return (
             cl_0_wing,
@@ -446,8 +496,7 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         self.apply_deflection(inputs, flaps_angle)
         self.generate_twist(self.wing, wing_twist, y2_wing, semi_span)
         panelangle_vect = self.wing["panel_angle_vect"]
-        aic = self.wing["aic"]
-        aic_inv = np.linalg.inv(aic)
+        aic_lu = self.wing["aic_lu"]
         aic_wake = self.wing["aic_wake"]
 
         # Compute air speed
@@ -458,7 +507,7 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         # Calculate all the aerodynamic parameters
         aoa_angle = aoa_angle * np.pi / 180
         alpha = np.add(panelangle_vect, aoa_angle)
-        gamma = -np.dot(aic_inv, alpha) * v_inf
+        gamma = -lu_solve(aic_lu, alpha) * v_inf
         c_p = -2 / v_inf * np.divide(gamma, panelchord)
         for i in range(self.n_x):
             c_p[i * self.n_y] = c_p[i * self.n_y] * 1
@@ -501,6 +550,106 @@ class VLMSimpleGeometry(om.ExplicitComponent):
 
         return wing
 
+    def compute_wing_sweep(
+        self,
+        inputs,
+        altitude: float,
+        mach: float,
+        aoa_angles,
+        flaps_angles=0.0,
+        use_airfoil: Optional[bool] = True,
+    ):
+        """
+        VLM computations for the wing alone on several angles of attack and flaps angles at once.
+        All the cases are solved together with the factorized influence matrix.
+
+        @param inputs: inputs parameters defined within FAST-OAD-GA
+        @param altitude: altitude for aerodynamic calculation in meters
+        @param mach: air speed expressed in mach
+        @param aoa_angles: air speed angles of attack with respect to aircraft (degree)
+        @param flaps_angles: flaps angles in Deg, either one per angle of attack or a single value
+        (default=0.0: i.e. no deflection)
+        @param use_airfoil: adds the camberline coordinates of the selected airfoil (default=True)
+        @return: wing dictionary including aero parameters as keys: y_vector, chord_vector,
+        cl_vector (one line per case), cl, cdi, cm, coef_e (one value per case)
+        """
+
+        # Generate geometries
+        self._run(inputs)
+
+        # Get inputs
+        aspect_ratio = float(inputs["data:geometry:wing:aspect_ratio"])
+        meanchord = float(inputs["data:geometry:wing:MAC:length"])
+
+        y2_wing = float(inputs["data:geometry:wing:root:y"])
+        semi_span = float(inputs["data:geometry:wing:span"]) / 2.0
+        wing_twist = float(inputs["data:geometry:wing:twist"])
+
+        aoa_angles, flaps_angles = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(aoa_angles, dtype=float)),
+            np.atleast_1d(np.asarray(flaps_angles, dtype=float)),
+        )
+
+        # Initialization
+        x_c = self.wing["x_c"][: self.n_x * self.n_y]
+        panelchord = self.wing["panel_chord"]
+        panelsurf = self.wing["panel_surf"]
+        if use_airfoil:
+            self.generate_curvature(self.wing, self.options["wing_airfoil_file"])
+        aic_lu = self.wing["aic_lu"]
+        aic_wake = self.wing["aic_wake"]
+
+        # Panel angles for each flaps angle, deflection is always applied to the clean wing
+        panelangle = self.wing["panel_angle"]
+        panelangle_vect = self.wing["panel_angle_vect"]
+        z_panel = self.wing["z"]
+        unique_flaps_angles, case_index = np.unique(flaps_angles, return_inverse=True)
+        panelangle_matrix = np.zeros((self.n_x * self.n_y, len(unique_flaps_angles)))
+        for idx, flaps_angle in enumerate(unique_flaps_angles):
+            self.wing["panel_angle"] = np.copy(panelangle)
+            self.wing["panel_angle_vect"] = np.copy(panelangle_vect)
+            self.wing["z"] = z_panel
+            self.apply_deflection(inputs, flaps_angle)
+            self.generate_twist(self.wing, wing_twist, y2_wing, semi_span)
+            panelangle_matrix[:, idx] = self.wing["panel_angle_vect"]
+
+        # Compute air speed
+        v_inf = max(
+            Atmosphere(altitude, altitude_in_feet=False).speed_of_sound * mach, 0.01
+        )  # avoid V=0 m/s crashes
+
+        # Calculate all the aerodynamic parameters, each column being a case
+        alpha = panelangle_matrix[:, case_index] + aoa_angles * np.pi / 180
+        gamma = -lu_solve(aic_lu, alpha) * v_inf
+        c_p = -2 / v_inf * gamma / panelchord[:, np.newaxis]
+        total_surf = np.sum(panelsurf)
+        cl_wing = -np.dot(panelsurf, c_p) / total_surf
+        alphaind = np.dot(aic_wake, gamma) / v_inf
+        cdi_wing = np.dot(panelsurf, c_p * alphaind) / total_surf
+        wing_e = cl_wing ** 2 / (np.pi * aspect_ratio * cdi_wing) * 0.955  # !!!: manual correction?
+        cm_wing = np.dot(panelsurf * (x_c - meanchord / 4), c_p) / total_surf
+
+        # Calculate curves
+        chord_wing = self.wing["chord"]
+        wing_chord_vect = (chord_wing[: self.n_y] + chord_wing[1 : self.n_y + 1]) / 2.0
+        cl_span = (
+            -np.sum((c_p * panelchord[:, np.newaxis]).reshape(self.n_x, self.n_y, -1), axis=0)
+            / wing_chord_vect[:, np.newaxis]
+        )
+
+        # Return values
+        wing = {
+            "y_vector": np.copy(self.wing["yc"][: self.n_y]),
+            "cl_vector": cl_span.T,
+            "chord_vector": wing_chord_vect,
+            "cl": cl_wing,
+            "cdi": cdi_wing,
+            "cm": cm_wing,
+            "coef_e": wing_e,
+        }
+
+        return wing
+
     def compute_htp(
         self,
         inputs,
@@ -535,8 +684,7 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         if use_airfoil:
             self.generate_curvature(self.htp, self.options["htp_airfoil_file"])
         panelangle_vect = self.htp["panel_angle_vect"]
-        aic = self.htp["aic"]
-        aic_inv = np.linalg.inv(aic)
+        aic_lu = self.htp["aic_lu"]
         aic_wake = self.htp["aic_wake"]
 
         # Compute air speed
@@ -547,7 +695,7 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         # Calculate all the aerodynamic parameters
         aoa_angle = aoa_angle * np.pi / 180
         alpha = np.add(panelangle_vect, aoa_angle)
-        gamma = -np.dot(aic_inv, alpha) * v_inf
+        gamma = -lu_solve(aic_lu, alpha) * v_inf
         c_p = -2 / v_inf * np.divide(gamma, panelchord)
         for i in range(self.n_x):
             c_p[i * self.n_y] = c_p[i * self.n_y] * 1
@@ -648,6 +796,21 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         self.ny3 = self.ny2  # n° of panels in the un-flapped exterior portion of the wing
 
         self.n_y = int(self.ny1 + self.ny2 + self.ny3)
+
+        # Reuse the geometries if they have already been generated
+        geometry_key = tuple(
+            round(float(inputs[name]), GEOMETRY_CACHE_DECIMALS) for name in GEOMETRY_CACHE_INPUTS
+        ) + (self.options["vectorized_aic"],)
+        geometry_cache = VLMSimpleGeometry._geometry_cache
+        if geometry_key in geometry_cache:
+            VLMSimpleGeometry._geometry_cache_hits += 1
+            geometry_cache.move_to_end(geometry_key)
+            wing, htp = geometry_cache[geometry_key]
+            self.wing = self._copy_geometry(wing)
+            self.htp = self._copy_geometry(htp)
+            return
+        VLMSimpleGeometry._geometry_cache_misses += 1
+
         # Define elements
         self.wing = {
             "x_panel": np.zeros((self.n_x + 1, 2 * self.n_y + 1)),
@@ -678,6 +841,47 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         # Generate HTP
         self._generate_htp(inputs)
 
+        # Factorize the influence matrices once for all the solved cases and store the geometries
+        self.wing["aic_lu"] = lu_factor(self.wing["aic"])
+        self.htp["aic_lu"] = lu_factor(self.htp["aic"])
+        geometry_cache[geometry_key] = (
+            self._copy_geometry(self.wing),
+            self._copy_geometry(self.htp),
+        )
+        if len(geometry_cache) > GEOMETRY_CACHE_SIZE:
+            geometry_cache.popitem(last=False)
+
+    @staticmethod
+    def _copy_geometry(dictionary):
+        """
+        Copies a geometry dictionary so that the cached one is not modified by the camberline,
+        twist and deflection computations. Influence matrices are shared since they are read-only.
+        """
+        return {
+            key: value if key in _SHARED_GEOMETRY_KEYS else copy.deepcopy(value)
+            for key, value in dictionary.items()
+        }
+
+    @classmethod
+    def geometry_cache_info(cls) -> dict:
+        """
+        Returns the number of hits and misses of the geometry cache along with its current and
+        maximum size.
+        """
+        return {
+            "hits": cls._geometry_cache_hits,
+            "misses": cls._geometry_cache_misses,
+            "size": len(cls._geometry_cache),
+            "maxsize": GEOMETRY_CACHE_SIZE,
+        }
+
+    @classmethod
+    def clear_geometry_cache(cls):
+        """Empties the geometry cache and resets its counters."""
+        cls._geometry_cache.clear()
+        cls._geometry_cache_hits = 0
+        cls._geometry_cache_misses = 0
+
     def _generate_wing(self, inputs):
         """Generates the coordinates for VLM calculations and aic matrix of the wing."""
         y2_wing = inputs["data:geometry:wing:root:y"]
@@ -857,6 +1061,30 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         x_c[self.n_x * self.n_y :] = x_c[: self.n_x * self.n_y]
         y_c[self.n_x * self.n_y :] = -y_c[: self.n_x * self.n_y]
 
+        # Aerodynamic coefficients computation
+        if self.options["vectorized_aic"]:
+            aic, aic_wake = self._compute_aic_vectorized(x_c, y_c, x_1, y_1, x_2, y_2)
+        else:
+            aic, aic_wake = self._compute_aic_loop(x_c, y_c, x_1, y_1, x_2, y_2, aic, aic_wake)
+        # Save data
+        dictionary["x_panel"] = x_panel
+        dictionary["panel_span"] = panelspan
+        dictionary["panel_chord"] = panelchord
+        dictionary["panel_surf"] = panelsurf
+        dictionary["x_c"] = x_c
+        dictionary["yc"] = y_c
+        dictionary["x1"] = x_1
+        dictionary["y1"] = y_1
+        dictionary["x2"] = x_2
+        dictionary["y2"] = y_2
+        dictionary["aic"] = aic
+        dictionary["aic_wake"] = aic_wake
+
+    def _compute_aic_loop(self, x_c, y_c, x_1, y_1, x_2, y_2, aic, aic_wake):
+        """
+        Reference computation of the aerodynamic influence coefficients, panel by panel. Kept as
+        a fallback of the vectorized version.
+        """
         # Aerodynamic coefficients computation (Right side)
         for i in range(self.n_x * self.n_y):
             for j in range(self.n_x * self.n_y):
@@ -899,19 +1127,72 @@ class VLMSimpleGeometry(om.ExplicitComponent):
                     )
                 aic_wake[i, j] = aic_wake[i, j] + coeff_10 / (4 * np.pi)
                 aic[i, j] = aic[i, j] + coeff_10 / (4 * np.pi)
-        # Save data
-        dictionary["x_panel"] = x_panel
-        dictionary["panel_span"] = panelspan
-        dictionary["panel_chord"] = panelchord
-        dictionary["panel_surf"] = panelsurf
-        dictionary["x_c"] = x_c
-        dictionary["yc"] = y_c
-        dictionary["x1"] = x_1
-        dictionary["y1"] = y_1
-        dictionary["x2"] = x_2
-        dictionary["y2"] = y_2
-        dictionary["aic"] = aic
-        dictionary["aic_wake"] = aic_wake
+
+        return aic, aic_wake
+
+    def _compute_aic_vectorized(self, x_c, y_c, x_1, y_1, x_2, y_2):
+        """
+        Computation of the aerodynamic influence coefficients of the horseshoe vortices for all
+        the collocation points at once. Gives the same results as :meth:`_compute_aic_loop`, up to
+        round-off errors.
+        """
+        n_panel = self.n_x * self.n_y
+
+        # Collocation points as column, vortices as rows
+        x_col = x_c[:n_panel, np.newaxis]
+        y_col = y_c[:n_panel, np.newaxis]
+
+        # Right side
+        aic_bound_r, aic_wake_r = self._horseshoe_influence(
+            x_col, y_col, x_1[:n_panel], y_1[:n_panel], x_2[:n_panel], y_2[:n_panel]
+        )
+        # Left side
+        aic_bound_l, aic_wake_l = self._horseshoe_influence(
+            x_col, y_col, x_1[n_panel:], y_1[n_panel:], x_2[n_panel:], y_2[n_panel:]
+        )
+
+        # Summation follows the same order as the loop version to give identical results
+        aic = aic_bound_r + aic_wake_r
+        aic = aic + aic_bound_l
+        aic = aic + aic_wake_l
+        aic_wake = aic_wake_r + aic_wake_l
+
+        return aic, aic_wake
+
+    @staticmethod
+    def _horseshoe_influence(x_col, y_col, x_1, y_1, x_2, y_2):
+        """
+        Influence of the bound vortices and of the trailing legs of the horseshoe vortices
+        defined by the (x_1, y_1) and (x_2, y_2) points, on the collocation points.
+
+        :param x_col: x coordinates of the collocation points, as a column vector
+        :param y_col: y coordinates of the collocation points, as a column vector
+        :param x_1: x coordinates of the first point of the bound vortices
+        :param y_1: y coordinates of the first point of the bound vortices
+        :param x_2: x coordinates of the second point of the bound vortices
+        :param y_2: y coordinates of the second point of the bound vortices
+        :return: influence matrices of the bound vortices and of the wake
+        """
+        coeff_1 = x_col - x_1
+        coeff_2 = y_col - y_1
+        coeff_3 = x_col - x_2
+        coeff_4 = y_col - y_2
+        coeff_5 = np.sqrt(coeff_1 ** 2 + coeff_2 ** 2)
+        coeff_6 = np.sqrt(coeff_3 ** 2 + coeff_4 ** 2)
+        coeff_7 = x_2 - x_1
+        coeff_8 = y_2 - y_1
+        coeff_9 = (coeff_7 * coeff_1 + coeff_8 * coeff_2) / coeff_5 - (
+            coeff_7 * coeff_3 + coeff_8 * coeff_4
+        ) / coeff_6
+        coeff_10 = (1 + coeff_3 / coeff_6) / coeff_4 - (1 + coeff_1 / coeff_5) / coeff_2
+        denominator = coeff_1 * coeff_4 - coeff_2 * coeff_3
+
+        # Bound vortex contribution is ignored when the collocation point is aligned with it
+        with np.errstate(divide="ignore", invalid="ignore"):
+            aic_bound = np.where(denominator != 0, (coeff_9 / denominator) / (4 * np.pi), 0.0)
+        aic_wake = coeff_10 / (4 * np.pi)
+
+        return aic_bound, aic_wake
 
     def generate_twist(self, dictionary, twist, y_start, y_end):
         """
@@ -1033,110 +1314,9 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         _LOGGER.warning("CL not in range. Linear extrapolation of CDp value %f", cdp)
         return cdp
 
-    @staticmethod
-    def search_results(result_folder_path, geometry_set):
-        """Search the results folder to see if the geometry has already been calculated."""
-        if os.path.exists(result_folder_path):
-            geometry_set_labels = [
-                "sweep25_wing",
-                "taper_ratio_wing",
-                "aspect_ratio_wing",
-                "dihedral_angle_wing",
-                "twist_angle_wing",
-                "sweep25_htp",
-                "taper_ratio_htp",
-                "aspect_ratio_htp",
-                "mach",
-                "area_ratio",
-            ]
-            # If some results already stored search for corresponding geometry
-            if pth.exists(pth.join(result_folder_path, "geometry_0.csv")):
-                idx = 0
-                while pth.exists(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")):
-                    if pth.exists(pth.join(result_folder_path, "vlm_" + str(idx) + ".csv")):
-                        data = pd.read_csv(
-                            pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")
-                        )
-                        values = data.to_numpy()[:, 1].tolist()
-                        labels = data.to_numpy()[:, 0].tolist()
-                        data = pd.DataFrame(values, index=labels)
-                        # noinspection PyBroadException
-                        try:
-                            if (
-                                np.size(data.loc[geometry_set_labels[0:-1], 0].to_numpy())
-                                == len(geometry_set_labels) - 1
-                            ):
-                                saved_set = np.around(
-                                    data.loc[geometry_set_labels[0:-1], 0].to_numpy(), decimals=6
-                                )
-                                if (
-                                    np.sum(saved_set == geometry_set[0:-1])
-                                    == len(geometry_set_labels) - 1
-                                ):
-                                    result_file_path = pth.join(
-                                        result_folder_path, "vlm_" + str(idx) + ".csv"
-                                    )
-                                    saved_area_ratio = data.loc["area_ratio", 0]
-                                    return result_file_path, saved_area_ratio
-                        except Exception:
-                            break
-                    idx += 1
-
-        return None, 1.0
-
-    @staticmethod
-    def save_geometry(result_folder_path, geometry_set):
-        """Save geometry if not already computed by finding first available index."""
-        geometry_set_labels = [
-            "sweep25_wing",
-            "taper_ratio_wing",
-            "aspect_ratio_wing",
-            "dihedral_angle_wing",
-            "twist_angle_wing",
-            "sweep25_htp",
-            "taper_ratio_htp",
-            "aspect_ratio_htp",
-            "mach",
-            "area_ratio",
-        ]
-        data = pd.DataFrame(geometry_set, index=geometry_set_labels)
-        idx = 0
-        while pth.exists(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")):
-            idx += 1
-        data.to_csv(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv"))
-        result_file_path = pth.join(result_folder_path, "vlm_" + str(idx) + ".csv")
-
-        return result_file_path
-
-    @staticmethod
-    def save_results(result_file_path, results):
-        """Reads saved results."""
-        labels = [
-            "cl_0_wing",
-            "cl_X_wing",
-            "cl_alpha_wing",
-            "cm_0_wing",
-            "y_vector_wing",
-            "cl_vector_wing",
-            "chord_vector_wing",
-            "coef_k_wing",
-            "cl_0_htp",
-            "cl_X_htp",
-            "cl_alpha_htp",
-            "cl_alpha_htp_isolated",
-            "y_vector_htp",
-            "cl_vector_htp",
-            "coef_k_htp",
-            "saved_ref_area",
-        ]
-        data = pd.DataFrame(results, index=labels)
-        data.to_csv(result_file_path)
-
-    @staticmethod
-    def read_results(result_file_path):
 
-        data = pd.read_csv(result_file_path)
-        values = data.to_numpy()[:, 1].tolist()
-        labels = data.to_numpy()[:, 0].tolist()
+def _compute_cl_alpha_aircraft(component_class, options, inputs, altitude, mach, aoa_angle):
+    """Computes cl_alpha_aircraft with a new component, used for parallel Mach computations."""
+    component = component_class(**options)
 
-        return pd.DataFrame(values, index=labels)
+    return component.compute_cl_alpha_aircraft(inputs, altitude, mach, aoa_angle)
@@ -0,0 +1,530 @@
+"""Binary storage of the airfoil polars computed with Xfoil."""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import glob
+import logging
+import os
+import os.path as pth
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from fastga.utils.resource_management.file_lock import FileLock, atomic_write
+
+POLAR_LABELS = ["alpha", "cl", "cd", "cdp", "cm"]
+"""Columns of the saved polars, one line per angle of attack."""
+
+INDEX_DTYPE = np.dtype(
+    [
+        ("mach", "f8"),
+        ("reynolds", "f8"),
+        ("cl_max_2d", "f8"),
+        ("cl_min_2d", "f8"),
+        ("start", "i8"),
+        ("count", "i8"),
+    ]
+)
+"""One line per saved polar: conditions, 2D lift extrema and position of the polar in the data."""
+
+MACH_TOLERANCE = 0.03
+"""Saved polars are used if computed at a Mach number closer than this to the requested one."""
+
+INDEX_FILE_EXTENSION = ".polar_index.npy"
+DATA_FILE_EXTENSION = ".polar_data"
+CSV_FILE_EXTENSION = ".csv"
+
+_DATA_DTYPE = np.dtype("<f8")
+_ROW_SIZE = len(POLAR_LABELS) * _DATA_DTYPE.itemsize
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PolarStore:
+    """
+    Polars of an airfoil saved in two binary files:
+
+        - <name>.polar_data: raw float64 values of the polars, the lines of each new polar being
+          appended at the end of the file, which is never rewritten. It is memory-mapped so that
+          only the polars actually used are read from disk.
+        - <name>.polar_index.npy: small table of the saved polars (see INDEX_DTYPE), replaced
+          atomically once the polar lines have been written.
+
+    Readers always load the index before the data so that every polar they see is complete.
+    Results saved as <name>.csv by previous versions are converted the first time they are needed.
+
+    The polars loaded with load_table are shared by all the stores of the process pointing to the
+    same files, so that the blade sections of a propeller or the different aerodynamic groups
+    using the same airfoil read its polars only once.
+    """
+
+    _polar_tables = {}
+    _polar_cache_hits = 0
+    _polar_cache_misses = 0
+
+    def __init__(self, store_path: str):
+        """
+        :param store_path: path of the store without extension, e.g. resources/naca23012_20S.
+        """
+        if store_path.endswith(CSV_FILE_EXTENSION):
+            store_path = store_path[: -len(CSV_FILE_EXTENSION)]
+        self.store_path = store_path
+        self.index_file_path = store_path + INDEX_FILE_EXTENSION
+        self.data_file_path = store_path + DATA_FILE_EXTENSION
+        self.csv_file_path = store_path + CSV_FILE_EXTENSION
+
+        self._cache_key = pth.realpath(store_path)
+
+        # Used when the converted .csv file could not be saved (read-only folder)
+        self._csv_index = None
+        self._csv_data = None
+
+    def exists(self) -> bool:
+        """True if the polars are loaded or if the binary files or a .csv file to convert exist."""
+        return (
+            self._cache_key in PolarStore._polar_tables
+            or pth.exists(self.index_file_path)
+            or pth.exists(self.csv_file_path)
+        )
+
+    def load_table(self, reload: bool = False) -> "PolarTable":
+        """
+        Returns all the polars of the store loaded in memory, read from disk only the first time.
+
+        :param reload: if True, polars are read again to get those saved by other processes.
+        :return: the polar table shared by the process.
+        """
+        table = PolarStore._polar_tables.get(self._cache_key)
+        if table is not None and not reload:
+            PolarStore._polar_cache_hits += 1
+            return table
+
+        PolarStore._polar_cache_misses += 1
+        index = self.read_index()
+        if self._csv_data is not None and not pth.exists(self.index_file_path):
+            data = self._csv_data
+        elif len(index) > 0:
+            data = np.fromfile(self.data_file_path, dtype=_DATA_DTYPE).reshape(
+                (-1, len(POLAR_LABELS))
+            )
+        else:
+            data = np.zeros((0, len(POLAR_LABELS)))
+        table = PolarTable(index, data)
+        PolarStore._polar_tables[self._cache_key] = table
+
+        return table
+
+    @classmethod
+    def polar_cache_info(cls) -> dict:
+        """Returns the hits, misses and number of polar tables of the process-wide cache."""
+        return {
+            "hits": cls._polar_cache_hits,
+            "misses": cls._polar_cache_misses,
+            "size": len(cls._polar_tables),
+        }
+
+    @classmethod
+    def clear_polar_cache(cls):
+        """Empties the process-wide cache of polar tables and resets its counters."""
+        cls._polar_tables.clear()
+        cls._polar_cache_hits = 0
+        cls._polar_cache_misses = 0
+
+    def read_index(self) -> np.ndarray:
+        """
+        Returns the table of the saved polars, converting the .csv file of previous versions if
+        needed.
+
+        :return: structured array, see INDEX_DTYPE.
+        """
+        if not pth.exists(self.index_file_path):
+            if self._csv_index is not None:
+                return self._csv_index
+            if not pth.exists(self.csv_file_path):
+                return np.zeros(0, dtype=INDEX_DTYPE)
+            self._import_csv_file()
+            if not pth.exists(self.index_file_path):
+                return self._csv_index
+
+        return np.load(self.index_file_path)
+
+    def read_polar(self, index_line: np.void) -> Dict[str, np.ndarray]:
+        """
+        Reads one of the saved polars.
+
+        :param index_line: line of the table returned by read_index.
+        :return: dictionary of the polar vectors, see POLAR_LABELS.
+        """
+        start = int(index_line["start"])
+        stop = start + int(index_line["count"])
+        if self._csv_data is not None and not pth.exists(self.index_file_path):
+            polar = self._csv_data[start:stop]
+        else:
+            data = np.memmap(self.data_file_path, dtype=_DATA_DTYPE, mode="r")
+            # Copied so that the mapping is released and the file can be appended to on Windows
+            polar = np.array(data[start * len(POLAR_LABELS) : stop * len(POLAR_LABELS)])
+            del data
+            polar = polar.reshape((-1, len(POLAR_LABELS)))
+
+        return {label: polar[:, idx] for idx, label in enumerate(POLAR_LABELS)}
+
+    def append(
+        self,
+        mach: float,
+        reynolds: float,
+        cl_max_2d: float,
+        cl_min_2d: float,
+        polar: Dict[str, np.ndarray],
+    ):
+        """
+        Adds a polar to the store. The lines of the polar are appended to the data file and the
+        index is then replaced, the whole being done under lock to be safe for concurrent
+        processes.
+
+        :param mach: Mach number of the polar.
+        :param reynolds: Reynolds number of the polar.
+        :param cl_max_2d: 2D max lift coefficient.
+        :param cl_min_2d: 2D min lift coefficient.
+        :param polar: dictionary of the polar vectors, see POLAR_LABELS.
+        """
+        # Legacy results have to be converted first so that they are not lost
+        if not pth.exists(self.index_file_path) and pth.exists(self.csv_file_path):
+            self._import_csv_file()
+
+        data = np.column_stack([np.asarray(polar[label], dtype=float) for label in POLAR_LABELS])
+        with FileLock(self.index_file_path):
+            self._append_lines(
+                np.array([(mach, reynolds, cl_max_2d, cl_min_2d, 0, len(data))], dtype=INDEX_DTYPE),
+                data,
+            )
+        # Loaded table is outdated, it will be read again when needed
+        PolarStore._polar_tables.pop(self._cache_key, None)
+
+    def _append_lines(self, new_index: np.ndarray, new_data: np.ndarray):
+        """
+        Appends polars whose start in the index is relative to the first line of new_data. Must
+        be called under lock.
+        """
+        if pth.exists(self.index_file_path):
+            index = np.load(self.index_file_path)
+        else:
+            index = np.zeros(0, dtype=INDEX_DTYPE)
+
+        # Lines left by an interrupted write are not referenced by the index and simply skipped
+        start = (
+            pth.getsize(self.data_file_path) // _ROW_SIZE if pth.exists(self.data_file_path) else 0
+        )
+        with open(self.data_file_path, "ab") as file:
+            if file.tell() != start * _ROW_SIZE:
+                file.truncate(start * _ROW_SIZE)
+            file.write(np.ascontiguousarray(new_data, dtype=_DATA_DTYPE).tobytes())
+            file.flush()
+            os.fsync(file.fileno())
+
+        new_index = new_index.copy()
+        new_index["start"] += start
+        with atomic_write(self.index_file_path) as tmp_file_path:
+            with open(tmp_file_path, "wb") as file:
+                np.save(file, np.concatenate((index, new_index)))
+
+    def _import_csv_file(self):
+        """Converts the .csv file of previous versions, kept in memory if it cannot be saved."""
+        index, data = read_csv_polars(self.csv_file_path)
+        # noinspection PyBroadException
+        try:
+            with FileLock(self.index_file_path):
+                # Another process may have done the conversion in the meantime
+                if not pth.exists(self.index_file_path):
+                    self._append_lines(index, data)
+        except Exception:
+            _LOGGER.warning(
+                "Unable to convert %s polars to binary format, results kept in memory",
+                self.csv_file_path,
+            )
+            self._csv_index = index
+            self._csv_data = data
+
+
+class PolarTable:
+    """
+    Polars of a store held in memory. Polars are padded to the same length so that the search and
+    the interpolation of the saved polars are done with array operations for any number of
+    points.
+    """
+
+    def __init__(self, index: np.ndarray, data: np.ndarray):
+        """
+        :param index: table of the polars, see INDEX_DTYPE.
+        :param data: polar lines, see POLAR_LABELS.
+        """
+        self.index = index
+        self.mach = index["mach"]
+        self.reynolds = index["reynolds"]
+        self.count = index["count"]
+
+        width = max(int(np.max(self.count, initial=0)), 1)
+        valid = np.arange(width)[np.newaxis, :] < self.count[:, np.newaxis]
+        positions = index["start"][:, np.newaxis] + np.arange(width)[np.newaxis, :]
+        lines = np.zeros((len(index), width, len(POLAR_LABELS)))
+        lines[valid] = data[positions[valid]]
+        # Padded angles are put at infinity to keep each line sorted
+        self.alpha = np.where(valid, lines[:, :, 0], np.inf)
+        self.values = np.where(valid[:, :, np.newaxis], lines[:, :, 1:], np.nan)
+
+    def search(self, mach: float, reynolds: float) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Searches the polars for the closest Mach number (within MACH_TOLERANCE) and interpolates
+        linearly between the closest lower and upper Reynolds numbers if the exact one has not
+        been computed, on the angles shared by both polars.
+
+        :param mach: Mach number.
+        :param reynolds: Reynolds number.
+        :return: dictionary of the polar vectors and 2D lift extrema, None if not available.
+        """
+        lower, upper, x_ratio, found = self._bracket(np.array([mach]), np.array([reynolds]))
+        if not found[0]:
+            return None
+
+        lower, upper, x_ratio = lower[0], upper[0], x_ratio[0]
+        alpha_shared, lower_idx, upper_idx = np.intersect1d(
+            self.alpha[lower, : self.count[lower]],
+            self.alpha[upper, : self.count[upper]],
+            return_indices=True,
+        )
+        values = self.values[lower, lower_idx] * x_ratio + self.values[upper, upper_idx] * (
+            1.0 - x_ratio
+        )
+        result = {"alpha": alpha_shared}
+        for idx, label in enumerate(POLAR_LABELS[1:]):
+            result[label] = values[:, idx]
+        for label in ["cl_max_2d", "cl_min_2d"]:
+            result[label] = self.index[label][lower] * x_ratio + self.index[label][upper] * (
+                1.0 - x_ratio
+            )
+
+        return result
+
+    def has_polar(self, mach: float, reynolds: float) -> bool:
+        """True if a polar has been saved at exactly these Mach and Reynolds numbers."""
+        return bool(np.any((self.mach == mach) & (self.reynolds == reynolds)))
+
+    def interpolate(self, mach, reynolds, alpha) -> Dict[str, np.ndarray]:
+        """
+        Interpolates the coefficients at any number of (Mach, Reynolds, alpha) points, linearly
+        between the closest lower and upper saved Mach numbers, then between the closest lower and
+        upper Reynolds numbers of each of them and then on alpha. Out of the range of the saved
+        Mach numbers, the closest one is used within MACH_TOLERANCE. Alpha is clipped to the range
+        of each polar.
+
+        :param mach: Mach number(s).
+        :param reynolds: Reynolds number(s).
+        :param alpha: angle(s) of attack in degrees, arrays being broadcast together.
+        :return: dictionary of the cl, cd, cdp and cm arrays, NaN where no polar is available.
+        """
+        mach, reynolds, alpha = np.broadcast_arrays(
+            np.asarray(mach, dtype=float),
+            np.asarray(reynolds, dtype=float),
+            np.asarray(alpha, dtype=float),
+        )
+        shape = mach.shape
+        mach, reynolds, alpha = mach.ravel(), reynolds.ravel(), alpha.ravel()
+
+        values = np.full((len(mach), len(POLAR_LABELS) - 1), np.nan)
+        if len(self.index) > 0:
+            saved_mach = self.mach[np.newaxis, :]
+            lower_mach = np.max(
+                np.where(saved_mach <= mach[:, np.newaxis], saved_mach, -np.inf), axis=1
+            )
+            upper_mach = np.min(
+                np.where(saved_mach >= mach[:, np.newaxis], saved_mach, np.inf), axis=1
+            )
+            lower_mach = np.where(np.isfinite(lower_mach), lower_mach, upper_mach)
+            upper_mach = np.where(np.isfinite(upper_mach), upper_mach, lower_mach)
+            near_mach = ((lower_mach <= mach) & (mach <= upper_mach)) | (
+                np.abs(lower_mach - mach) < MACH_TOLERANCE
+            )
+
+            same_mach = lower_mach == upper_mach
+            mach_ratio = np.ones(len(mach))
+            mach_ratio[~same_mach] = (upper_mach - mach)[~same_mach] / (upper_mach - lower_mach)[
+                ~same_mach
+            ]
+
+            lower_values, lower_found = self._interpolate_reynolds(lower_mach, reynolds, alpha)
+            upper_values, upper_found = self._interpolate_reynolds(upper_mach, reynolds, alpha)
+            values = np.where(
+                same_mach[:, np.newaxis],
+                lower_values,
+                lower_values * mach_ratio[:, np.newaxis]
+                + upper_values * (1.0 - mach_ratio[:, np.newaxis]),
+            )
+            found = near_mach & lower_found & (same_mach | upper_found)
+            values[~found] = np.nan
+
+        return {label: values[:, idx].reshape(shape) for idx, label in enumerate(POLAR_LABELS[1:])}
+
+    def _bracket(self, mach: np.ndarray, reynolds: np.ndarray):
+        """
+        Returns for each point the lower and upper polars, the weight of the lower one and whether
+        saved polars can be used.
+        """
+        point_count = len(mach)
+        if len(self.index) == 0:
+            zeros = np.zeros(point_count, dtype=int)
+            return zeros, zeros, np.ones(point_count), np.zeros(point_count, dtype=bool)
+
+        distance_to_mach = np.abs(self.mach[np.newaxis, :] - mach[:, np.newaxis])
+        # First of the closest saved Mach numbers
+        closest = np.argmin(distance_to_mach, axis=1)
+        near_mach = distance_to_mach[np.arange(point_count), closest] < MACH_TOLERANCE
+        lower, upper, x_ratio, found = self._bracket_reynolds(self.mach[closest], reynolds)
+
+        return lower, upper, x_ratio, near_mach & found
+
+    def _bracket_reynolds(self, polar_mach: np.ndarray, reynolds: np.ndarray):
+        """
+        Returns for each point the lower and upper polars among those of the given saved Mach
+        number, the weight of the lower one and whether the Reynolds number is within their range.
+        """
+        point_count = len(polar_mach)
+        same_mach = self.mach[np.newaxis, :] == polar_mach[:, np.newaxis]
+
+        saved_reynolds = self.reynolds[np.newaxis, :]
+        exact = same_mach & (saved_reynolds == reynolds[:, np.newaxis])
+        below = same_mach & (saved_reynolds < reynolds[:, np.newaxis])
+        above = same_mach & (saved_reynolds > reynolds[:, np.newaxis])
+        has_exact = np.any(exact, axis=1)
+
+        # First of the closest lower/upper Reynolds numbers
+        lower = np.where(
+            has_exact,
+            np.argmax(exact, axis=1),
+            np.argmax(np.where(below, saved_reynolds, -np.inf), axis=1),
+        )
+        upper = np.where(
+            has_exact,
+            np.argmax(exact, axis=1),
+            np.argmin(np.where(above, saved_reynolds, np.inf), axis=1),
+        )
+        found = has_exact | (np.any(below, axis=1) & np.any(above, axis=1))
+
+        x_ratio = np.ones(point_count)
+        interpolated = found & ~has_exact
+        x_ratio[interpolated] = (self.reynolds[upper] - reynolds)[interpolated] / (
+            self.reynolds[upper] - self.reynolds[lower]
+        )[interpolated]
+
+        return lower, upper, x_ratio, found
+
+    def _interpolate_reynolds(self, polar_mach: np.ndarray, reynolds: np.ndarray, alpha):
+        """
+        Linear interpolation in Reynolds number and alpha of the coefficients of the polars of the
+        given saved Mach number, with whether they are available for each point.
+        """
+        lower, upper, x_ratio, found = self._bracket_reynolds(polar_mach, reynolds)
+        values = self._interpolate_alpha(lower, alpha) * x_ratio[:, np.newaxis]
+        values += self._interpolate_alpha(upper, alpha) * (1.0 - x_ratio[:, np.newaxis])
+
+        return values, found
+
+    def _interpolate_alpha(self, polar_idx: np.ndarray, alpha: np.ndarray) -> np.ndarray:
+        """Linear interpolation in alpha of the coefficients of one polar per point."""
+        points = np.arange(len(alpha))
+        polar_alpha = self.alpha[polar_idx]
+        right = np.clip(
+            np.sum(polar_alpha <= alpha[:, np.newaxis], axis=1),
+            1,
+            np.maximum(self.count[polar_idx] - 1, 1),
+        )
+        left = right - 1
+
+        alpha_left = polar_alpha[points, left]
+        alpha_right = polar_alpha[points, right]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weight = np.clip((alpha - alpha_left) / (alpha_right - alpha_left), 0.0, 1.0)
+        weight = np.where(np.isfinite(weight), weight, 0.0)[:, np.newaxis]
+        polar_values = self.values[polar_idx]
+
+        return polar_values[points, left] * (1.0 - weight) + polar_values[points, right] * weight
+
+
+def read_csv_polars(csv_file_path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reads a .csv polar file of previous versions, with one column per polar and vectors written as
+    strings.
+
+    :param csv_file_path: path of the .csv file.
+    :return: polar table (see INDEX_DTYPE) and polar lines (see POLAR_LABELS).
+    """
+    data = pd.read_csv(csv_file_path, index_col=0)
+
+    index = np.zeros(len(data.columns), dtype=INDEX_DTYPE)
+    polars = []
+    start = 0
+    for idx, column in enumerate(data.columns):
+        polar = np.column_stack(
+            [_parse_csv_vector(data.loc[label, column]) for label in POLAR_LABELS]
+        )
+        index[idx] = (
+            float(data.loc["mach", column]),
+            float(data.loc["reynolds", column]),
+            float(data.loc["cl_max_2d", column]),
+            float(data.loc["cl_min_2d", column]),
+            start,
+            len(polar),
+        )
+        polars.append(polar)
+        start += len(polar)
+
+    if polars:
+        return index, np.concatenate(polars)
+
+    return index, np.zeros((0, len(POLAR_LABELS)))
+
+
+def convert_csv_polars(folder_path: Optional[str] = None) -> Dict[str, int]:
+    """
+    Converts the .csv polar files of a folder to the binary format, the .csv files are left
+    untouched. Files already converted are skipped.
+
+    :param folder_path: folder containing the .csv files, defaults to the Xfoil resources.
+    :return: number of polars available in each converted store.
+    """
+    if folder_path is None:
+        # pylint: disable=import-outside-toplevel
+        from . import resources
+
+        folder_path = resources.__path__[0]
+
+    converted = {}
+    for csv_file_path in sorted(glob.glob(pth.join(folder_path, "*" + CSV_FILE_EXTENSION))):
+        # noinspection PyBroadException
+        try:
+            store = PolarStore(csv_file_path)
+            converted[pth.basename(store.store_path)] = len(store.read_index())
+        except Exception:
+            _LOGGER.warning("%s is not a polar file, skipped", csv_file_path)
+
+    return converted
+
+
+def _parse_csv_vector(value) -> np.ndarray:
+
+    value = str(value).strip()
+    if value.startswith("["):
+        value = value[1:-1]
+    if not value.strip():
+        return np.zeros(0)
+
+    return np.array(value.replace(",", " ").split(), dtype=float)
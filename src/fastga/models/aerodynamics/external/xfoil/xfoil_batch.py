@@ -0,0 +1,143 @@
+"""Concurrent computation of several airfoil polars with Xfoil."""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
+from openmdao.core.explicitcomponent import ExplicitComponent
+from openmdao.core.indepvarcomp import IndepVarComp
+from openmdao.core.problem import Problem
+
+from .polar_store import PolarStore
+from .xfoil_polar import XfoilPolar
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def run_xfoil_batch(
+    jobs: List[Tuple[dict, float, float]], max_workers: Optional[int] = None
+) -> int:
+    """
+    Computes the polars that are not saved yet for a list of jobs, running them concurrently.
+    Each job is computed by an XfoilPolar component in its own process and temporary directory,
+    and saved in the polar store of the airfoil, which is safe for concurrent processes. The
+    process-wide polar cache is then updated so that the XfoilPolar components using these
+    polars directly find them.
+
+    :param jobs: list of (options of the XfoilPolar component, Mach number, Reynolds number).
+    :param max_workers: maximum number of XFOIL runs at the same time, defaults to the number of
+    processors.
+    :return: number of polars computed.
+    """
+    missing_jobs = {}
+    for options, mach, reynolds in jobs:
+        # Same rounding as in XfoilPolar
+        mach = round(float(mach) * 1e4) / 1e4
+        reynolds = round(float(reynolds))
+        component = XfoilPolar(**options)
+        if component.options["single_AoA"]:
+            # Such polars are not saved
+            continue
+        polar_store = PolarStore(component.get_result_file_path())
+        job_key = (polar_store.store_path, mach, reynolds)
+        if job_key in missing_jobs:
+            continue
+        if polar_store.exists() and polar_store.load_table().search(mach, reynolds) is not None:
+            continue
+        missing_jobs[job_key] = (options, mach, reynolds)
+
+    if not missing_jobs:
+        return 0
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    computed_count = 0
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(missing_jobs))) as executor:
+        futures = {
+            job_key: executor.submit(_compute_polar, *job) for job_key, job in missing_jobs.items()
+        }
+        for (store_path, mach, reynolds), future in futures.items():
+            # noinspection PyBroadException
+            try:
+                future.result()
+                computed_count += 1
+            except Exception as error:
+                # The XfoilPolar component will try again and raise the error if needed
+                _LOGGER.warning(
+                    "XFOIL batch run failed for %s at Mach %f and Reynolds %d: %s",
+                    store_path,
+                    mach,
+                    reynolds,
+                    error,
+                )
+
+    for store_path in {job_key[0] for job_key in missing_jobs}:
+        PolarStore(store_path).load_table(reload=True)
+
+    return computed_count
+
+
+def _compute_polar(options: dict, mach: float, reynolds: float):
+    """Computes and saves one polar, run in a separate process."""
+    problem = Problem(reports=False)
+    ivc = IndepVarComp()
+    ivc.add_output("xfoil:mach", val=mach)
+    ivc.add_output("xfoil:reynolds", val=reynolds)
+    problem.model.add_subsystem("conditions", ivc, promotes=["*"])
+    problem.model.add_subsystem("polar", XfoilPolar(**options), promotes=["*"])
+    problem.setup()
+    problem.run_model()
+
+
+class XfoilPolarBatch(ExplicitComponent):
+    """
+    Computes concurrently the polars needed by several XfoilPolar components sharing the same
+    conditions, such as the sections of a propeller blade. To be placed before them so that they
+    find their polar already saved.
+    """
+
+    def initialize(self):
+
+        self.options.declare(
+            "polar_options_list",
+            default=[],
+            types=list,
+            desc="Options of the XfoilPolar components whose polars are computed",
+        )
+        self.options.declare(
+            "max_workers",
+            default=None,
+            types=int,
+            allow_none=True,
+            desc="Maximum number of XFOIL runs at the same time, defaults to the number of "
+            "processors",
+        )
+
+    def setup(self):
+
+        self.add_input("xfoil:mach", val=np.nan)
+        self.add_input("xfoil:reynolds", val=np.nan)
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+
+        run_xfoil_batch(
+            [
+                (options, float(inputs["xfoil:mach"]), float(inputs["xfoil:reynolds"]))
+                for options in self.options["polar_options_list"]
+            ],
+            max_workers=self.options["max_workers"],
+        )
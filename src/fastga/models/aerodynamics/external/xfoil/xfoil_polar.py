@@ -21,10 +21,9 @@ import warnings
 from importlib.resources import path
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
-import pandas as pd
 
 # noinspection PyProtectedMember
 from fastoad._utils.resource_management.copy import copy_resource
@@ -34,6 +33,7 @@ from openmdao.utils.file_wrap import InputFileGenerator
 from fastga.models.aerodynamics.external.xfoil import xfoil699
 from fastga.models.geometry.profiles.get_profile import get_profile
 from . import resources as local_resources
+from .polar_store import PolarStore
 from ...constants import POLAR_POINT_COUNT
 
 OPTION_RESULT_POLAR_FILENAME = "result_polar_filename"
@@ -89,6 +89,15 @@ class XfoilPolar(ExternalCodeComp):
             + OPTION_ALPHA_END
             + " must match",
         )
+        self.options.declare(
+            "xfoil_session",
+            default=False,
+            types=bool,
+            desc="If True, polars are computed by an XFOIL process kept open for the airfoil, "
+            "which is sent the commands of each new polar, instead of a new process run in a "
+            "temporary directory. XFOIL is then run once if the session fails. Output files are "
+            "not copied to the " + OPTION_RESULT_FOLDER_PATH + " in that case",
+        )
 
     def setup(self):
 
@@ -124,207 +133,17 @@ class XfoilPolar(ExternalCodeComp):
         # Get inputs and initialise outputs
         mach = round(float(inputs["xfoil:mach"]) * 1e4) / 1e4
         reynolds = round(float(inputs["xfoil:reynolds"]))
-        no_file = True
-        data_saved = None
         interpolated_result = None
-        if self.options[OPTION_COMP_NEG_AIR_SYM]:
-            result_file = pth.join(
-                pth.split(os.path.realpath(__file__))[0],
-                "resources",
-                self.options["airfoil_file"].replace(
-                    ".af", "_" + str(int(np.ceil(self.options[OPTION_ALPHA_END])))
-                )
-                + "S.csv",
-            )
-        else:
-            result_file = pth.join(
-                pth.split(os.path.realpath(__file__))[0],
-                "resources",
-                self.options["airfoil_file"].replace(".af", "") + ".csv",
-            )
-        if pth.exists(result_file) and not self.options["single_AoA"]:
-            # print('\n \n PATH EXISTS')
-            no_file = False
-            data_saved = pd.read_csv(result_file)
-            values = data_saved.to_numpy()[:, 1 : len(data_saved.to_numpy()[0])]
-            labels = data_saved.to_numpy()[:, 0].tolist()
-            data_saved = pd.DataFrame(values, index=labels)
-            saved_mach_list = data_saved.loc["mach", :].to_numpy().astype(float)
-            index_near_mach = np.where(abs(saved_mach_list - mach) < 0.03)[0]
-            near_mach = []
-            distance_to_mach = []
-            for index in index_near_mach:
-                if not (saved_mach_list[index] in near_mach):
-                    near_mach.append(saved_mach_list[index])
-                    distance_to_mach.append(abs(saved_mach_list[index] - mach))
-            if not near_mach:
-                index_mach = np.where(data_saved.loc["mach", :].to_numpy() == str(mach))[0]
-            else:
-                selected_mach_index = distance_to_mach.index(min(distance_to_mach))
-                index_mach = np.where(saved_mach_list == near_mach[selected_mach_index])[0]
-            data_reduced = data_saved.loc[labels, index_mach]
-            # Search if this exact reynolds has been computed and save results
-            reynolds_vect = np.array(
-                [float(x) for x in list(data_reduced.loc["reynolds", :].to_numpy())]
-            )
-            index_reynolds = index_mach[np.where(reynolds_vect == reynolds)[0]]
-
-            if len(index_reynolds) == 1:
-                interpolated_result = data_reduced.loc[labels, index_reynolds]
-            # Else search for lower/upper Reynolds
-            else:
-                lower_reynolds = reynolds_vect[np.where(reynolds_vect < reynolds)[0]]
-                upper_reynolds = reynolds_vect[np.where(reynolds_vect > reynolds)[0]]
-
-                if not (len(lower_reynolds) == 0 or len(upper_reynolds) == 0):
-                    index_lower_reynolds = index_mach[
-                        np.where(reynolds_vect == max(lower_reynolds))[0]
-                    ]
-                    index_upper_reynolds = index_mach[
-                        np.where(reynolds_vect == min(upper_reynolds))[0]
-                    ]
-                    lower_values = data_reduced.loc[labels, index_lower_reynolds]
-                    upper_values = data_reduced.loc[labels, index_upper_reynolds]
-                    # Initialise values with lower reynolds
-                    interpolated_result = lower_values
-                    # Calculate reynolds ratio split for linear interpolation
-                    x_ratio = (min(upper_reynolds) - reynolds) / (
-                        min(upper_reynolds) - max(lower_reynolds)
-                    )
-                    # Search for common alpha range for linear interpolation
-                    alpha_lower = (
-                        np.array(
-                            np.matrix(lower_values.loc["alpha", index_lower_reynolds].to_numpy()[0])
-                        )
-                        .ravel()
-                        .tolist()
-                    )
-                    alpha_upper = (
-                        np.array(
-                            np.matrix(upper_values.loc["alpha", index_upper_reynolds].to_numpy()[0])
-                        )
-                        .ravel()
-                        .tolist()
-                    )
-                    alpha_shared = np.array(list(set(alpha_upper).intersection(alpha_lower)))
-                    interpolated_result.loc["alpha", index_lower_reynolds] = str(
-                        alpha_shared.tolist()
-                    )
-                    labels.remove("alpha")
-                    # Calculate average values (cd, cl...) with linear interpolation
-                    for label in labels:
-                        lower_value = np.array(
-                            np.matrix(lower_values.loc[label, index_lower_reynolds].to_numpy()[0])
-                        ).ravel()
-                        upper_value = np.array(
-                            np.matrix(upper_values.loc[label, index_upper_reynolds].to_numpy()[0])
-                        ).ravel()
-                        # If values relative to alpha vector, performs interpolation with shared
-                        # vector
-                        if np.size(lower_value) == len(alpha_lower):
-                            lower_value = np.interp(
-                                alpha_shared, np.array(alpha_lower), lower_value
-                            )
-                            upper_value = np.interp(
-                                alpha_shared, np.array(alpha_upper), upper_value
-                            )
-                        value = (lower_value * x_ratio + upper_value * (1 - x_ratio)).tolist()
-                        interpolated_result.loc[label, index_lower_reynolds] = str(value)
+        polar_store = PolarStore(self.get_result_file_path())
+        if polar_store.exists() and not self.options["single_AoA"]:
+            interpolated_result = self._search_saved_polar(polar_store, mach, reynolds)
 
         if interpolated_result is None:
-            # Create result folder first (if it must fail, let it fail as soon as possible)
-            result_folder_path = self.options[OPTION_RESULT_FOLDER_PATH]
-            if result_folder_path != "":
-                os.makedirs(result_folder_path, exist_ok=True)
-
-            # Pre-processing (populating temp directory)
-            # XFoil exe
-            tmp_directory = self._create_tmp_directory()
-            if self.options[OPTION_XFOIL_EXE_PATH]:
-                # if a path for Xfoil has been provided, simply use it
-                self.options["command"] = [self.options[OPTION_XFOIL_EXE_PATH]]
-            else:
-                # otherwise, copy the embedded resource in tmp dir
-                # noinspection PyTypeChecker
-                copy_resource(xfoil699, XFOIL_EXE_NAME, tmp_directory.name)
-                self.options["command"] = [pth.join(tmp_directory.name, XFOIL_EXE_NAME)]
-
-            # I/O files
-            self.stdin = pth.join(tmp_directory.name, _INPUT_FILE_NAME)
-            self.stdout = pth.join(tmp_directory.name, _STDOUT_FILE_NAME)
-            self.stderr = pth.join(tmp_directory.name, _STDERR_FILE_NAME)
-
-            # profile file
-            tmp_profile_file_path = pth.join(tmp_directory.name, _TMP_PROFILE_FILE_NAME)
-            profile = get_profile(
-                airfoil_folder_path=self.options["airfoil_folder_path"],
-                file_name=self.options["airfoil_file"],
-            ).get_sides()
-            # noinspection PyTypeChecker
-            np.savetxt(
-                tmp_profile_file_path,
-                profile.to_numpy(),
-                fmt="%.15f",
-                delimiter=" ",
-                header="Wing",
-                comments="",
-            )
-
-            # standard input file
-            tmp_result_file_path = pth.join(tmp_directory.name, _TMP_RESULT_FILE_NAME)
-            self._write_script_file(
-                reynolds,
-                mach,
-                tmp_profile_file_path,
-                tmp_result_file_path,
-                self.options[OPTION_ALPHA_START],
-                self.options[OPTION_ALPHA_END],
-                ALPHA_STEP,
-            )
-
-            # Run XFOIL
-            # print('\n\n I have to run XFOIL HERE \n\n')
-            self.options["external_input_files"] = [self.stdin, tmp_profile_file_path]
-            self.options["external_output_files"] = [tmp_result_file_path]
-            # noinspection PyBroadException
-            try:
-                super().compute(inputs, outputs)
-                result_array_p = self._read_polar(tmp_result_file_path)
-            except:
-                # catch the error and try to read result file for non-convergence on higher angles
-                error = sys.exc_info()[1]
-                try:
-                    result_array_p = self._read_polar(tmp_result_file_path)
-                except:
-                    raise TimeoutError("<p>Error: %s</p>" % error)
-
-            if self.options[OPTION_COMP_NEG_AIR_SYM]:
-                os.remove(self.stdin)
-                os.remove(self.stdout)
-                os.remove(self.stderr)
-                os.remove(tmp_result_file_path)
-                alpha_start = min(-1 * self.options[OPTION_ALPHA_START], -ALPHA_STEP)
-                self._write_script_file(
-                    reynolds,
-                    mach,
-                    tmp_profile_file_path,
-                    tmp_result_file_path,
-                    alpha_start,
-                    -1 * self.options[OPTION_ALPHA_END],
-                    -ALPHA_STEP,
-                )
-                # noinspection PyBroadException
-                try:
-                    super().compute(inputs, outputs)
-                    result_array_n = self._read_polar(tmp_result_file_path)
-                except:
-                    # catch the error and try to read result file for non-convergence on higher
-                    # angles
-                    e = sys.exc_info()[1]
-                    try:
-                        result_array_n = self._read_polar(tmp_result_file_path)
-                    except:
-                        raise TimeoutError("<p>Error: %s</p>" % e)
+            result_array_p, result_array_n = None, None
+            if self.options["xfoil_session"]:
+                result_array_p, result_array_n = self._run_xfoil_session(reynolds, mach)
+            if result_array_p is None:
+                result_array_p, result_array_n = self._run_xfoil(inputs, outputs, reynolds, mach)
 
             # Post-processing
             if self.options["single_AoA"]:
@@ -387,99 +206,53 @@ class XfoilPolar(ExternalCodeComp):
 
                 # Save results to defined path
                 if not error:
-                    results = [
-                        np.array(mach),
-                        np.array(reynolds),
-                        np.array(cl_max_2d),
-                        np.array(cl_min_2d),
-                        str(self._reshape(alpha, alpha).tolist()),
-                        str(self._reshape(alpha, cl).tolist()),
-                        str(self._reshape(alpha, cd).tolist()),
-                        str(self._reshape(alpha, cdp).tolist()),
-                        str(self._reshape(alpha, cm).tolist()),
-                    ]
-                    labels = [
-                        "mach",
-                        "reynolds",
-                        "cl_max_2d",
-                        "cl_min_2d",
-                        "alpha",
-                        "cl",
-                        "cd",
-                        "cdp",
-                        "cm",
-                    ]
-                    if no_file or (data_saved is None):
-                        data = pd.DataFrame(results, index=labels)
-                    else:
-                        data = pd.DataFrame(np.c_[data_saved, results], index=labels)
                     # noinspection PyBroadException
                     try:
-                        data.to_csv(result_file)
+                        polar_store.append(
+                            mach,
+                            reynolds,
+                            cl_max_2d,
+                            cl_min_2d,
+                            {
+                                "alpha": self._reshape(alpha, alpha),
+                                "cl": self._reshape(alpha, cl),
+                                "cd": self._reshape(alpha, cd),
+                                "cdp": self._reshape(alpha, cdp),
+                                "cm": self._reshape(alpha, cm),
+                            },
+                        )
                     except:
                         warnings.warn(
-                            "Unable to save XFoil results to *.csv file: writing permission denied for "
+                            "Unable to save XFoil results: writing permission denied for "
                             "%s folder!" % local_resources.__path__[0]
                         )
 
-            # Getting output files if needed
-            if self.options[OPTION_RESULT_FOLDER_PATH] != "":
-                if pth.exists(tmp_result_file_path):
-                    polar_file_path = pth.join(
-                        result_folder_path, self.options[OPTION_RESULT_POLAR_FILENAME]
-                    )
-                    shutil.move(tmp_result_file_path, polar_file_path)
-
-                if pth.exists(self.stdout):
-                    stdout_file_path = pth.join(result_folder_path, _STDOUT_FILE_NAME)
-                    shutil.move(self.stdout, stdout_file_path)
-
-                if pth.exists(self.stderr):
-                    stderr_file_path = pth.join(result_folder_path, _STDERR_FILE_NAME)
-                    shutil.move(self.stderr, stderr_file_path)
-            # Try to delete the temp directory, if process not finished correctly try to
-            # close files before removing directory for second attempt
-            # noinspection PyBroadException
-            try:
-                tmp_directory.cleanup()
-            except:
-                for file_path in os.listdir(tmp_directory.name):
-                    if os.path.isfile(file_path):
-                        # noinspection PyBroadException
-                        try:
-                            file = os.open(file_path, os.O_WRONLY)
-                            os.close(file)
-                        except:
-                            _LOGGER.info("Error while trying to close %s file!", file_path)
-                # noinspection PyBroadException
-                try:
-                    tmp_directory.cleanup()
-                except:
-                    _LOGGER.info(
-                        "Error while trying to erase %s temporary directory!", tmp_directory.name
-                    )
-
         else:
             # Extract results
-            cl_max_2d = np.array(
-                np.matrix(interpolated_result.loc["cl_max_2d", :].to_numpy()[0])
-            ).ravel()
-            cl_min_2d = np.array(
-                np.matrix(interpolated_result.loc["cl_min_2d", :].to_numpy()[0])
-            ).ravel()
-            ALPHA = np.array(np.matrix(interpolated_result.loc["alpha", :].to_numpy()[0])).ravel()
-            CL = np.array(np.matrix(interpolated_result.loc["cl", :].to_numpy()[0])).ravel()
-            CD = np.array(np.matrix(interpolated_result.loc["cd", :].to_numpy()[0])).ravel()
-            CDP = np.array(np.matrix(interpolated_result.loc["cdp", :].to_numpy()[0])).ravel()
-            CM = np.array(np.matrix(interpolated_result.loc["cm", :].to_numpy()[0])).ravel()
+            cl_max_2d = interpolated_result["cl_max_2d"]
+            cl_min_2d = interpolated_result["cl_min_2d"]
+            ALPHA = interpolated_result["alpha"]
+            CL = interpolated_result["cl"]
+            CD = interpolated_result["cd"]
+            CDP = interpolated_result["cdp"]
+            CM = interpolated_result["cm"]
 
             # Modify vector length if necessary
             if POLAR_POINT_COUNT < len(ALPHA):
                 alpha = np.linspace(ALPHA[0], ALPHA[-1], POLAR_POINT_COUNT)
-                cl = np.interp(alpha, ALPHA, CL)
-                cd = np.interp(alpha, ALPHA, CD)
-                cdp = np.interp(alpha, ALPHA, CDP)
-                cm = np.interp(alpha, ALPHA, CM)
+                polar_table = polar_store.load_table()
+                if polar_table.has_polar(mach, reynolds):
+                    # Polar saved at these conditions, read at all the new angles at once
+                    interpolated_coefficients = polar_table.interpolate(mach, reynolds, alpha)
+                    cl = interpolated_coefficients["cl"]
+                    cd = interpolated_coefficients["cd"]
+                    cdp = interpolated_coefficients["cdp"]
+                    cm = interpolated_coefficients["cm"]
+                else:
+                    cl = np.interp(alpha, ALPHA, CL)
+                    cd = np.interp(alpha, ALPHA, CD)
+                    cdp = np.interp(alpha, ALPHA, CDP)
+                    cm = np.interp(alpha, ALPHA, CM)
             else:
                 additional_zeros = list(np.zeros(POLAR_POINT_COUNT - len(ALPHA)))
                 alpha = ALPHA.tolist()
@@ -513,6 +286,229 @@ class XfoilPolar(ExternalCodeComp):
             outputs["xfoil:CL_max_2D"] = cl_max_2d
             outputs["xfoil:CL_min_2D"] = cl_min_2d
 
+    def _run_xfoil(self, inputs, outputs, reynolds: float, mach: float):
+        """
+        Runs XFOIL in a new process with the executable copied in a temporary directory.
+
+        :return: positive and negative (None if not computed) angle polars.
+        """
+        result_array_n = None
+        # Create result folder first (if it must fail, let it fail as soon as possible)
+        result_folder_path = self.options[OPTION_RESULT_FOLDER_PATH]
+        if result_folder_path != "":
+            os.makedirs(result_folder_path, exist_ok=True)
+
+        # Pre-processing (populating temp directory)
+        # XFoil exe
+        tmp_directory = self._create_tmp_directory()
+        if self.options[OPTION_XFOIL_EXE_PATH]:
+            # if a path for Xfoil has been provided, simply use it
+            self.options["command"] = [self.options[OPTION_XFOIL_EXE_PATH]]
+        else:
+            # otherwise, copy the embedded resource in tmp dir
+            # noinspection PyTypeChecker
+            copy_resource(xfoil699, XFOIL_EXE_NAME, tmp_directory.name)
+            self.options["command"] = [pth.join(tmp_directory.name, XFOIL_EXE_NAME)]
+
+        # I/O files
+        self.stdin = pth.join(tmp_directory.name, _INPUT_FILE_NAME)
+        self.stdout = pth.join(tmp_directory.name, _STDOUT_FILE_NAME)
+        self.stderr = pth.join(tmp_directory.name, _STDERR_FILE_NAME)
+
+        # profile file
+        tmp_profile_file_path = pth.join(tmp_directory.name, _TMP_PROFILE_FILE_NAME)
+        profile = get_profile(
+            airfoil_folder_path=self.options["airfoil_folder_path"],
+            file_name=self.options["airfoil_file"],
+        ).get_sides()
+        # noinspection PyTypeChecker
+        np.savetxt(
+            tmp_profile_file_path,
+            profile.to_numpy(),
+            fmt="%.15f",
+            delimiter=" ",
+            header="Wing",
+            comments="",
+        )
+
+        # standard input file
+        tmp_result_file_path = pth.join(tmp_directory.name, _TMP_RESULT_FILE_NAME)
+        self._write_script_file(
+            reynolds,
+            mach,
+            tmp_profile_file_path,
+            tmp_result_file_path,
+            self.options[OPTION_ALPHA_START],
+            self.options[OPTION_ALPHA_END],
+            ALPHA_STEP,
+        )
+
+        # Run XFOIL
+        # print('\n\n I have to run XFOIL HERE \n\n')
+        self.options["external_input_files"] = [self.stdin, tmp_profile_file_path]
+        self.options["external_output_files"] = [tmp_result_file_path]
+        # noinspection PyBroadException
+        try:
+            super().compute(inputs, outputs)
+            result_array_p = self._read_polar(tmp_result_file_path)
+        except:
+            # catch the error and try to read result file for non-convergence on higher angles
+            error = sys.exc_info()[1]
+            try:
+                result_array_p = self._read_polar(tmp_result_file_path)
+            except:
+                raise TimeoutError("<p>Error: %s</p>" % error)
+
+        if self.options[OPTION_COMP_NEG_AIR_SYM]:
+            os.remove(self.stdin)
+            os.remove(self.stdout)
+            os.remove(self.stderr)
+            os.remove(tmp_result_file_path)
+            alpha_start = min(-1 * self.options[OPTION_ALPHA_START], -ALPHA_STEP)
+            self._write_script_file(
+                reynolds,
+                mach,
+                tmp_profile_file_path,
+                tmp_result_file_path,
+                alpha_start,
+                -1 * self.options[OPTION_ALPHA_END],
+                -ALPHA_STEP,
+            )
+            # noinspection PyBroadException
+            try:
+                super().compute(inputs, outputs)
+                result_array_n = self._read_polar(tmp_result_file_path)
+            except:
+                # catch the error and try to read result file for non-convergence on higher
+                # angles
+                e = sys.exc_info()[1]
+                try:
+                    result_array_n = self._read_polar(tmp_result_file_path)
+                except:
+                    raise TimeoutError("<p>Error: %s</p>" % e)
+
+        # Getting output files if needed
+        if self.options[OPTION_RESULT_FOLDER_PATH] != "":
+            if pth.exists(tmp_result_file_path):
+                polar_file_path = pth.join(
+                    result_folder_path, self.options[OPTION_RESULT_POLAR_FILENAME]
+                )
+                shutil.move(tmp_result_file_path, polar_file_path)
+
+            if pth.exists(self.stdout):
+                stdout_file_path = pth.join(result_folder_path, _STDOUT_FILE_NAME)
+                shutil.move(self.stdout, stdout_file_path)
+
+            if pth.exists(self.stderr):
+                stderr_file_path = pth.join(result_folder_path, _STDERR_FILE_NAME)
+                shutil.move(self.stderr, stderr_file_path)
+        # Try to delete the temp directory, if process not finished correctly try to
+        # close files before removing directory for second attempt
+        # noinspection PyBroadException
+        try:
+            tmp_directory.cleanup()
+        except:
+            for file_path in os.listdir(tmp_directory.name):
+                if os.path.isfile(file_path):
+                    # noinspection PyBroadException
+                    try:
+                        file = os.open(file_path, os.O_WRONLY)
+                        os.close(file)
+                    except:
+                        _LOGGER.info("Error while trying to close %s file!", file_path)
+            # noinspection PyBroadException
+            try:
+                tmp_directory.cleanup()
+            except:
+                _LOGGER.info(
+                    "Error while trying to erase %s temporary directory!", tmp_directory.name
+                )
+
+        return result_array_p, result_array_n
+
+    def _run_xfoil_session(self, reynolds: float, mach: float):
+        """
+        Runs XFOIL in the session of the process for the airfoil.
+
+        :return: positive and negative (None if not computed) angle polars, None if the session
+        failed.
+        """
+        # pylint: disable=import-outside-toplevel
+        from .xfoil_session import XfoilSession
+
+        session = XfoilSession.get_session(
+            self.options["airfoil_file"],
+            airfoil_folder_path=self.options["airfoil_folder_path"],
+            xfoil_exe_path=self.options[OPTION_XFOIL_EXE_PATH],
+        )
+        # noinspection PyBroadException
+        try:
+            result_array_p = session.compute_polar(
+                reynolds,
+                mach,
+                self.options[OPTION_ALPHA_START],
+                self.options[OPTION_ALPHA_END],
+                ALPHA_STEP,
+                iter_limit=self.options[OPTION_ITER_LIMIT],
+                timeout=self.options["timeout"],
+            )
+            result_array_n = None
+            if self.options[OPTION_COMP_NEG_AIR_SYM]:
+                result_array_n = session.compute_polar(
+                    reynolds,
+                    mach,
+                    min(-1 * self.options[OPTION_ALPHA_START], -ALPHA_STEP),
+                    -1 * self.options[OPTION_ALPHA_END],
+                    -ALPHA_STEP,
+                    iter_limit=self.options[OPTION_ITER_LIMIT],
+                    timeout=self.options["timeout"],
+                )
+        except Exception as error:
+            _LOGGER.warning("XFOIL session failed, running XFOIL once instead: %s", error)
+            return None, None
+
+        if np.size(result_array_p) == 0 or (
+            result_array_n is not None and np.size(result_array_n) == 0
+        ):
+            return None, None
+
+        return result_array_p, result_array_n
+
+    def get_result_file_path(self) -> str:
+        """Returns the path of the results saved for the airfoil and the angle range."""
+        if self.options[OPTION_COMP_NEG_AIR_SYM]:
+            return pth.join(
+                pth.split(os.path.realpath(__file__))[0],
+                "resources",
+                self.options["airfoil_file"].replace(
+                    ".af", "_" + str(int(np.ceil(self.options[OPTION_ALPHA_END])))
+                )
+                + "S.csv",
+            )
+
+        return pth.join(
+            pth.split(os.path.realpath(__file__))[0],
+            "resources",
+            self.options["airfoil_file"].replace(".af", "") + ".csv",
+        )
+
+    @staticmethod
+    def _search_saved_polar(
+        polar_store: PolarStore, mach: float, reynolds: float
+    ) -> Optional[dict]:
+        """
+        Searches the saved polars in the process-wide cache, which is updated from disk before
+        concluding that a polar is not available.
+
+        :return: dictionary of the polar vectors and 2D lift extrema, None if not available.
+        """
+        result = polar_store.load_table().search(mach, reynolds)
+        if result is None:
+            # Polars may have been saved by other processes in the meantime
+            result = polar_store.load_table(reload=True).search(mach, reynolds)
+
+        return result
+
     def _write_script_file(
         self,
         reynolds,
@@ -0,0 +1,258 @@
+"""Long-lived Xfoil processes, reused for the successive polars of an airfoil."""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import atexit
+import logging
+import os
+import os.path as pth
+import queue
+import subprocess
+import threading
+import time
+from typing import Optional
+
+import numpy as np
+
+# noinspection PyProtectedMember
+from fastoad._utils.resource_management.copy import copy_resource
+
+from fastga.models.aerodynamics.external.xfoil import xfoil699
+from fastga.models.geometry.profiles.get_profile import get_profile
+from .xfoil_polar import XFOIL_EXE_NAME, XfoilPolar, _TMP_PROFILE_FILE_NAME
+
+# Printed by XFOIL when the polar accumulation is switched off, i.e. once the polar file is closed
+END_OF_POLAR_MESSAGE = "Polar accumulation disabled"
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class XfoilSession:
+    """
+    XFOIL process kept running with an airfoil loaded, to which the commands of successive polar
+    computations are sent through its standard input. The executable is copied and the profile
+    written once, when the session starts.
+
+    Sessions are shared by the process through get_session, one per executable and airfoil, and
+    closed when the process ends. A session whose XFOIL run timed out is closed and a new one is
+    started by the next call.
+    """
+
+    _sessions = {}
+    _sessions_lock = threading.Lock()
+
+    def __init__(
+        self,
+        airfoil_file: str,
+        airfoil_folder_path: Optional[str] = None,
+        xfoil_exe_path: Optional[str] = None,
+    ):
+        """
+        :param airfoil_file: name of the airfoil file.
+        :param airfoil_folder_path: folder of the airfoil file, defaults to the embedded profiles.
+        :param xfoil_exe_path: path of the XFOIL executable, defaults to the embedded one.
+        """
+        self.airfoil_file = airfoil_file
+        self.airfoil_folder_path = airfoil_folder_path
+        self.xfoil_exe_path = xfoil_exe_path
+        self.run_count = 0
+
+        self._lock = threading.Lock()
+        self._process = None
+        self._tmp_directory = None
+        self._output_lines = None
+
+    @classmethod
+    def get_session(
+        cls,
+        airfoil_file: str,
+        airfoil_folder_path: Optional[str] = None,
+        xfoil_exe_path: Optional[str] = None,
+    ) -> "XfoilSession":
+        """Returns the session of the process for the airfoil, created if needed."""
+        key = (airfoil_file, airfoil_folder_path, xfoil_exe_path or None)
+        with cls._sessions_lock:
+            if key not in cls._sessions:
+                cls._sessions[key] = cls(airfoil_file, airfoil_folder_path, xfoil_exe_path)
+            return cls._sessions[key]
+
+    @classmethod
+    def close_all(cls):
+        """Closes all the sessions of the process."""
+        with cls._sessions_lock:
+            for session in cls._sessions.values():
+                session.close()
+            cls._sessions.clear()
+
+    @property
+    def is_running(self) -> bool:
+        """True if the XFOIL process is alive."""
+        return self._process is not None and self._process.poll() is None
+
+    def start(self):
+        """Copies the executable if needed, writes the profile and loads it in a new process."""
+        self.close()
+        # noinspection PyProtectedMember
+        self._tmp_directory = XfoilPolar._create_tmp_directory()
+        if self.xfoil_exe_path:
+            command = [self.xfoil_exe_path]
+        else:
+            # noinspection PyTypeChecker
+            copy_resource(xfoil699, XFOIL_EXE_NAME, self._tmp_directory.name)
+            command = [pth.join(self._tmp_directory.name, XFOIL_EXE_NAME)]
+
+        profile_file_path = pth.join(self._tmp_directory.name, _TMP_PROFILE_FILE_NAME)
+        profile = get_profile(
+            airfoil_folder_path=self.airfoil_folder_path, file_name=self.airfoil_file
+        ).get_sides()
+        # noinspection PyTypeChecker
+        np.savetxt(
+            profile_file_path,
+            profile.to_numpy(),
+            fmt="%.15f",
+            delimiter=" ",
+            header="Wing",
+            comments="",
+        )
+
+        self._process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            cwd=self._tmp_directory.name,
+            universal_newlines=True,
+            bufsize=1,
+        )
+        # Output is read continuously so that XFOIL never blocks on a full pipe
+        self._output_lines = queue.Queue()
+        threading.Thread(
+            target=_read_output, args=(self._process.stdout, self._output_lines), daemon=True
+        ).start()
+
+        # Same settings as the script of a single run, viscous mode being switched on once since
+        # VISC toggles it
+        self._send(["PLOP", "G F", "", "LOAD", profile_file_path, "PANE", "GDES", "GSET", "EXEC"])
+        self._send(["", "OPER", "RE", "1000000", "VISC", ""])
+        self.run_count = 0
+
+    def compute_polar(
+        self,
+        reynolds: float,
+        mach: float,
+        alpha_start: float,
+        alpha_end: float,
+        step: float,
+        iter_limit: int = 100,
+        timeout: float = 15.0,
+    ) -> np.ndarray:
+        """
+        Computes a polar with the loaded airfoil. Boundary layers are initialized before the angle
+        sequence so that results do not depend on the previous runs.
+
+        :param reynolds: Reynolds number.
+        :param mach: Mach number.
+        :param alpha_start: first angle of attack in degrees.
+        :param alpha_end: last angle of attack in degrees.
+        :param step: angle of attack step in degrees.
+        :param iter_limit: maximum number of iterations per angle.
+        :param timeout: maximum duration of the run in seconds, the angles computed so far being
+        returned if it is exceeded.
+        :return: numpy array with XFoil polar results, see XfoilPolar._read_polar.
+        """
+        with self._lock:
+            if not self.is_running:
+                self.start()
+
+            self.run_count += 1
+            # Polar files are numbered to keep paths short and avoid appending to a previous one
+            polar_file_path = pth.join(self._tmp_directory.name, "p%d" % self.run_count)
+            if pth.exists(polar_file_path):
+                os.remove(polar_file_path)
+            self._send(
+                ["OPER", "RE", "%f" % reynolds, "M", "%f" % mach, "ITER", "%d" % iter_limit]
+                + ["INIT", "PACC", polar_file_path, ""]
+                + ["ASEQ", "%f" % alpha_start, "%f" % alpha_end, "%f" % step]
+                + ["PACC", ""]
+            )
+
+            if not self._wait_for(END_OF_POLAR_MESSAGE, timeout):
+                _LOGGER.warning(
+                    "XFOIL session for %s timed out, partial polar returned", self.airfoil_file
+                )
+                # Process is killed so that the polar file is closed, a new one is started by
+                # the next run
+                self._kill()
+
+            # noinspection PyProtectedMember
+            return XfoilPolar._read_polar(polar_file_path)
+
+    def close(self):
+        """Quits XFOIL and removes the session directory."""
+        if self._process is not None:
+            if self.is_running:
+                # noinspection PyBroadException
+                try:
+                    self._send(["", "", "QUIT"])
+                    self._process.wait(timeout=5.0)
+                except Exception:
+                    self._kill()
+            self._process = None
+        if self._tmp_directory is not None:
+            # noinspection PyBroadException
+            try:
+                self._tmp_directory.cleanup()
+            except Exception:
+                _LOGGER.info(
+                    "Error while trying to erase %s temporary directory!", self._tmp_directory.name
+                )
+            self._tmp_directory = None
+
+    def _send(self, commands):
+
+        self._process.stdin.write("\n".join(commands) + "\n")
+        self._process.stdin.flush()
+
+    def _wait_for(self, message: str, timeout: float) -> bool:
+        """Waits until XFOIL prints the message, returns False on timeout or if XFOIL stopped."""
+        end_time = time.time() + timeout
+        while True:
+            remaining_time = end_time - time.time()
+            if remaining_time <= 0.0:
+                return False
+            try:
+                line = self._output_lines.get(timeout=remaining_time)
+            except queue.Empty:
+                return False
+            if line is None:
+                return False
+            if message in line:
+                return True
+
+    def _kill(self):
+
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+            self._process = None
+
+
+def _read_output(stream, output_lines: queue.Queue):
+    """Puts the lines printed by XFOIL in the queue, None marking the end of the process."""
+    for line in iter(stream.readline, ""):
+        output_lines.put(line)
+    stream.close()
+    output_lines.put(None)
+
+
+atexit.register(XfoilSession.close_all)
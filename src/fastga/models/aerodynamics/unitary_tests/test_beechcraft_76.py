@@ -24,10 +24,28 @@ from .test_functions import (
     cd0_high_speed,
     cd0_low_speed,
     polar,
+    polar_store,
+    polar_cache,
+    polar_batch_saved,
+    polar_batch,
+    polar_session_fallback,
+    polar_session,
     airfoil_slope_wt_xfoil,
     airfoil_slope_xfoil,
     comp_high_speed,
     comp_low_speed,
+    vlm_aic_vectorized,
+    vlm_geometry_cache,
+    vlm_wing_sweep,
+    vlm_result_store,
+    vlm_mach_interpolation_parallel,
+    openvsp_workspace,
+    openvsp_case_workers,
+    openvsp_sweep,
+    propeller_pitch_vectorized,
+    propeller_table_workers,
+    propeller_pitch_continuation,
+    propeller_map_store,
     hinge_moment_2d,
     hinge_moment_3d,
     hinge_moments,
@@ -176,6 +194,44 @@ def test_polar_with_ext_folder():
     )
 
 
+def test_polar_store():
+    """Tests the binary storage of the saved polars."""
+    polar_store("naca23012_20S.csv", mach=0.1179, reynolds=2746999 * 1.549)
+
+
+def test_polar_cache():
+    """Tests the process-wide cache of the saved polars."""
+    polar_cache("naca23012_20S.csv", mach=0.1179, reynolds=2746999 * 1.549)
+
+
+def test_polar_batch_saved():
+    """Tests that the batch runner does not run XFOIL for saved polars."""
+    polar_batch_saved(mach=0.1179, reynolds=2746999 * 1.549)
+
+
+@pytest.mark.skipif(
+    system() != "Windows" and xfoil_path is None or SKIP_STEPS,
+    reason="No XFOIL executable available",
+)
+def test_polar_batch():
+    """Tests the concurrent computation of polars (XFOIL)."""
+    polar_batch(XML_FILE, mach=0.1179, reynolds=2746999 * 1.549)
+
+
+def test_polar_session_fallback():
+    """Tests that XFOIL is run once if its session cannot start."""
+    polar_session_fallback()
+
+
+@pytest.mark.skipif(
+    system() != "Windows" and xfoil_path is None or SKIP_STEPS,
+    reason="No XFOIL executable available",
+)
+def test_polar_session():
+    """Tests the polars computed by a persistent XFOIL session."""
+    polar_session(XML_FILE, mach=0.1179, reynolds=2746999 * 1.549)
+
+
 @pytest.mark.skipif(
     system() != "Windows" and xfoil_path is None or SKIP_STEPS,
     reason="No XFOIL executable available (or skipped)",
@@ -362,6 +418,66 @@ def test_vlm_comp_low_speed():
     )
 
 
+def test_vlm_aic_vectorized():
+    """Tests vectorized vlm influence matrices against the loop computation."""
+    vlm_aic_vectorized(XML_FILE)
+
+
+def test_vlm_geometry_cache():
+    """Tests the reuse of vlm geometries between computations."""
+    vlm_geometry_cache(XML_FILE)
+
+
+def test_vlm_wing_sweep():
+    """Tests the batched vlm wing computation."""
+    vlm_wing_sweep(XML_FILE)
+
+
+def test_vlm_result_store():
+    """Tests the storage of vlm results."""
+    vlm_result_store(XML_FILE)
+
+
+def test_vlm_mach_interpolation_parallel():
+    """Tests the parallel computation of the vlm mach interpolation."""
+    vlm_mach_interpolation_parallel(XML_FILE)
+
+
+def test_openvsp_workspace():
+    """Tests the working directories of openvsp computations."""
+    openvsp_workspace()
+
+
+def test_openvsp_case_workers():
+    """Tests the parallel run of openvsp cases."""
+    openvsp_case_workers()
+
+
+def test_openvsp_sweep():
+    """Tests the mach sweeps of openvsp computations."""
+    openvsp_sweep(XML_FILE)
+
+
+def test_propeller_pitch_vectorized():
+    """Tests the simultaneous computation of the propeller elements and pitches."""
+    propeller_pitch_vectorized(XML_FILE)
+
+
+def test_propeller_table_workers():
+    """Tests the parallel computation of the propeller tables."""
+    propeller_table_workers(XML_FILE)
+
+
+def test_propeller_pitch_continuation():
+    """Tests the warm start and early termination of the propeller pitch sweeps."""
+    propeller_pitch_continuation(XML_FILE)
+
+
+def test_propeller_map_store():
+    """Tests the reuse of the computed propeller maps."""
+    propeller_map_store(XML_FILE)
+
+
 @pytest.mark.skipif(
     system() != "Windows" or SKIP_STEPS, reason="OPENVSP is windows dependent platform (or skipped)"
 )
@@ -28,6 +28,11 @@ from .test_functions import (
     airfoil_slope_xfoil,
     comp_high_speed,
     comp_low_speed,
+    vlm_aic_vectorized,
+    vlm_geometry_cache,
+    vlm_wing_sweep,
+    vlm_result_store,
+    vlm_mach_interpolation_parallel,
     hinge_moment_2d,
     hinge_moment_3d,
     hinge_moments,
@@ -363,6 +368,31 @@ def test_vlm_comp_low_speed():
     )
 
 
+def test_vlm_aic_vectorized():
+    """Tests vectorized vlm influence matrices against the loop computation."""
+    vlm_aic_vectorized(XML_FILE)
+
+
+def test_vlm_geometry_cache():
+    """Tests the reuse of vlm geometries between computations."""
+    vlm_geometry_cache(XML_FILE)
+
+
+def test_vlm_wing_sweep():
+    """Tests the batched vlm wing computation."""
+    vlm_wing_sweep(XML_FILE)
+
+
+def test_vlm_result_store():
+    """Tests the storage of vlm results."""
+    vlm_result_store(XML_FILE)
+
+
+def test_vlm_mach_interpolation_parallel():
+    """Tests the parallel computation of the vlm mach interpolation."""
+    vlm_mach_interpolation_parallel(XML_FILE)
+
+
 @pytest.mark.skipif(
     system() != "Windows" or SKIP_STEPS, reason="OPENVSP is windows dependent platform (or skipped)"
 )
@@ -24,7 +24,9 @@ from platform import system
 from tempfile import TemporaryDirectory
 
 import numpy as np
+import pandas as pd
 import pytest
+from stdatm import Atmosphere
 
 from fastga.models.aerodynamics.aerodynamics_high_speed import AerodynamicsHighSpeed
 from fastga.models.aerodynamics.aerodynamics_low_speed import AerodynamicsLowSpeed
@@ -100,21 +102,53 @@ from fastga.models.aerodynamics.components.vt import (
 )
 from fastga.models.aerodynamics.external.propeller_code.compute_propeller_aero import (
     ComputePropellerPerformance,
+    PITCH_PTS_NB,
+    SPEED_PTS_NB,
+    _ComputePropellerPerformance,
+    _thrust_decrease_index,
+)
+from fastga.models.aerodynamics.external.propeller_code.propeller_map_store import (
+    PropellerMapStore,
 )
 from fastga.models.aerodynamics.external.openvsp import ComputeAEROopenvsp
+from fastga.models.aerodynamics.external.openvsp.openvsp import (
+    OPENVSPSimpleGeometry,
+    VSPAERO_EXE_NAME,
+    _read_lod_file,
+    _read_polar_file,
+    _sweep_case_indices,
+)
+from fastga.models.aerodynamics.external.openvsp.openvsp_workspace import OpenVSPWorkspace
 from fastga.models.aerodynamics.external.openvsp.compute_aero_slipstream import (
     ComputeSlipstreamOpenvsp,
 )
 from fastga.models.aerodynamics.external.vlm import ComputeAEROvlm
+from fastga.models.aerodynamics.external.vlm.vlm import VLMSimpleGeometry
+from fastga.models.aerodynamics.external.result_store import (
+    AeroResultStore,
+    GEOMETRY_SET_LABELS,
+    migrate_result_folder,
+)
 from fastga.models.aerodynamics.external.xfoil import resources
+from fastga.models.aerodynamics.external.xfoil.polar_store import (
+    DATA_FILE_EXTENSION,
+    INDEX_FILE_EXTENSION,
+    PolarStore,
+    convert_csv_polars,
+    read_csv_polars,
+)
+from fastga.models.aerodynamics.external.xfoil.xfoil_batch import run_xfoil_batch
 from fastga.models.aerodynamics.external.xfoil.xfoil_polar import XfoilPolar
+from fastga.models.aerodynamics.external.xfoil.xfoil_session import XfoilSession
 from fastga.models.aerodynamics.load_factor import LoadFactor
+from fastga.models.aerodynamics.constants import POLAR_POINT_COUNT
 from tests.testing_utilities import run_system, get_indep_var_comp, list_inputs
 from tests.xfoil_exe.get_xfoil import get_xfoil_path
 
 RESULTS_FOLDER = pth.join(pth.dirname(__file__), "results")
 DATA_FOLDER = pth.join(pth.dirname(__file__), "data")
 TMP_SAVE_FOLDER = "test_save"
+POLAR_RESULT_PATTERNS = ["*.csv", "*" + INDEX_FILE_EXTENSION, "*" + DATA_FILE_EXTENSION]
 xfoil_path = None if system() == "Windows" else get_xfoil_path()
 
 _LOGGER = logging.getLogger(__name__)
@@ -157,8 +191,13 @@ def polar_result_transfer():
     # results [need writing permission]
 
     tmp_folder = _create_tmp_directory()
+    PolarStore.clear_polar_cache()
 
-    files = glob.iglob(pth.join(resources.__path__[0], "*.csv"))
+    files = [
+        file
+        for pattern in POLAR_RESULT_PATTERNS
+        for file in glob.glob(pth.join(resources.__path__[0], pattern))
+    ]
 
     for file in files:
         if os.path.isfile(file):
@@ -176,7 +215,11 @@ def polar_result_retrieve(tmp_folder):
     # Retrieve the polar results set aside during the test duration if there are some [need
     # writing permission]
 
-    files = glob.iglob(pth.join(tmp_folder.name, "*.csv"))
+    files = [
+        file
+        for pattern in POLAR_RESULT_PATTERNS
+        for file in glob.glob(pth.join(tmp_folder.name, pattern))
+    ]
 
     for file in files:
         if os.path.isfile(file):
@@ -195,6 +238,7 @@ def polar_result_retrieve(tmp_folder):
                         "target directory " % (file, tmp_folder.name)
                     )
 
+    PolarStore.clear_polar_cache()
     tmp_folder.cleanup()
 
 
@@ -471,6 +515,190 @@ def polar_ext_folder(
     assert np.interp(1.0, cl, cdp) == pytest.approx(cdp_1_low_speed, abs=1e-4)
 
 
+def polar_store(polar_file: str, mach: float, reynolds: float):
+    """Tests the conversion of the saved polars to binary format and their reading."""
+    tmp_folder = _create_tmp_directory()
+    shutil.copy(pth.join(resources.__path__[0], polar_file), tmp_folder.name)
+    csv_index, csv_data = read_csv_polars(pth.join(tmp_folder.name, polar_file))
+
+    # Convert the .csv file, which is kept, and check that the saved polars are unchanged
+    store_name = polar_file.replace(".csv", "")
+    assert convert_csv_polars(tmp_folder.name) == {store_name: len(csv_index)}
+    assert pth.exists(pth.join(tmp_folder.name, polar_file))
+    store = PolarStore(pth.join(tmp_folder.name, store_name))
+    index = store.read_index()
+    assert np.all(index == csv_index)
+    last_polar = store.read_polar(index[-1])
+    assert np.all(last_polar["alpha"] == csv_data[-int(index["count"][-1]) :, 0])
+    assert np.all(last_polar["cm"] == csv_data[-int(index["count"][-1]) :, -1])
+
+    # A new polar is appended without modifying the saved data
+    with open(store.data_file_path, "rb") as file:
+        saved_data = file.read()
+    new_polar = {label: value + 1.0 for label, value in last_polar.items()}
+    store.append(mach, 1e9, 1.0, -1.0, new_polar)
+    with open(store.data_file_path, "rb") as file:
+        new_data = file.read()
+    assert new_data[: len(saved_data)] == saved_data
+    assert len(new_data) == len(saved_data) + 8 * 5 * len(last_polar["alpha"])
+    index = store.read_index()
+    assert len(index) == len(csv_index) + 1
+    assert index[-1]["reynolds"] == 1e9
+    assert np.all(store.read_polar(index[-1])["cl"] == new_polar["cl"])
+
+    # Lower/upper Reynolds interpolation gives sorted and consistent polars
+    result = XfoilPolar._search_saved_polar(store, mach, reynolds)
+    assert np.all(np.diff(result["alpha"]) > 0.0)
+    assert len(result["cl"]) == len(result["alpha"])
+    assert XfoilPolar._search_saved_polar(store, mach + 0.5, reynolds) is None
+
+    tmp_folder.cleanup()
+
+
+def polar_cache(polar_file: str, mach: float, reynolds: float):
+    """Tests the process-wide polar cache and the vectorized interpolation of the polars."""
+    tmp_folder = _create_tmp_directory()
+    shutil.copy(pth.join(resources.__path__[0], polar_file), tmp_folder.name)
+    PolarStore.clear_polar_cache()
+
+    # Polars are read once and then shared by all the stores pointing to the same files
+    store = PolarStore(pth.join(tmp_folder.name, polar_file))
+    table = store.load_table()
+    assert PolarStore(pth.join(tmp_folder.name, polar_file)).load_table() is table
+    assert PolarStore.polar_cache_info() == {"hits": 1, "misses": 1, "size": 1}
+
+    # Vectorized interpolation matches the searched polars at the saved Mach numbers, for saved
+    # and interpolated Reynolds numbers
+    same_mach = table.mach == mach
+    assert table.has_polar(mach, table.reynolds[same_mach][0])
+    reynolds_vect = np.append(table.reynolds[same_mach][:3], reynolds)
+    for local_reynolds in reynolds_vect:
+        result = table.search(mach, local_reynolds)
+        interpolated_result = table.interpolate(mach, local_reynolds, result["alpha"])
+        np.testing.assert_allclose(interpolated_result["cl"], result["cl"], atol=1e-10)
+        np.testing.assert_allclose(interpolated_result["cd"], result["cd"], atol=1e-10)
+        np.testing.assert_allclose(interpolated_result["cm"], result["cm"], atol=1e-10)
+    # Points are interpolated all at once, the result being linear in Mach between saved ones
+    other_mach = np.min(table.mach[table.mach > mach])
+    alpha_vect = np.linspace(-5.0, 15.0, 5)
+    interpolated_result = table.interpolate(
+        np.array([[mach], [other_mach], [(mach + other_mach) / 2.0]]), reynolds, alpha_vect
+    )
+    assert np.shape(interpolated_result["cl"]) == (3, 5)
+    assert np.all(np.isfinite(interpolated_result["cl"]))
+    np.testing.assert_allclose(
+        interpolated_result["cl"][2],
+        (interpolated_result["cl"][0] + interpolated_result["cl"][1]) / 2.0,
+        atol=1e-10,
+    )
+    assert np.all(np.isnan(table.interpolate(mach + 0.5, reynolds, alpha_vect)["cl"]))
+
+    # Saving a polar invalidates the loaded polars
+    store.append(mach, 1e9, 1.0, -1.0, store.read_polar(table.index[0]))
+    new_table = store.load_table()
+    assert new_table is not table
+    assert len(new_table.index) == len(table.index) + 1
+    assert new_table.search(mach, 1e9)["cl_max_2d"] == 1.0
+
+    PolarStore.clear_polar_cache()
+    tmp_folder.cleanup()
+
+
+def polar_batch_saved(mach: float, reynolds: float):
+    """Tests that the batch runner only computes the polars that are not saved."""
+    PolarStore.clear_polar_cache()
+    polar_options = dict(airfoil_file="naca23012.af", alpha_end=20.0, activate_negative_angle=True)
+    jobs = [(polar_options, mach, reynolds), (polar_options, mach + 1e-6, reynolds + 0.1)]
+
+    assert run_xfoil_batch(jobs) == 0
+    # The saved polars are now loaded for the XfoilPolar components
+    assert PolarStore.polar_cache_info()["size"] == 1
+
+
+def polar_batch(
+    XML_FILE: str,
+    mach: float,
+    reynolds: float,
+):
+    """Tests the concurrent computation of polars (XFOIL) and their use by XfoilPolar."""
+    # Transfer saved polar results to temporary folder
+    tmp_folder = polar_result_transfer()
+
+    airfoil_files = ["naca23012.af", "naca0012.af"]
+    polar_options_list = [
+        dict(
+            airfoil_file=airfoil_file,
+            alpha_end=20.0,
+            activate_negative_angle=True,
+            iter_limit=20,
+            xfoil_exe_path=xfoil_path,
+        )
+        for airfoil_file in airfoil_files
+    ]
+    assert run_xfoil_batch(
+        [(polar_options, mach, reynolds) for polar_options in polar_options_list], max_workers=2
+    ) == len(airfoil_files)
+
+    # XfoilPolar components find the computed polars in the cache
+    for polar_options in polar_options_list:
+        ivc = get_indep_var_comp(list_inputs(XfoilPolar()), __file__, XML_FILE)
+        ivc.add_output("xfoil:mach", mach)
+        ivc.add_output("xfoil:reynolds", reynolds)
+        misses = PolarStore.polar_cache_info()["misses"]
+        problem = run_system(XfoilPolar(**polar_options), ivc)
+        assert PolarStore.polar_cache_info()["misses"] == misses
+        assert problem["xfoil:CL_max_2D"] > 1.0
+
+    # Retrieve polar results from temporary folder
+    polar_result_retrieve(tmp_folder)
+
+
+def polar_session_fallback():
+    """Tests that polars are computed by a single XFOIL run if the session cannot start."""
+    xfoil_comp = XfoilPolar(
+        xfoil_session=True, xfoil_exe_path=pth.join(DATA_FOLDER, "missing_xfoil.exe")
+    )
+    assert xfoil_comp._run_xfoil_session(1e6, 0.1) == (None, None)
+    XfoilSession.close_all()
+
+
+def polar_session(
+    XML_FILE: str,
+    mach: float,
+    reynolds: float,
+):
+    """Tests that the XFOIL session gives the same polars as single XFOIL runs."""
+    results = {}
+    for xfoil_session in [False, True]:
+        # Transfer saved polar results to temporary folder
+        tmp_folder = polar_result_transfer()
+
+        cl_max_2d = []
+        for local_reynolds in [reynolds, 1.5 * reynolds]:
+            ivc = get_indep_var_comp(list_inputs(XfoilPolar()), __file__, XML_FILE)
+            ivc.add_output("xfoil:mach", mach)
+            ivc.add_output("xfoil:reynolds", local_reynolds)
+            xfoil_comp = XfoilPolar(
+                alpha_end=20.0,
+                activate_negative_angle=True,
+                iter_limit=20,
+                xfoil_exe_path=xfoil_path,
+                xfoil_session=xfoil_session,
+            )
+            problem = run_system(xfoil_comp, ivc)
+            cl_max_2d.append(problem["xfoil:CL_max_2D"])
+        results[xfoil_session] = cl_max_2d
+
+        # Retrieve polar results from temporary folder
+        polar_result_retrieve(tmp_folder)
+
+    # The same process computed the two Reynolds numbers
+    session = XfoilSession.get_session("naca23012.af", xfoil_exe_path=xfoil_path)
+    assert session.run_count == 4
+    XfoilSession.close_all()
+    assert np.array(results[True]) == pytest.approx(np.array(results[False]), abs=1e-3)
+
+
 def airfoil_slope_wt_xfoil(
     XML_FILE: str,
     wing_airfoil_file: str,
@@ -756,6 +984,595 @@ def comp_low_speed(
     assert np.max(np.abs(cl_vector_htp - cl)) <= 1e-3
 
 
+def vlm_geometry(XML_FILE: str):
+    """Returns a VLM geometry component and its inputs, read from the .xml file!"""
+    # Research independent input value in .xml file, airfoil polar are replaced by simple
+    # polars so that all the aircraft can be tested
+    polar_names = [
+        "data:aerodynamics:wing:low_speed:CL",
+        "data:aerodynamics:wing:low_speed:CDp",
+        "data:aerodynamics:horizontal_tail:low_speed:CL",
+        "data:aerodynamics:horizontal_tail:low_speed:CDp",
+    ]
+    input_names = [
+        name
+        for name in list_inputs(VLMSimpleGeometry(low_speed_aero=True))
+        if name not in polar_names
+    ]
+    ivc = get_indep_var_comp(input_names, __file__, XML_FILE)
+    ivc.add_output(polar_names[0], val=np.linspace(-0.5, 1.5, POLAR_POINT_COUNT))
+    ivc.add_output(polar_names[1], val=np.full(POLAR_POINT_COUNT, 0.01))
+    ivc.add_output(polar_names[2], val=np.linspace(-0.5, 1.5, POLAR_POINT_COUNT))
+    ivc.add_output(polar_names[3], val=np.full(POLAR_POINT_COUNT, 0.01))
+
+    # noinspection PyTypeChecker
+    problem = run_system(VLMSimpleGeometry(low_speed_aero=True), ivc)
+    vlm = problem.model.component
+    inputs = {
+        name: problem.get_val(name, units=meta["units"])
+        for name, meta in vlm.get_io_metadata(iotypes="input", metadata_keys=["units"]).items()
+    }
+
+    return vlm, inputs
+
+
+def vlm_aic_vectorized(XML_FILE: str):
+    """Tests the vectorized computation of the VLM influence matrices against the loop one!"""
+    vlm, inputs = vlm_geometry(XML_FILE)
+
+    vlm.options["vectorized_aic"] = True
+    vlm._run(inputs)
+    wing_vectorized = vlm.wing
+    htp_vectorized = vlm.htp
+
+    vlm.options["vectorized_aic"] = False
+    vlm._run(inputs)
+
+    # Only round-off differences are expected
+    assert np.max(np.abs(wing_vectorized["aic"] - vlm.wing["aic"])) <= 1e-12
+    assert np.max(np.abs(wing_vectorized["aic_wake"] - vlm.wing["aic_wake"])) <= 1e-12
+    assert np.max(np.abs(htp_vectorized["aic"] - vlm.htp["aic"])) <= 1e-12
+    assert np.max(np.abs(htp_vectorized["aic_wake"] - vlm.htp["aic_wake"])) <= 1e-12
+
+
+def vlm_geometry_cache(XML_FILE: str):
+    """Tests the reuse of the VLM geometries and of the factorized influence matrices!"""
+    vlm, inputs = vlm_geometry(XML_FILE)
+    VLMSimpleGeometry.clear_geometry_cache()
+
+    wing_reference = vlm.compute_wing(inputs, 0.0, 0.12, 10.0, use_airfoil=False)
+    assert VLMSimpleGeometry.geometry_cache_info()["misses"] == 1
+
+    # Other angles of attack, flaps angle and mach should not regenerate the geometry and the
+    # solution with the factorized matrix should match the one with the explicit inverse
+    for aoa_angle, flaps_angle, mach in [(10.0, 0.0, 0.12), (0.0, 10.0, 0.12), (5.0, 0.0, 0.3)]:
+        wing = vlm.compute_wing(inputs, 0.0, mach, aoa_angle, flaps_angle, use_airfoil=False)
+        v_inf = max(Atmosphere(0.0, altitude_in_feet=False).speed_of_sound * mach, 0.01)
+        alpha = vlm.wing["panel_angle_vect"] + aoa_angle * np.pi / 180.0
+        gamma = -np.dot(np.linalg.inv(vlm.wing["aic"]), alpha) * v_inf
+        c_p = -2.0 / v_inf * gamma / vlm.wing["panel_chord"]
+        panel_surf = vlm.wing["panel_surf"]
+        assert wing["cl"] == pytest.approx(-np.sum(c_p * panel_surf) / np.sum(panel_surf), rel=1e-9)
+    assert wing_reference["cl"] == pytest.approx(
+        vlm.compute_wing(inputs, 0.0, 0.12, 10.0, use_airfoil=False)["cl"], rel=1e-12
+    )
+
+    cache_info = VLMSimpleGeometry.geometry_cache_info()
+    assert cache_info["misses"] == 1
+    assert cache_info["hits"] == 4
+    assert cache_info["size"] == 1
+
+    # A different geometry is a miss
+    inputs["data:geometry:wing:span"] = inputs["data:geometry:wing:span"] * 1.1
+    vlm.compute_wing(inputs, 0.0, 0.12, 10.0, use_airfoil=False)
+    cache_info = VLMSimpleGeometry.geometry_cache_info()
+    assert cache_info["misses"] == 2
+    assert cache_info["size"] == 2
+
+
+def vlm_wing_sweep(XML_FILE: str):
+    """Tests the batched VLM wing computation against the case by case one!"""
+    vlm, inputs = vlm_geometry(XML_FILE)
+
+    aoa_angles = np.array([0.0, 5.0, 10.0, 5.0])
+    flaps_angles = np.array([0.0, 0.0, 10.0, 30.0])
+    wing_sweep = vlm.compute_wing_sweep(inputs, 0.0, 0.12, aoa_angles, flaps_angles)
+    assert np.shape(wing_sweep["cl"]) == (4,)
+    assert np.shape(wing_sweep["cl_vector"]) == (4, len(wing_sweep["y_vector"]))
+
+    for idx, (aoa_angle, flaps_angle) in enumerate(zip(aoa_angles, flaps_angles)):
+        wing = vlm.compute_wing(inputs, 0.0, 0.12, aoa_angle, flaps_angle)
+        assert wing_sweep["cl"][idx] == pytest.approx(wing["cl"], rel=1e-9)
+        assert wing_sweep["cdi"][idx] == pytest.approx(wing["cdi"], rel=1e-9)
+        assert wing_sweep["cm"][idx] == pytest.approx(wing["cm"], rel=1e-9)
+        assert wing_sweep["coef_e"][idx] == pytest.approx(wing["coef_e"], rel=1e-9)
+        assert wing_sweep["cl_vector"][idx] == pytest.approx(wing["cl_vector"], rel=1e-9)
+        assert wing_sweep["y_vector"] == pytest.approx(wing["y_vector"], rel=1e-12)
+        assert wing_sweep["chord_vector"] == pytest.approx(wing["chord_vector"], rel=1e-12)
+
+
+def vlm_result_store(XML_FILE: str):
+    """Tests the storage of the VLM results and the import of the .csv results!"""
+    vlm, inputs = vlm_geometry(XML_FILE)
+
+    # Create result temporary directory
+    results_folder = _create_tmp_directory()
+    vlm.options["result_folder_path"] = results_folder.name
+
+    # Second computation should read the values saved during the first one, htp values being
+    # scaled with the saved area ratio which is rounded
+    computed_values = vlm.compute_aero_coeff(inputs, 0.0, 0.12, 10.0)
+    assert pth.exists(pth.join(results_folder.name, "vlm_results.db"))
+    saved_values = vlm.compute_aero_coeff(inputs, 0.0, 0.12, 10.0)
+    for computed_value, saved_value in zip(computed_values, saved_values):
+        assert np.array(saved_value) == pytest.approx(np.array(computed_value), rel=1e-4)
+
+    # Results saved in .csv files by previous versions
+    geometry_set = np.array([0.0, 0.8, 7.9, 3.0, -2.0, 5.0, 0.6, 4.2, 0.12, 0.2])
+    pd.DataFrame(geometry_set, index=GEOMETRY_SET_LABELS).to_csv(
+        pth.join(results_folder.name, "geometry_0.csv")
+    )
+    pd.DataFrame(
+        [0.1, [0.0, 0.5, 1.0, 0.0], 0.05], index=["cl_0_wing", "y_vector_wing", "coef_k_wing"]
+    ).to_csv(pth.join(results_folder.name, "vlm_0.csv"))
+    assert migrate_result_folder(results_folder.name) == {"vlm": 1, "openvsp": 0}
+
+    # Area ratio is not part of the searched geometry
+    geometry_set[-1] = 0.25
+    results, saved_area_ratio = AeroResultStore(results_folder.name, "vlm").search(geometry_set)
+    assert saved_area_ratio == pytest.approx(0.2, abs=1e-12)
+    assert results["cl_0_wing"] == pytest.approx(0.1, abs=1e-12)
+    assert results["y_vector_wing"] == pytest.approx([0.0, 0.5, 1.0, 0.0], abs=1e-12)
+    geometry_set[0] = 1.0
+    results, _ = AeroResultStore(results_folder.name, "vlm").search(geometry_set)
+    assert results is None
+
+    # Remove existing result files
+    results_folder.cleanup()
+
+
+def vlm_mach_interpolation_parallel(XML_FILE: str):
+    """Tests the parallel computation of the VLM Mach interpolation against the sequential one!"""
+    vlm, inputs = vlm_geometry(XML_FILE)
+
+    mach_interp, cl_alpha_interp = vlm.compute_cl_alpha_mach(inputs, 10.0, 0.0, 0.2)
+
+    vlm.options["mach_interpolation_workers"] = 2
+    mach_interp_parallel, cl_alpha_interp_parallel = vlm.compute_cl_alpha_mach(
+        inputs, 10.0, 0.0, 0.2
+    )
+    assert mach_interp_parallel == pytest.approx(mach_interp, rel=1e-12)
+    assert cl_alpha_interp_parallel == pytest.approx(cl_alpha_interp, rel=1e-9)
+
+
+def openvsp_workspace():
+    """Tests that OpenVSP is installed once and that each computation gets its own folder."""
+    OpenVSPWorkspace.clear_workspaces()
+    workspace = OpenVSPWorkspace.get_workspace()
+    assert OpenVSPWorkspace.get_workspace("") is workspace
+
+    run_directories = [workspace.create_run_directory() for _ in range(3)]
+    assert len(set(run_directories)) == 3
+    assert workspace.install_count == 1
+    for run_directory in run_directories:
+        assert pth.dirname(run_directory) == workspace.install_directory
+        assert not os.listdir(run_directory)
+    assert pth.exists(pth.join(workspace.install_directory, VSPAERO_EXE_NAME))
+    for run_directory in run_directories:
+        workspace.release_run_directory(run_directory)
+        assert not pth.exists(run_directory)
+
+    # Installation is done again if removed
+    install_directory = workspace.install_directory
+    OpenVSPWorkspace.clear_workspaces()
+    assert not pth.exists(install_directory)
+    workspace = OpenVSPWorkspace.get_workspace()
+    workspace.release_run_directory(workspace.create_run_directory())
+    assert workspace.install_count == 1
+
+    # The specified executable folder is the working directory and is kept
+    tmp_folder = _create_tmp_directory()
+    workspace = OpenVSPWorkspace.get_workspace(tmp_folder.name)
+    run_directory = workspace.create_run_directory()
+    assert run_directory == pth.abspath(tmp_folder.name)
+    assert pth.exists(pth.join(run_directory, VSPAERO_EXE_NAME))
+    workspace.release_run_directory(run_directory)
+    assert pth.exists(run_directory)
+    OpenVSPWorkspace.clear_workspaces()
+    tmp_folder.cleanup()
+
+
+class _OpenvspCaseRecorder(OPENVSPSimpleGeometry):
+    """Returns the case and the process that ran it instead of running OpenVSP."""
+
+    def compute_wing_sweep(self, inputs, outputs, altitude, mach_list, aoa_list):
+        return "wing", aoa_list, os.getpid()
+
+    def compute_aircraft_sweep(self, inputs, outputs, altitude, mach_list, aoa_list):
+        return "aircraft", aoa_list, os.getpid()
+
+    def compute_isolated_htp_sweep(self, inputs, outputs, altitude, mach_list, aoa_list):
+        return "htp", aoa_list, os.getpid()
+
+
+def openvsp_case_workers():
+    """Tests that the independent openvsp cases are run in parallel processes, in order."""
+    cases = [
+        ("compute_wing_sweep", [0.0]),
+        ("compute_wing_sweep", [0.0, 10.0]),
+        ("compute_aircraft_sweep", [0.0, 10.0]),
+        ("compute_isolated_htp_sweep", [10.0]),
+    ]
+    expected_cases = [
+        ("wing", [0.0]),
+        ("wing", [0.0, 10.0]),
+        ("aircraft", [0.0, 10.0]),
+        ("htp", [10.0]),
+    ]
+
+    component = _OpenvspCaseRecorder(openvsp_case_workers=2)
+    results = component.compute_cases({}, None, 0.0, [0.2, 0.3], cases)
+    assert [result[:2] for result in results] == expected_cases
+    assert os.getpid() not in [result[2] for result in results]
+
+    # Sequential run, also used when cases share the specified executable folder
+    for options in [{}, {"openvsp_case_workers": 2, "openvsp_exe_path": DATA_FOLDER}]:
+        component = _OpenvspCaseRecorder(**options)
+        results = component.compute_cases({}, None, 0.0, [0.2, 0.3], cases)
+        assert results == [case + (os.getpid(),) for case in expected_cases]
+
+
+def _analytic_loads(mach: float, aoa_angle: float) -> dict:
+    """Simple wing loads, used instead of OpenVSP results."""
+    cl = (0.1 + 0.08 * aoa_angle) / np.sqrt(1.0 - mach ** 2)
+    return {
+        "y_vector": list(np.linspace(0.1, 5.0, 20)),
+        "cl_vector": list(np.full(20, cl)),
+        "chord_vector": list(np.linspace(1.5, 1.0, 20)),
+        "cl": cl,
+        "cdi": 0.05 * cl ** 2,
+        "cm": -0.1 * cl,
+        "coeff_e": 0.9 - 0.1 * mach,
+    }
+
+
+class _OpenvspSweepRecorder(OPENVSPSimpleGeometry):
+    """Returns simple loads instead of running OpenVSP and counts the runs."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.run_count = 0
+
+    def compute(self, inputs, outputs):
+        pass
+
+    def compute_wing_sweep(self, inputs, outputs, altitude, mach_list, aoa_list):
+        self.run_count += 1
+        return [_analytic_loads(mach, aoa) for mach in mach_list for aoa in aoa_list]
+
+    def compute_aircraft_sweep(self, inputs, outputs, altitude, mach_list, aoa_list):
+        self.run_count += 1
+        return [
+            (_analytic_loads(mach, aoa), _analytic_loads(mach, 0.5 * aoa), {})
+            for mach in mach_list
+            for aoa in aoa_list
+        ]
+
+    def compute_isolated_htp_sweep(self, inputs, outputs, altitude, mach_list, aoa_list):
+        self.run_count += 1
+        return [_analytic_loads(mach, 0.8 * aoa) for mach in mach_list for aoa in aoa_list]
+
+
+def openvsp_sweep(XML_FILE: str):
+    """Tests the mach sweeps of openvsp computations and the reading of their results."""
+    # Cases are found whatever the order of the .polar file
+    tmp_folder = _create_tmp_directory()
+    lod_file_path = pth.join(tmp_folder.name, "wing.lod")
+    polar_file_path = pth.join(tmp_folder.name, "wing.polar")
+    component_header = "Comp Component-Name Mach AoA Beta CL CDi CS CFx CFy CFz Cmx Cmy Cmz\n"
+    with open(lod_file_path, "w") as file_stream:
+        for cl in [0.5, 0.1]:
+            file_stream.write("Wing S Xavg Yavg Zavg Chord V/Vref Cl Cd Cs Cx Cy Cz Cmx Cmy Cmz\n")
+            for y in [1.0, 2.0]:
+                values = [1, 0.0, y, 1.5, 0.0, cl, 0.01, 0.0, 0.0, 0.0, 0.0, 0.0, -0.1]
+                file_stream.write(" ".join(str(value) for value in values) + "\n")
+            file_stream.write("\n" + component_header)
+            for side in ["Left", "Right"]:
+                values = ["0.2", "10.0", "0.0", str(cl / 2.0), "0.001", "0.0"]
+                values += ["0.0", "0.0", "0.0", "0.0", "-0.05", "0.0"]
+                file_stream.write("1 Wing_" + side + " " + " ".join(values) + "\n")
+            file_stream.write("\n")
+    with open(polar_file_path, "w") as file_stream:
+        file_stream.write("Beta Mach AoA Re/1e6 CL CDo CDi CDtot CS L/D E CFx\n")
+        file_stream.write("0.0 0.2 10.0 5.0 0.5 0.01 0.002 0.012 0.0 40.0 0.85 0.0\n")
+        file_stream.write("0.0 0.2 0.0 5.0 0.1 0.01 0.001 0.011 0.0 10.0 0.95 0.0\n")
+    lod_cases = _read_lod_file(lod_file_path)
+    polar_header, polar_rows = _read_polar_file(polar_file_path)
+    assert len(lod_cases) == 2 and len(polar_rows) == 2
+    strips, components = lod_cases[0]
+    assert [float(line[2]) for line in strips["1"]] == [1.0, 2.0]
+    assert float(components[0][5]) + float(components[1][5]) == pytest.approx(0.5, abs=1e-12)
+    assert _sweep_case_indices(polar_header, polar_rows, [0.2], [0.0, 10.0]) == [1, 0]
+    tmp_folder.cleanup()
+
+    # Sweeps give the same results as single computations, with one run per geometry
+    ivc = get_indep_var_comp(list_inputs(OPENVSPSimpleGeometry()), __file__, XML_FILE)
+    problem = run_system(_OpenvspSweepRecorder(), ivc)
+    component = problem.model.component
+    inputs = {
+        name: problem.get_val(name, units=meta["units"])
+        for name, meta in component.get_io_metadata(
+            iotypes="input", metadata_keys=["units"]
+        ).items()
+    }
+    mach_list = [0.1, 0.2, 0.3]
+    aero_coeff_list = component.compute_aero_coeff_sweep(inputs, None, 0.0, mach_list, 10.0)
+    assert component.run_count == 3
+    for mach, aero_coeff in zip(mach_list, aero_coeff_list):
+        single_aero_coeff = component.compute_aero_coeff(inputs, None, 0.0, mach, 10.0)
+        for value, single_value in zip(aero_coeff, single_aero_coeff):
+            assert np.array(value) == pytest.approx(np.array(single_value), rel=1e-12)
+    assert component.run_count == 12
+
+    # Only the mach numbers without saved results are computed
+    results_folder = _create_tmp_directory()
+    component.options["result_folder_path"] = results_folder.name
+    component.compute_aero_coeff(inputs, None, 0.0, 0.2, 10.0)
+    component.run_count = 0
+    saved_aero_coeff_list = component.compute_aero_coeff_sweep(inputs, None, 0.0, mach_list, 10.0)
+    assert component.run_count == 3
+    component.compute_aero_coeff_sweep(inputs, None, 0.0, mach_list, 10.0)
+    assert component.run_count == 3
+    for aero_coeff, saved_aero_coeff in zip(aero_coeff_list, saved_aero_coeff_list):
+        for value, saved_value in zip(aero_coeff, saved_aero_coeff):
+            assert np.array(saved_value) == pytest.approx(np.array(value), rel=1e-5)
+    results_folder.cleanup()
+
+
+def _propeller_ivc(XML_FILE: str, options: dict):
+    """Inputs of the propeller performance computation with the saved naca4430 polar."""
+    tmp_folder = _create_tmp_directory()
+    shutil.copy(pth.join(resources.__path__[0], "naca4430_30S.csv"), tmp_folder.name)
+    polar = PolarStore(pth.join(tmp_folder.name, "naca4430_30S.csv")).load_table().search(0.0, 1e6)
+    PolarStore.clear_polar_cache()
+    tmp_folder.cleanup()
+
+    ivc = get_indep_var_comp(
+        list_inputs(_ComputePropellerPerformance(**options)), __file__, XML_FILE
+    )
+    for name, key in [("alpha", "alpha"), ("CL", "cl"), ("CD", "cd")]:
+        values = np.zeros(POLAR_POINT_COUNT)
+        values[: len(polar[key])] = polar[key]
+        ivc.add_output(
+            "naca4430_polar:" + name, val=values, units="deg" if name == "alpha" else None
+        )
+
+    return ivc
+
+
+def propeller_pitch_vectorized(XML_FILE: str):
+    """Tests the simultaneous computation of the blade elements and pitches of the propeller."""
+    options = dict(
+        sections_profile_name_list=["naca4430"],
+        sections_profile_position_list=[0.0],
+        elements_number=5,
+    )
+    ivc = _propeller_ivc(XML_FILE, options)
+    problem = run_system(_ComputePropellerPerformance(**options), ivc)
+    component = problem.model.component
+    inputs = {
+        name: problem.get_val(name, units=meta["units"])
+        for name, meta in component.get_io_metadata(
+            iotypes="input", metadata_keys=["units"]
+        ).items()
+    }
+
+    radius_min = inputs["data:geometry:propeller:hub_diameter"] / 2.0
+    radius_max = inputs["data:geometry:propeller:diameter"] / 2.0
+    element_length = (radius_max - radius_min) / options["elements_number"]
+    radius = radius_min + (np.arange(options["elements_number"]) + 0.5) * element_length
+    alpha_element, cl_element, cd_element = component.reshape_polar(
+        inputs["naca4430_polar:alpha"], inputs["naca4430_polar:CL"], inputs["naca4430_polar:CD"]
+    )
+    alpha_list = np.tile(alpha_element, (len(radius), 1))
+    cl_list = np.tile(cl_element, (len(radius), 1))
+    cd_list = np.tile(cd_element, (len(radius), 1))
+    omega = inputs["data:geometry:propeller:average_rpm"]
+    v_inf = 50.0
+    component.compute_extreme_pitch(inputs, v_inf)
+    theta_vect = np.linspace(component.theta_min, component.theta_max, 8)
+
+    # All pitches at once give the same results as one pitch at a time
+    thrust_vect, eta_vect, torque_vect = component.compute_pitch_performance(
+        inputs, theta_vect, v_inf, 0.0, omega, radius, alpha_list, cl_list, cd_list
+    )
+    for thrust, eta, torque, theta_75 in zip(thrust_vect, eta_vect, torque_vect, theta_vect):
+        assert (thrust, eta, torque) == pytest.approx(
+            component.compute_pitch_performance(
+                inputs, theta_75, v_inf, 0.0, omega, radius, alpha_list, cl_list, cd_list
+            ),
+            rel=1e-9,
+        )
+
+    # Induced speeds solve BEM vs. disk theory equations for all the elements
+    atm = Atmosphere(0.0, altitude_in_feet=False)
+    theta = np.tile(np.linspace(20.0, 30.0, len(radius)), (2, 1))
+    speed_vect = np.ones((2,) + theta.shape)
+    args = (
+        radius,
+        radius_min,
+        radius_max,
+        np.full_like(radius, 0.15),
+        2.0,
+        np.zeros_like(radius),
+        omega * np.pi / 30.0,
+        v_inf,
+        theta,
+        alpha_list,
+        cl_list,
+        cd_list,
+        atm,
+        inputs["reference_reynolds"],
+    )
+    speed_vect = component.solve_induced_speeds(speed_vect, *args)
+    assert np.max(np.abs(component.delta(speed_vect, *args))) < 1e-6
+    for idx in range(len(radius)):
+        residual = component.delta(
+            speed_vect[:, 0, idx],
+            radius[idx],
+            radius_min,
+            radius_max,
+            0.15,
+            2.0,
+            0.0,
+            omega * np.pi / 30.0,
+            v_inf,
+            theta[0, idx],
+            alpha_element,
+            cl_element,
+            cd_element,
+            atm,
+            inputs["reference_reynolds"],
+        )
+        assert residual == pytest.approx(np.zeros(2), abs=1e-6)
+
+
+def propeller_table_workers(XML_FILE: str):
+    """Tests that the propeller tables computed in parallel are the sequential ones."""
+    options = dict(
+        sections_profile_name_list=["naca4430"],
+        sections_profile_position_list=[0.0],
+        elements_number=5,
+    )
+    problem = run_system(_ComputePropellerPerformance(**options), _propeller_ivc(XML_FILE, options))
+    parallel_problem = run_system(
+        _ComputePropellerPerformance(table_workers=3, **options), _propeller_ivc(XML_FILE, options)
+    )
+    for level in ["sea_level", "cruise_level"]:
+        for name in ["efficiency", "thrust", "thrust_limit", "speed"]:
+            variable_name = "data:aerodynamics:propeller:" + level + ":" + name
+            assert parallel_problem[variable_name] == pytest.approx(
+                problem[variable_name], rel=1e-6
+            )
+    assert np.all(np.diff(problem["data:aerodynamics:propeller:sea_level:thrust_limit"]) > 0.0)
+
+
+class _PropellerPeakThrust(_ComputePropellerPerformance):
+    """Propeller whose thrust peaks at the 41st pitch of the sweeps."""
+
+    def solve_pitch_performance(
+        self,
+        inputs,
+        theta_75,
+        v_inf,
+        altitude,
+        omega,
+        radius,
+        alpha_list,
+        cl_list,
+        cd_list,
+        initial_speed_vect=None,
+    ):
+        theta_75 = np.ravel(theta_75)
+        theta_peak = self.theta_min + 40.0 / (PITCH_PTS_NB - 1) * (self.theta_max - self.theta_min)
+        thrust = 1000.0 - (theta_75 - theta_peak) ** 2.0
+        eta = np.full_like(theta_75, 0.5)
+
+        return thrust, eta, thrust, np.zeros((2, len(theta_75), len(radius)))
+
+
+def propeller_pitch_continuation(XML_FILE: str):
+    """Tests the warm start of the propeller pitch sweeps and their early termination."""
+    # End of the useful pitches is found as soon as the next points can not change it
+    thrust_vect = 1000.0 - (np.arange(PITCH_PTS_NB) - 40.0) ** 2.0
+    thrust_vect[0:3] = [10.0, 5.0, 2.0]
+    assert _thrust_decrease_index(thrust_vect) == 40
+    for points_nb in range(2, PITCH_PTS_NB):
+        idx_end = _thrust_decrease_index(thrust_vect[0:points_nb], complete=False)
+        assert idx_end == (40 if points_nb > 41 else None)
+    assert _thrust_decrease_index(np.arange(20.0)) is None
+
+    options = dict(
+        sections_profile_name_list=["naca4430"],
+        sections_profile_position_list=[0.0],
+        elements_number=5,
+    )
+    problem = run_system(_ComputePropellerPerformance(**options), _propeller_ivc(XML_FILE, options))
+    component = problem.model.component
+    solve_counts = component.solve_counts
+    assert solve_counts["solves"] == 2 * SPEED_PTS_NB * PITCH_PTS_NB * 5
+    # Only the first pitches of each altitude are not warm started
+    assert solve_counts["warm_starts"] == solve_counts["solves"] - 2 * 10 * 5
+    assert solve_counts["iterations"] > 0
+
+    # Warm start from another flight speed gives the solution of a cold start
+    inputs = {
+        name: problem.get_val(name, units=meta["units"])
+        for name, meta in component.get_io_metadata(
+            iotypes="input", metadata_keys=["units"]
+        ).items()
+    }
+    polar = component.compute_elements_polar(inputs)
+    omega = inputs["data:geometry:propeller:average_rpm"]
+    *_, speed_vect = component.compute_speed_performance(inputs, 30.0, 0.0, omega, *polar)
+    cold_performance = component.compute_speed_performance(inputs, 50.0, 0.0, omega, *polar)
+    warm_performance = component.compute_speed_performance(
+        inputs, 50.0, 0.0, omega, *polar, initial_speed_vect=speed_vect
+    )
+    for cold_value, warm_value in zip(cold_performance[0:3], warm_performance[0:3]):
+        assert np.array(warm_value) == pytest.approx(np.array(cold_value), rel=1e-6)
+
+    # Sweep is stopped at the end of the block where thrust decreases
+    component = _PropellerPeakThrust(**options)
+    thrust_vect, theta_vect, eta_vect, _ = component.compute_speed_performance(
+        inputs, 50.0, 0.0, omega, *polar
+    )
+    assert component.solve_counts["skipped_pitches"] == PITCH_PTS_NB - 50
+    assert len(thrust_vect) == len(theta_vect) == len(eta_vect) == 41
+    assert thrust_vect[-1] == pytest.approx(1000.0, abs=1e-9)
+
+
+def propeller_map_store(XML_FILE: str):
+    """Tests that the propeller maps computed for the same inputs are read."""
+    results_folder = _create_tmp_directory()
+    options = dict(
+        sections_profile_name_list=["naca4430"],
+        sections_profile_position_list=[0.0],
+        elements_number=5,
+        result_folder_path=results_folder.name,
+    )
+    problem = run_system(_ComputePropellerPerformance(**options), _propeller_ivc(XML_FILE, options))
+    assert problem.model.component.solve_counts["solves"] > 0
+
+    # Second computation skips BEM
+    saved_problem = run_system(
+        _ComputePropellerPerformance(**options), _propeller_ivc(XML_FILE, options)
+    )
+    assert saved_problem.model.component.solve_counts["solves"] == 0
+    for name in ["efficiency", "thrust", "thrust_limit", "speed"]:
+        for level in ["sea_level", "cruise_level"]:
+            variable_name = "data:aerodynamics:propeller:" + level + ":" + name
+            assert saved_problem[variable_name] == pytest.approx(problem[variable_name], rel=1e-12)
+
+    # Maps are identified by all their inputs and options
+    inputs = {
+        "data:geometry:propeller:chord_vect": np.array([0.11, 0.126, 0.141]),
+        "data:geometry:propeller:average_rpm": np.array([2500.0]),
+    }
+    key = PropellerMapStore.map_key("map", inputs, {"elements_number": 5})
+    assert PropellerMapStore.map_key("map", dict(inputs), {"elements_number": 5}) == key
+    assert PropellerMapStore.map_key("other_map", inputs, {"elements_number": 5}) != key
+    assert PropellerMapStore.map_key("map", inputs, {"elements_number": 6}) != key
+    inputs["data:geometry:propeller:chord_vect"] = np.array([0.11, 0.127, 0.141])
+    assert PropellerMapStore.map_key("map", inputs, {"elements_number": 5}) != key
+    map_store = PropellerMapStore(results_folder.name)
+    assert map_store.search(key) is None
+    map_store.save(key, "map", {"thrust": np.array([1.0, 2.0])})
+    assert map_store.search(key) == {"thrust": [1.0, 2.0]}
+
+    results_folder.cleanup()
+
+
 def hinge_moment_2d(XML_FILE: str, ch_alpha_2d: float, ch_delta_2d: float):
     """Tests tail hinge-moments"""
     # Research independent input value in .xml file
@@ -16,7 +16,7 @@
 import logging
 import pandas as pd
 from typing import Union, Sequence, Tuple, Optional
-from scipy.interpolate import interp2d
+from scipy.interpolate import RectBivariateSpline
 import os.path as pth
 import numpy as np
 
@@ -124,6 +124,12 @@ class BasicICEngine(AbstractFuelPropulsion):
         self.effective_efficiency_cruise = float(effective_efficiency_cruise)
         self.specific_shape = None
 
+        # Propeller efficiency and engine sfc interpolators, built at first use, see
+        # propeller_efficiency and sfc
+        self._propeller_efficiency_SL = None
+        self._propeller_efficiency_CL = None
+        self._sfc_interpolator = None
+
         # Evaluate engine volume based on max power @ 0.0m
         rpm_vect, pme_vect, pme_limit_vect, sfc_matrix = self.read_map(self.map_file_path)
         self.rpm_vect_ref = rpm_vect
@@ -407,64 +413,60 @@ class BasicICEngine(AbstractFuelPropulsion):
         # the change in advance ration is equal to a change in velocity
         installed_airspeed = atmosphere.true_airspeed * self.effective_J
 
-        propeller_efficiency_SL = interp2d(
-            self.thrust_SL,
-            self.speed_SL,
-            self.efficiency_SL * self.effective_efficiency_ls,  # Include the efficiency loss
-            # in here
-            kind="cubic",
+        propeller_efficiency_SL, propeller_efficiency_CL = self.propeller_efficiency_interpolators()
+        thrust_interp_SL = np.minimum(
+            np.maximum(np.min(self.thrust_SL), thrust),
+            np.interp(installed_airspeed, self.speed_SL, self.thrust_limit_SL),
         )
-        propeller_efficiency_CL = interp2d(
-            self.thrust_CL,
-            self.speed_CL,
-            self.efficiency_CL * self.effective_efficiency_cruise,  # Include the efficiency loss
-            # in here
-            kind="cubic",
+        thrust_interp_CL = np.minimum(
+            np.maximum(np.min(self.thrust_CL), thrust),
+            np.interp(installed_airspeed, self.speed_CL, self.thrust_limit_CL),
         )
-        if isinstance(atmosphere.true_airspeed, float):
-            thrust_interp_SL = np.minimum(
-                np.maximum(np.min(self.thrust_SL), thrust),
-                np.interp(installed_airspeed, self.speed_SL, self.thrust_limit_SL),
-            )
-            thrust_interp_CL = np.minimum(
-                np.maximum(np.min(self.thrust_CL), thrust),
-                np.interp(installed_airspeed, self.speed_CL, self.thrust_limit_CL),
-            )
-        else:
-            thrust_interp_SL = np.minimum(
-                np.maximum(np.min(self.thrust_SL), thrust),
-                np.interp(list(installed_airspeed), self.speed_SL, self.thrust_limit_SL),
-            )
-            thrust_interp_CL = np.minimum(
-                np.maximum(np.min(self.thrust_CL), thrust),
-                np.interp(list(installed_airspeed), self.speed_CL, self.thrust_limit_CL),
-            )
+        lower_bound = propeller_efficiency_SL.ev(installed_airspeed, thrust_interp_SL)
+        upper_bound = propeller_efficiency_CL.ev(installed_airspeed, thrust_interp_CL)
+        altitude = atmosphere.get_altitude(altitude_in_feet=False)
         if np.size(thrust) == 1:  # calculate for float
-            lower_bound = float(propeller_efficiency_SL(thrust_interp_SL, installed_airspeed))
-            upper_bound = float(propeller_efficiency_CL(thrust_interp_CL, installed_airspeed))
-            altitude = atmosphere.get_altitude(altitude_in_feet=False)
             propeller_efficiency = np.interp(
-                altitude, [0, self.cruise_altitude_propeller], [lower_bound, upper_bound]
+                altitude,
+                [0, self.cruise_altitude_propeller],
+                [float(lower_bound), float(upper_bound)],
             )
         else:  # calculate for array
-            propeller_efficiency = np.zeros(np.size(thrust))
-            for idx in range(np.size(thrust)):
-                lower_bound = propeller_efficiency_SL(
-                    thrust_interp_SL[idx], installed_airspeed[idx]
-                )
-                upper_bound = propeller_efficiency_CL(
-                    thrust_interp_CL[idx], installed_airspeed[idx]
-                )
-                altitude = atmosphere.get_altitude(altitude_in_feet=False)[idx]
-                propeller_efficiency[idx] = (
-                    lower_bound
-                    + (upper_bound - lower_bound)
-                    * np.minimum(altitude, self.cruise_altitude_propeller)
-                    / self.cruise_altitude_propeller
-                )
+            propeller_efficiency = (
+                lower_bound
+                + (upper_bound - lower_bound)
+                * np.minimum(altitude, self.cruise_altitude_propeller)
+                / self.cruise_altitude_propeller
+            )
 
         return propeller_efficiency
 
+    def propeller_efficiency_interpolators(
+        self,
+    ) -> Tuple[RectBivariateSpline, RectBivariateSpline]:
+        """
+        Returns the cubic interpolators of the propeller efficiency with respect to airspeed and
+        thrust at sea level and cruise level, installation losses included. They are built at
+        first call only, the propeller tables not being needed by the other computations.
+
+        :return: sea level and cruise level interpolators
+        """
+        if self._propeller_efficiency_SL is None:
+            self._propeller_efficiency_SL = RectBivariateSpline(
+                self.speed_SL,
+                self.thrust_SL,
+                self.efficiency_SL * self.effective_efficiency_ls,  # Include the efficiency loss
+                # in here
+            )
+            self._propeller_efficiency_CL = RectBivariateSpline(
+                self.speed_CL,
+                self.thrust_CL,
+                self.efficiency_CL * self.effective_efficiency_cruise,  # Include the efficiency
+                # loss in here
+            )
+
+        return self._propeller_efficiency_SL, self._propeller_efficiency_CL
+
     def compute_max_power(self, flight_points: oad.FlightPoint) -> Union[float, Sequence]:
         """
         Compute the ICE maximum power @ given flight-point.
@@ -492,13 +494,6 @@ class BasicICEngine(AbstractFuelPropulsion):
         :param atmosphere: Atmosphere instance at intended altitude
         :return: SFC (in g/kw) and Power (in W)
         """
-        # Load engine map and save interpolation formula
-        rpm_vect = self.rpm_vect_ref
-        pme_vect = self.pme_vect_ref
-        sfc_matrix = self.sfc_matrix_ref
-        torque_vect = pme_vect * 1e5 * self.volume / (8.0 * np.pi)
-        ICE_sfc = interp2d(torque_vect, rpm_vect, sfc_matrix, kind="cubic")
-
         # Define RPM & mixture using engine settings
         if np.size(engine_setting) == 1:
             rpm_values = self.rpm_values[int(engine_setting)]
@@ -511,33 +506,38 @@ class BasicICEngine(AbstractFuelPropulsion):
                 [self.mixture_values[engine_setting[idx]] for idx in range(np.size(engine_setting))]
             )
 
-        # Compute sfc @ 2500RPM
-        real_power = np.zeros(np.size(thrust))
-        torque = np.zeros(np.size(thrust))
-        sfc = np.zeros(np.size(thrust))
+        # Compute sfc @ 2500RPM, the propeller efficiency of flight point arrays being evaluated at
+        # the altitude in feet read as meters
         if np.size(thrust) == 1:
-            real_power = (
-                thrust * atmosphere.true_airspeed / self.propeller_efficiency(thrust, atmosphere)
-            )
-            torque = real_power / (rpm_values * np.pi / 30.0)
-            sfc = ICE_sfc(torque, rpm_values) * mixture_values * self.k_factor_sfc
+            efficiency_atmosphere = atmosphere
         else:
-            for idx in range(np.size(thrust)):
-                local_atmosphere = Atmosphere(
-                    atmosphere.get_altitude()[idx], altitude_in_feet=False
-                )
-                local_atmosphere.mach = atmosphere.mach[idx]
-                real_power[idx] = (
-                    thrust[idx]
-                    * atmosphere.true_airspeed[idx]
-                    / self.propeller_efficiency(thrust[idx], local_atmosphere)
-                )
-                torque[idx] = real_power[idx] / (rpm_values[idx] * np.pi / 30.0)
-                sfc[idx] = (
-                    ICE_sfc(torque[idx], rpm_values[idx]) * mixture_values[idx] * self.k_factor_sfc
-                )
+            efficiency_atmosphere = Atmosphere(atmosphere.get_altitude(), altitude_in_feet=False)
+            efficiency_atmosphere.mach = atmosphere.mach
+        real_power = (
+            thrust
+            * atmosphere.true_airspeed
+            / self.propeller_efficiency(thrust, efficiency_atmosphere)
+        )
+        torque = real_power / (rpm_values * np.pi / 30.0)
+        sfc = self.sfc_interpolator().ev(rpm_values, torque) * mixture_values * self.k_factor_sfc
+
         return sfc, real_power
 
+    def sfc_interpolator(self) -> RectBivariateSpline:
+        """
+        Returns the cubic interpolator of the engine map sfc with respect to RPM and torque. It is
+        built at first call only.
+
+        :return: sfc interpolator (sfc in g/kwh)
+        """
+        if self._sfc_interpolator is None:
+            torque_vect = self.pme_vect_ref * 1e5 * self.volume / (8.0 * np.pi)
+            self._sfc_interpolator = RectBivariateSpline(
+                self.rpm_vect_ref, torque_vect, self.sfc_matrix_ref
+            )
+
+        return self._sfc_interpolator
+
     def max_thrust(
         self,
         engine_setting: Union[float, Sequence[float]],
@@ -551,21 +551,14 @@ class BasicICEngine(AbstractFuelPropulsion):
         :return: maximum thrust (in N)
         """
         # Calculate maximum propeller thrust @ given altitude and speed
-        if isinstance(atmosphere.true_airspeed, float):
-            lower_bound = np.interp(atmosphere.true_airspeed, self.speed_SL, self.thrust_limit_SL)
-            upper_bound = np.interp(atmosphere.true_airspeed, self.speed_CL, self.thrust_limit_CL)
-        else:
-            lower_bound = np.interp(
-                list(atmosphere.true_airspeed), self.speed_SL, self.thrust_limit_SL
-            )
-            upper_bound = np.interp(
-                list(atmosphere.true_airspeed), self.speed_CL, self.thrust_limit_CL
-            )
         altitude = atmosphere.get_altitude(altitude_in_feet=False)
+        true_airspeed = np.ravel(atmosphere.true_airspeed)
+        lower_bound = np.interp(true_airspeed, self.speed_SL, self.thrust_limit_SL)
+        upper_bound = np.interp(true_airspeed, self.speed_CL, self.thrust_limit_CL)
         thrust_max_propeller = (
             lower_bound
             + (upper_bound - lower_bound)
-            * np.minimum(altitude, self.cruise_altitude_propeller)
+            * np.minimum(np.ravel(altitude), self.cruise_altitude_propeller)
             / self.cruise_altitude_propeller
         )
 
@@ -583,76 +576,60 @@ class BasicICEngine(AbstractFuelPropulsion):
             )
             max_power_SL = np.interp(list(rpm_values), rpm_vect, power_max_vect)
         sigma = atmosphere.density / Atmosphere(0.0).density
-        max_power = max_power_SL * (sigma - (1 - sigma) / 7.55)
+        max_power = np.ravel(max_power_SL * (sigma - (1 - sigma) / 7.55)) * np.ones(
+            np.size(altitude)
+        )
 
         # Found thrust relative to ICE maximum power @ given altitude and speed: calculates first
         # thrust interpolation vector (between min and max of propeller table) and associated
-        # efficiency, then calculates power and found thrust (interpolation limits to max
-        # propeller thrust)
+        # efficiency for all the flight points at once, then calculates power and found thrust
+        # (interpolation limits to max propeller thrust)
         thrust_interp = np.linspace(
             np.min(self.thrust_SL) * np.ones(np.size(thrust_max_propeller)),
             thrust_max_propeller,
             10,
         ).transpose()
-        if np.size(altitude) == 1:  # Calculate for float
-            thrust_max_global = 0.0
-            local_atmosphere = Atmosphere(
-                altitude * np.ones(np.size(thrust_interp)), altitude_in_feet=False
-            )
-            local_atmosphere.mach = atmosphere.mach * np.ones(np.size(thrust_interp))
-            propeller_efficiency = self.propeller_efficiency(thrust_interp[0], local_atmosphere)
-            mechanical_power = thrust_interp[0] * atmosphere.true_airspeed / propeller_efficiency
-            if np.min(mechanical_power) > max_power:
-                efficiency_relative_error = 1
-                propeller_efficiency = propeller_efficiency[0]
-                while efficiency_relative_error > 1e-2:
-                    thrust_max_global = max_power * propeller_efficiency / atmosphere.true_airspeed
-                    propeller_efficiency_new = self.propeller_efficiency(
-                        thrust_max_global, atmosphere
-                    )
-                    efficiency_relative_error = np.abs(
-                        (propeller_efficiency_new - propeller_efficiency)
-                        / efficiency_relative_error
-                    )
-                    propeller_efficiency = propeller_efficiency_new
-            else:
-                thrust_max_global = np.interp(max_power, mechanical_power, thrust_interp[0])
-        else:  # Calculate for array
-            thrust_max_global = np.zeros(np.size(altitude))
-            for idx in range(np.size(altitude)):
+        local_atmosphere = Atmosphere(np.repeat(np.ravel(altitude), 10), altitude_in_feet=False)
+        local_atmosphere.mach = np.repeat(np.ravel(atmosphere.mach), 10)
+        propeller_efficiency = np.reshape(
+            self.propeller_efficiency(np.ravel(thrust_interp), local_atmosphere),
+            np.shape(thrust_interp),
+        )
+        mechanical_power = thrust_interp * true_airspeed[:, np.newaxis] / propeller_efficiency
+        thrust_max_global = _interp_rows(max_power, mechanical_power, thrust_interp)
+
+        # Where the power needed at minimum thrust already exceeds the maximum power, thrust is
+        # found with a fixed-point iteration on the efficiency, starting from the lower bound
+        # efficiency, for those flight points at once
+        power_limited = np.min(mechanical_power, axis=1) > max_power
+        if np.any(power_limited):
+            propeller_efficiency = propeller_efficiency[power_limited, 0]
+            efficiency_relative_error = np.ones(np.size(propeller_efficiency))
+            thrust_power_limited = np.zeros(np.size(propeller_efficiency))
+            active = np.full(np.size(propeller_efficiency), True)
+            while np.any(active):
+                thrust_power_limited[active] = (
+                    max_power[power_limited][active]
+                    * propeller_efficiency[active]
+                    / true_airspeed[power_limited][active]
+                )
                 local_atmosphere = Atmosphere(
-                    altitude[idx] * np.ones(np.size(thrust_interp[idx])), altitude_in_feet=False
+                    np.ravel(altitude)[power_limited][active], altitude_in_feet=False
                 )
-                local_atmosphere.mach = atmosphere.mach[idx] * np.ones(np.size(thrust_interp[idx]))
-                propeller_efficiency = self.propeller_efficiency(
-                    thrust_interp[idx], local_atmosphere
+                local_atmosphere.mach = np.ravel(atmosphere.mach)[power_limited][active]
+                propeller_efficiency_new = self.propeller_efficiency(
+                    thrust_power_limited[active], local_atmosphere
                 )
-                mechanical_power = (
-                    thrust_interp[idx] * atmosphere.true_airspeed[idx] / propeller_efficiency
+                efficiency_relative_error[active] = np.abs(
+                    (propeller_efficiency_new - propeller_efficiency[active])
+                    / efficiency_relative_error[active]
                 )
-                if (
-                    np.min(mechanical_power) > max_power[idx]
-                ):  # take the lower bound efficiency for calculation
-                    efficiency_relative_error = 1
-                    local_atmosphere = Atmosphere(altitude[idx], altitude_in_feet=False)
-                    local_atmosphere.mach = atmosphere.mach[idx]
-                    propeller_efficiency = propeller_efficiency[0]
-                    while efficiency_relative_error > 1e-2:
-                        thrust_max_global[idx] = (
-                            max_power[idx] * propeller_efficiency / atmosphere.true_airspeed[idx]
-                        )
-                        propeller_efficiency_new = self.propeller_efficiency(
-                            thrust_max_global[idx], local_atmosphere
-                        )
-                        efficiency_relative_error = np.abs(
-                            (propeller_efficiency_new - propeller_efficiency)
-                            / efficiency_relative_error
-                        )
-                        propeller_efficiency = propeller_efficiency_new
-                else:
-                    thrust_max_global[idx] = np.interp(
-                        max_power[idx], mechanical_power, thrust_interp[idx]
-                    )
+                propeller_efficiency[active] = propeller_efficiency_new
+                active = efficiency_relative_error > 1e-2
+            thrust_max_global[power_limited] = thrust_power_limited
+
+        if np.size(altitude) == 1:  # Return float
+            return thrust_max_global[0]
 
         return thrust_max_global
 
@@ -735,6 +712,26 @@ class BasicICEngine(AbstractFuelPropulsion):
         return drag_force + interference_drag
 
 
+def _interp_rows(x: np.ndarray, xp: np.ndarray, fp: np.ndarray) -> np.ndarray:
+    """
+    Same as np.interp for each element of x, with the matching row of xp and fp.
+
+    :param x: x-coordinates at which to evaluate the interpolated values, of size n
+    :param xp: increasing x-coordinates of the data points, of shape (n, m)
+    :param fp: y-coordinates of the data points, of shape (n, m)
+    :return: interpolated values, of size n
+    """
+    rows = np.arange(np.size(x))
+    idx = np.clip(np.sum(xp <= x[:, np.newaxis], axis=1) - 1, 0, np.shape(xp)[1] - 2)
+    x_0, x_1 = xp[rows, idx], xp[rows, idx + 1]
+    f_0, f_1 = fp[rows, idx], fp[rows, idx + 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f_x = np.where(x_1 > x_0, f_0 + (x - x_0) * (f_1 - f_0) / (x_1 - x_0), f_0)
+    f_x = np.where(x < xp[:, 0], fp[:, 0], f_x)
+
+    return np.where(x >= xp[:, -1], fp[:, -1], f_x)
+
+
 @AddKeyAttributes(ENGINE_LABELS)
 class Engine(DynamicAttributeDict):
     """
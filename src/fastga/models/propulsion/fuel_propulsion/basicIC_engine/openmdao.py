@@ -19,6 +19,9 @@ import fastoad.api as oad
 
 from fastga.models.propulsion.propulsion import IPropulsion, BaseOMPropulsionComponent
 from fastga.models.propulsion.fuel_propulsion.basicIC_engine.basicIC_engine import BasicICEngine
+from fastga.models.propulsion.fuel_propulsion.basicIC_engine.tabulated_engine import (
+    TabulatedICEngine,
+)
 from fastga.models.propulsion.fuel_propulsion.base import FuelEngineSet
 from fastga.models.aerodynamics.external.propeller_code.compute_propeller_aero import (
     THRUST_PTS_NB,
@@ -72,6 +75,12 @@ class OMBasicICEngineWrapper(oad.IOMPropulsionWrapper):
             desc="k_factor that can be used to adjust the consumption on engine level to the "
             "aircraft level",
         )
+        component.add_input(
+            "settings:propulsion:IC_engine:tabulated",
+            0.0,
+            desc="1.0 to interpolate the engine performance in tables sampled once per engine "
+            "definition instead of computing it at each flight point, 0.0 otherwise",
+        )
         component.add_input(
             "data:aerodynamics:propeller:sea_level:speed",
             np.full(SPEED_PTS_NB, np.nan),
@@ -131,7 +140,8 @@ class OMBasicICEngineWrapper(oad.IOMPropulsionWrapper):
     def get_model(inputs) -> IPropulsion:
         """
         :param inputs: input parameters that define the engine
-        :return: an :class:`BasicICEngine` instance
+        :return: an :class:`BasicICEngine` instance, or a :class:`TabulatedICEngine` instance if
+        asked by the settings
         """
         engine_params = {
             "max_power": inputs["data:propulsion:IC_engine:max_power"],
@@ -161,9 +171,12 @@ class OMBasicICEngineWrapper(oad.IOMPropulsionWrapper):
             ],
         }
 
-        return FuelEngineSet(
-            BasicICEngine(**engine_params), inputs["data:geometry:propulsion:engine:count"]
-        )
+        if inputs["settings:propulsion:IC_engine:tabulated"] == 1.0:
+            engine = TabulatedICEngine(**engine_params)
+        else:
+            engine = BasicICEngine(**engine_params)
+
+        return FuelEngineSet(engine, inputs["data:geometry:propulsion:engine:count"])
 
 
 @oad.ValidityDomainChecker(
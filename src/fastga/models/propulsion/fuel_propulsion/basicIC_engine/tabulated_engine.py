@@ -0,0 +1,332 @@
+"""Tabulated version of the parametric propeller IC engine."""
+# -*- coding: utf-8 -*-
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Union, Sequence, Tuple
+
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+
+from fastoad.constants import EngineSetting
+from stdatm import Atmosphere
+
+from .basicIC_engine import BasicICEngine
+
+# Logger for this module
+_LOGGER = logging.getLogger(__name__)
+
+# Default number of points of the tables along each axis and highest tabulated altitude, in m
+ALTITUDE_PTS_NB = 17
+SPEED_PTS_NB = 31
+THRUST_RATE_PTS_NB = 31
+MAX_ALTITUDE = 8000.0
+# Number of table sets kept by the process, one per engine definition
+TABLES_CACHE_SIZE = 8
+
+
+class TabulatedICEngine(BasicICEngine):
+    """
+    Same as BasicICEngine, the maximum thrust and the sfc being interpolated in tables instead of
+    being computed through the propeller efficiency, power limit and engine map at each call.
+
+    The tables are sampled once from the BasicICEngine model, at the first computation of maximum
+    thrust or sfc, on a grid of engine settings, altitudes, true airspeeds and thrust rates. They
+    are shared by all the instances of the process with the same definition, so that creating the
+    engine at each computation of a component does not sample them again. Flight points outside of
+    the tables (higher altitude or airspeed than tabulated, thrust rate above 1) are computed with
+    the BasicICEngine model.
+    """
+
+    _tables = OrderedDict()
+
+    def __init__(
+        self,
+        *args,
+        max_altitude: float = MAX_ALTITUDE,
+        altitude_pts_nb: int = ALTITUDE_PTS_NB,
+        speed_pts_nb: int = SPEED_PTS_NB,
+        thrust_rate_pts_nb: int = THRUST_RATE_PTS_NB,
+        **kwargs
+    ):
+        """
+        Takes the parameters of BasicICEngine, plus the definition of the tables.
+
+        :param max_altitude: highest tabulated altitude (units=m)
+        :param altitude_pts_nb: number of tabulated altitudes, from sea level to max_altitude
+        :param speed_pts_nb: number of tabulated true airspeeds, from 0 to the highest speed of the
+        propeller tables
+        :param thrust_rate_pts_nb: number of tabulated thrust rates, from 0 to 1
+        """
+        super().__init__(*args, **kwargs)
+
+        self.engine_settings = np.array([float(engine_setting) for engine_setting in EngineSetting])
+        self.altitudes = np.linspace(0.0, max_altitude, altitude_pts_nb)
+        # Speeds are closer at low speed where the maximum thrust varies the most, the speeds of
+        # the propeller tables being added to follow their interpolation
+        self.speeds = np.union1d(
+            max(np.max(self.speed_SL), np.max(self.speed_CL))
+            * np.linspace(0.0, 1.0, speed_pts_nb) ** 2,
+            np.union1d(self.speed_SL, self.speed_CL),
+        )
+        # Thrust rates are closer at low thrust where the propeller efficiency varies the most
+        self.thrust_rates = np.linspace(0.0, 1.0, thrust_rate_pts_nb) ** 2
+
+        # Table interpolators, sampled at first use, see table_interpolators
+        self._table_interpolators = None
+
+    def table_interpolators(
+        self,
+    ) -> Tuple[RegularGridInterpolator, RegularGridInterpolator, RegularGridInterpolator]:
+        """
+        Returns the interpolators of the tables, see _sample_tables. They are sampled at first call
+        only, or taken from an instance with the same definition, the tables not being needed by
+        the other computations (weight, dimensions...).
+
+        :return: maximum thrust, sfc and mechanical power interpolators
+        """
+        if self._table_interpolators is None:
+            tables_key = self._tables_key()
+            if tables_key in TabulatedICEngine._tables:
+                TabulatedICEngine._tables.move_to_end(tables_key)
+            else:
+                TabulatedICEngine._tables[tables_key] = self._sample_tables()
+                if len(TabulatedICEngine._tables) > TABLES_CACHE_SIZE:
+                    TabulatedICEngine._tables.popitem(last=False)
+            self._table_interpolators = TabulatedICEngine._tables[tables_key]
+
+        return self._table_interpolators
+
+    def _tables_key(self) -> str:
+        """Hash of everything the tables are computed from."""
+        key = hashlib.sha1()
+        for value in [
+            self.max_power,
+            self.cruise_altitude_propeller,
+            self.fuel_type,
+            self.k_factor_sfc,
+            self.speed_SL,
+            self.thrust_SL,
+            self.thrust_limit_SL,
+            self.efficiency_SL,
+            self.speed_CL,
+            self.thrust_CL,
+            self.thrust_limit_CL,
+            self.efficiency_CL,
+            self.effective_J,
+            self.effective_efficiency_ls,
+            self.effective_efficiency_cruise,
+            self.engine_settings,
+            self.altitudes,
+            self.speeds,
+            self.thrust_rates,
+        ]:
+            key.update(np.ascontiguousarray(value, dtype=float).tobytes())
+            # Separates the values so that arrays of different sizes give different keys
+            key.update(b"|")
+
+        return key.hexdigest()
+
+    def _sample_tables(
+        self,
+    ) -> Tuple[RegularGridInterpolator, RegularGridInterpolator, RegularGridInterpolator]:
+        """
+        Computes the maximum thrust, sfc and mechanical power of the BasicICEngine model on the
+        grid of the tables, for all the points at once.
+
+        :return: multilinear interpolators of the maximum thrust (in N) with respect to engine
+        setting, altitude and true airspeed, and of the sfc (in g/kwh) and mechanical power (in
+        W) with respect to engine setting, altitude, true airspeed and thrust rate
+        """
+        _LOGGER.debug("Sampling IC engine tables")
+
+        grid = np.meshgrid(self.engine_settings, self.altitudes, self.speeds, indexing="ij")
+        atmosphere = Atmosphere(np.ravel(grid[1]), altitude_in_feet=False)
+        atmosphere.true_airspeed = np.ravel(grid[2])
+        max_thrust = np.reshape(
+            BasicICEngine.max_thrust(self, np.ravel(grid[0]).astype(int), atmosphere),
+            np.shape(grid[0]),
+        )
+
+        grid = np.meshgrid(
+            self.engine_settings, self.altitudes, self.speeds, self.thrust_rates, indexing="ij"
+        )
+        atmosphere = Atmosphere(np.ravel(grid[1]), altitude_in_feet=False)
+        atmosphere.true_airspeed = np.ravel(grid[2])
+        thrust = np.ravel(max_thrust[..., np.newaxis] * grid[3])
+        sfc, power = BasicICEngine.sfc(self, thrust, np.ravel(grid[0]).astype(int), atmosphere)
+
+        axes = (self.engine_settings, self.altitudes, self.speeds)
+        return (
+            RegularGridInterpolator(axes, max_thrust),
+            RegularGridInterpolator(
+                axes + (self.thrust_rates,), np.reshape(sfc, np.shape(grid[0]))
+            ),
+            RegularGridInterpolator(
+                axes + (self.thrust_rates,), np.reshape(power, np.shape(grid[0]))
+            ),
+        )
+
+    def _table_points(
+        self, engine_setting: Union[float, Sequence[float]], atmosphere: Atmosphere
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :return: the engine setting, altitude and true airspeed of each flight point, as columns,
+        and the mask of the flight points within the tables
+        """
+        altitude = np.ravel(atmosphere.get_altitude(altitude_in_feet=False))
+        true_airspeed = np.ravel(atmosphere.true_airspeed) * np.ones(np.size(altitude))
+        engine_setting = np.array([float(value) for value in np.ravel(engine_setting)]) * np.ones(
+            np.size(altitude)
+        )
+        points = np.column_stack((engine_setting, altitude, true_airspeed))
+        in_tables = (
+            (altitude >= self.altitudes[0])
+            & (altitude <= self.altitudes[-1])
+            & (true_airspeed >= self.speeds[0])
+            & (true_airspeed <= self.speeds[-1])
+        )
+
+        return points, in_tables
+
+    @staticmethod
+    def _sub_atmosphere(atmosphere: Atmosphere, mask: np.ndarray) -> Atmosphere:
+        """Atmosphere of the masked flight points."""
+        altitude = np.ravel(atmosphere.get_altitude(altitude_in_feet=False))
+        sub_atmosphere = Atmosphere(altitude[mask], altitude_in_feet=False)
+        sub_atmosphere.true_airspeed = (
+            np.ravel(atmosphere.true_airspeed) * np.ones(np.size(altitude))
+        )[mask]
+
+        return sub_atmosphere
+
+    def max_thrust(
+        self,
+        engine_setting: Union[float, Sequence[float]],
+        atmosphere: Atmosphere,
+    ) -> np.ndarray:
+        """
+        Same as BasicICEngine.max_thrust, interpolated in the tables.
+
+        :param engine_setting: Engine settings (climb, cruise,... )
+        :param atmosphere: Atmosphere instance at intended altitude (should be <=20km)
+        :return: maximum thrust (in N)
+        """
+        max_thrust_table, _, _ = self.table_interpolators()
+        points, in_tables = self._table_points(engine_setting, atmosphere)
+        thrust_max_global = np.zeros(np.shape(points)[0])
+        thrust_max_global[in_tables] = max_thrust_table(points[in_tables])
+        if not np.all(in_tables):
+            thrust_max_global[~in_tables] = BasicICEngine.max_thrust(
+                self,
+                np.ravel(engine_setting)[~in_tables]
+                if np.size(engine_setting) > 1
+                else engine_setting,
+                self._sub_atmosphere(atmosphere, ~in_tables),
+            )
+
+        if np.size(atmosphere.get_altitude()) == 1:  # Return float
+            return thrust_max_global[0]
+
+        return thrust_max_global
+
+    def sfc(
+        self,
+        thrust: Union[float, Sequence[float]],
+        engine_setting: Union[float, Sequence[float]],
+        atmosphere: Atmosphere,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Same as BasicICEngine.sfc, interpolated in the tables.
+
+        :param thrust: Thrust (in N)
+        :param engine_setting: Engine settings (climb, cruise,... )
+        :param atmosphere: Atmosphere instance at intended altitude
+        :return: SFC (in g/kw) and Power (in W)
+        """
+        max_thrust_table, sfc_table, power_table = self.table_interpolators()
+        points, in_tables = self._table_points(engine_setting, atmosphere)
+        thrust_array = np.ravel(thrust) * np.ones(np.shape(points)[0])
+        max_thrust = np.ones(np.shape(points)[0])
+        max_thrust[in_tables] = max_thrust_table(points[in_tables])
+        thrust_rate = thrust_array / np.maximum(max_thrust, 1e-6)
+        in_tables &= (thrust_rate >= self.thrust_rates[0]) & (thrust_rate <= self.thrust_rates[-1])
+
+        sfc = np.zeros(np.shape(points)[0])
+        real_power = np.zeros(np.shape(points)[0])
+        table_points = np.column_stack((points[in_tables], thrust_rate[in_tables]))
+        sfc[in_tables] = sfc_table(table_points)
+        real_power[in_tables] = power_table(table_points)
+        if not np.all(in_tables):
+            sfc[~in_tables], real_power[~in_tables] = BasicICEngine.sfc(
+                self,
+                thrust_array[~in_tables],
+                np.ravel(engine_setting)[~in_tables]
+                if np.size(engine_setting) > 1
+                else engine_setting,
+                self._sub_atmosphere(atmosphere, ~in_tables),
+            )
+
+        if np.size(thrust) == np.size(sfc):
+            return np.reshape(sfc, np.shape(thrust)), np.reshape(real_power, np.shape(thrust))
+
+        return sfc, real_power
+
+    def accuracy_report(self, sample_count: int = 1000, seed: int = 0) -> dict:
+        """
+        Compares the tabulated maximum thrust and fuel flow with the ones of the BasicICEngine
+        model at random flight points within the tables.
+
+        :param sample_count: number of random flight points
+        :param seed: seed of the random flight points, for repeatable reports
+        :return: dictionary of the mean and maximum relative errors on the maximum thrust and on
+        the fuel flow, the latter being relative to the highest of the fuel flow at the point and
+        1% of the fuel flow at maximum thrust, not to overweight points close to zero airspeed
+        """
+        random_generator = np.random.default_rng(seed)
+        engine_setting = random_generator.choice(self.engine_settings, sample_count).astype(int)
+        atmosphere = Atmosphere(
+            random_generator.uniform(self.altitudes[0], self.altitudes[-1], sample_count),
+            altitude_in_feet=False,
+        )
+        atmosphere.true_airspeed = random_generator.uniform(
+            self.speeds[0], self.speeds[-1], sample_count
+        )
+        thrust_rate = random_generator.uniform(0.0, 1.0, sample_count)
+
+        max_thrust = BasicICEngine.max_thrust(self, engine_setting, atmosphere)
+        tabulated_max_thrust = self.max_thrust(engine_setting, atmosphere)
+        thrust = thrust_rate * max_thrust
+        sfc, real_power = BasicICEngine.sfc(self, thrust, engine_setting, atmosphere)
+        tabulated_sfc, tabulated_real_power = self.sfc(thrust, engine_setting, atmosphere)
+        fuel_flow = sfc * real_power
+        tabulated_fuel_flow = tabulated_sfc * tabulated_real_power
+        max_fuel_flow = np.prod(
+            BasicICEngine.sfc(self, max_thrust, engine_setting, atmosphere), axis=0
+        )
+
+        max_thrust_error = np.abs(tabulated_max_thrust - max_thrust) / max_thrust
+        fuel_flow_error = np.abs(tabulated_fuel_flow - fuel_flow) / np.maximum(
+            fuel_flow, 1e-2 * max_fuel_flow
+        )
+
+        return {
+            "sample_count": sample_count,
+            "max_thrust_mean_error": float(np.mean(max_thrust_error)),
+            "max_thrust_max_error": float(np.max(max_thrust_error)),
+            "fuel_flow_mean_error": float(np.mean(fuel_flow_error)),
+            "fuel_flow_max_error": float(np.max(fuel_flow_error)),
+        }
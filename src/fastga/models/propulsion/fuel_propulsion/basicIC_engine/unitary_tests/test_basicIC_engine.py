@@ -16,8 +16,10 @@ import numpy as np
 
 import fastoad.api as oad
 from fastoad.constants import EngineSetting
+from stdatm import Atmosphere
 
 from ..basicIC_engine import BasicICEngine
+from ..tabulated_engine import TabulatedICEngine
 
 THRUST_SL = np.array(
     [
@@ -852,6 +854,151 @@ def test_compute_flight_points():
     np.testing.assert_allclose(flight_points.thrust, thrusts + thrusts, rtol=1e-4)
 
 
+def test_tabulated_engine():
+    engine = TabulatedICEngine(
+        130000.0,
+        2400.0,
+        1.0,
+        4.0,
+        1.0,
+        1.0,
+        SPEED,
+        THRUST_SL,
+        THRUST_SL_LIMIT,
+        EFFICIENCY_SL,
+        SPEED,
+        THRUST_CL,
+        THRUST_CL_LIMIT,
+        EFFICIENCY_CL,
+        0.95,  # Effective advance ratio factor
+        0.97,  # Effective efficiency in low speed conditions
+        0.98,  # Effective efficiency in cruise conditions
+    )  # load a 4-strokes 130kW gasoline engine
+
+    # Same test as test_compute_flight_points, with one point above the tabulated altitudes
+    machs = [0, 0.3, 0.3, 0.4, 0.4, 0.4]
+    altitudes = [0, 0, 0, 1000, 2400, 9000]
+    thrust_rates = [0.8, 0.5, 0.5, 0.4, 0.7, 0.7]
+    engine_settings = [
+        EngineSetting.TAKEOFF,
+        EngineSetting.TAKEOFF,
+        EngineSetting.CLIMB,
+        EngineSetting.IDLE,
+        EngineSetting.CRUISE,
+        EngineSetting.CRUISE,
+    ]
+    flight_points = oad.FlightPoint(
+        mach=machs,
+        altitude=altitudes,
+        engine_setting=engine_settings,
+        thrust_is_regulated=[False] * 6,
+        thrust_rate=thrust_rates,
+        thrust=[0.0] * 6,
+    )
+    engine.compute_flight_points(flight_points)
+    direct_flight_points = oad.FlightPoint(
+        mach=machs,
+        altitude=altitudes,
+        engine_setting=engine_settings,
+        thrust_is_regulated=[False] * 6,
+        thrust_rate=thrust_rates,
+        thrust=[0.0] * 6,
+    )
+    direct_engine = BasicICEngine(
+        130000.0,
+        2400.0,
+        1.0,
+        4.0,
+        1.0,
+        1.0,
+        SPEED,
+        THRUST_SL,
+        THRUST_SL_LIMIT,
+        EFFICIENCY_SL,
+        SPEED,
+        THRUST_CL,
+        THRUST_CL_LIMIT,
+        EFFICIENCY_CL,
+        0.95,
+        0.97,
+        0.98,
+    )
+    direct_engine.compute_flight_points(direct_flight_points)
+    np.testing.assert_allclose(flight_points.thrust, direct_flight_points.thrust, rtol=1e-2)
+    np.testing.assert_allclose(flight_points.sfc, direct_flight_points.sfc, rtol=1e-2, atol=1e-9)
+    np.testing.assert_allclose(flight_points.thrust_rate, thrust_rates, rtol=1e-12)
+
+    report = engine.accuracy_report()
+    assert report["max_thrust_mean_error"] < 5e-3
+    assert report["fuel_flow_mean_error"] < 5e-3
+    assert report["fuel_flow_max_error"] < 5e-2
+
+    # Tables are sampled once for the same engine definition
+    assert (
+        TabulatedICEngine(
+            130000.0,
+            2400.0,
+            1.0,
+            4.0,
+            1.0,
+            1.0,
+            SPEED,
+            THRUST_SL,
+            THRUST_SL_LIMIT,
+            EFFICIENCY_SL,
+            SPEED,
+            THRUST_CL,
+            THRUST_CL_LIMIT,
+            EFFICIENCY_CL,
+            0.95,
+            0.97,
+            0.98,
+        ).table_interpolators()
+        is engine.table_interpolators()
+    )
+
+
+def test_propeller_efficiency():
+    engine = BasicICEngine(
+        130000.0,
+        2400.0,
+        1.0,
+        4.0,
+        1.0,
+        1.0,
+        SPEED,
+        THRUST_SL,
+        THRUST_SL_LIMIT,
+        EFFICIENCY_SL,
+        SPEED,
+        THRUST_CL,
+        THRUST_CL_LIMIT,
+        EFFICIENCY_CL,
+        0.95,  # Effective advance ratio factor
+        0.97,  # Effective efficiency in low speed conditions
+        0.98,  # Effective efficiency in cruise conditions
+    )
+    interpolators = engine.propeller_efficiency_interpolators()
+
+    # Array evaluation should give the scalar values point by point
+    thrusts = np.array([100.0, 465.98665, 1500.0, 2500.0, 6000.0])
+    altitudes = np.array([0.0, 500.0, 1200.0, 2400.0, 3000.0])
+    machs = np.array([0.05, 0.15, 0.25, 0.3, 0.4])
+    atmosphere = Atmosphere(altitudes, altitude_in_feet=False)
+    atmosphere.mach = machs
+    efficiencies = engine.propeller_efficiency(thrusts, atmosphere)
+    for thrust, altitude, mach, efficiency in zip(thrusts, altitudes, machs, efficiencies):
+        local_atmosphere = Atmosphere(altitude, altitude_in_feet=False)
+        local_atmosphere.mach = mach
+        np.testing.assert_allclose(
+            engine.propeller_efficiency(thrust, local_atmosphere), efficiency, rtol=1e-12
+        )
+
+    # Interpolators are built only once
+    assert engine.propeller_efficiency_interpolators()[0] is interpolators[0]
+    assert engine.propeller_efficiency_interpolators()[1] is interpolators[1]
+
+
 def test_engine_weight():
     # BasicICEngine(max_power(W), design_altitude(m), design_speed(m/s), fuel_type, strokes_nb, prop_layout)
     _50kw_engine = BasicICEngine(
@@ -18,7 +18,12 @@ import numpy as np
 import openmdao.api as om
 from fastoad.constants import EngineSetting
 
-from ..openmdao import OMBasicICEngineComponent
+from fastga.models.aerodynamics.external.propeller_code.compute_propeller_aero import (
+    THRUST_PTS_NB,
+    SPEED_PTS_NB,
+)
+
+from ..openmdao import OMBasicICEngineComponent, OMBasicICEngineWrapper
 
 from tests.testing_utilities import run_system
 
@@ -844,3 +849,100 @@ def test_OMBasicICEngineComponent():
         problem["data:propulsion:thrust_rate"], [thrust_rates, thrust_rates], rtol=1e-2
     )
     np.testing.assert_allclose(problem["data:propulsion:thrust"], [thrusts, thrusts], rtol=1e-2)
+
+
+def test_OMBasicICEngineComponent_tabulated():
+    """Tests ManualBasicICEngine component with the tabulated engine model."""
+    # Same flight points as in test_OMBasicICEngineComponent, results of the tabulated model being
+    # compared to those of the direct one
+    machs = [0, 0.3, 0.3, 0.5, 0.5]
+    altitudes = [0, 0, 0, 4000, 8000]
+    thrust_rates = [0.8, 0.5, 0.5, 0.4, 0.7]
+    thrusts = [3193.979631, 465.986781, 465.986781, 139.615132, 233.405598]
+    phases = [
+        EngineSetting.TAKEOFF,
+        EngineSetting.TAKEOFF,
+        EngineSetting.CLIMB,
+        EngineSetting.IDLE,
+        EngineSetting.CRUISE,
+    ]
+
+    def run_engine(tabulated):
+        ivc = om.IndepVarComp()
+        ivc.add_output("data:propulsion:IC_engine:max_power", 130000, units="W")
+        ivc.add_output("data:propulsion:fuel_type", 1)
+        ivc.add_output("data:propulsion:IC_engine:strokes_nb", 4)
+        ivc.add_output("data:TLAR:v_cruise", 158.0, units="kn")
+        ivc.add_output("data:aerodynamics:propeller:cruise_level:altitude", 8000.0, units="ft")
+        ivc.add_output("data:geometry:propulsion:engine:layout", 1.0)
+        ivc.add_output("data:aerodynamics:propeller:sea_level:speed", SPEED, units="m/s")
+        ivc.add_output("data:aerodynamics:propeller:sea_level:thrust", THRUST_SL, units="N")
+        ivc.add_output(
+            "data:aerodynamics:propeller:sea_level:thrust_limit", THRUST_SL_LIMIT, units="N"
+        )
+        ivc.add_output("data:aerodynamics:propeller:sea_level:efficiency", EFFICIENCY_SL)
+        ivc.add_output("data:aerodynamics:propeller:cruise_level:speed", SPEED, units="m/s")
+        ivc.add_output("data:aerodynamics:propeller:cruise_level:thrust", THRUST_CL, units="N")
+        ivc.add_output(
+            "data:aerodynamics:propeller:cruise_level:thrust_limit", THRUST_CL_LIMIT, units="N"
+        )
+        ivc.add_output("data:aerodynamics:propeller:cruise_level:efficiency", EFFICIENCY_CL)
+        ivc.add_output(
+            "data:aerodynamics:propeller:installation_effect:effective_advance_ratio", 0.95
+        )
+        ivc.add_output(
+            "data:aerodynamics:propeller:installation_effect:effective_efficiency:low_speed", 0.97
+        )
+        ivc.add_output(
+            "data:aerodynamics:propeller:installation_effect:effective_efficiency:cruise", 0.98
+        )
+        ivc.add_output("data:geometry:propulsion:engine:count", 1)
+        ivc.add_output("settings:propulsion:IC_engine:tabulated", tabulated)
+
+        ivc.add_output("data:propulsion:mach", [machs, machs])
+        ivc.add_output("data:propulsion:altitude", [altitudes, altitudes], units="ft")
+        ivc.add_output("data:propulsion:engine_setting", [phases, phases])
+        ivc.add_output("data:propulsion:use_thrust_rate", [[True] * 5, [False] * 5])
+        ivc.add_output("data:propulsion:required_thrust_rate", [thrust_rates, [0] * 5])
+        ivc.add_output("data:propulsion:required_thrust", [[0] * 5, thrusts], units="N")
+
+        return run_system(OMBasicICEngineComponent(flight_point_count=(2, 5)), ivc)
+
+    direct_problem = run_engine(0.0)
+    problem = run_engine(1.0)
+
+    for name in ["data:propulsion:SFC", "data:propulsion:thrust_rate", "data:propulsion:thrust"]:
+        np.testing.assert_allclose(problem[name], direct_problem[name], rtol=1e-2)
+
+    # Components that do not compute flight points, such as the weight and dimension ones, get
+    # the engine with placeholder propeller tables: tables should then not be sampled
+    inputs = {
+        "data:propulsion:IC_engine:max_power": 130000.0,
+        "data:propulsion:fuel_type": 1.0,
+        "data:propulsion:IC_engine:strokes_nb": 4.0,
+        "data:geometry:propulsion:engine:layout": 1.0,
+        "settings:propulsion:IC_engine:k_factor_sfc": 1.0,
+        "settings:propulsion:IC_engine:tabulated": 1.0,
+        "data:aerodynamics:propeller:cruise_level:altitude": np.nan,
+        "data:geometry:propulsion:engine:count": 1.0,
+        "data:aerodynamics:propeller:installation_effect:effective_efficiency:low_speed": 1.0,
+        "data:aerodynamics:propeller:installation_effect:effective_efficiency:cruise": 1.0,
+        "data:aerodynamics:propeller:installation_effect:effective_advance_ratio": 1.0,
+    }
+    for level in ["sea_level", "cruise_level"]:
+        inputs["data:aerodynamics:propeller:" + level + ":speed"] = np.full(SPEED_PTS_NB, np.nan)
+        inputs["data:aerodynamics:propeller:" + level + ":thrust"] = np.full(THRUST_PTS_NB, np.nan)
+        inputs["data:aerodynamics:propeller:" + level + ":thrust_limit"] = np.full(
+            SPEED_PTS_NB, np.nan
+        )
+        inputs["data:aerodynamics:propeller:" + level + ":efficiency"] = np.full(
+            (SPEED_PTS_NB, THRUST_PTS_NB), np.nan
+        )
+    engine = OMBasicICEngineWrapper.get_model(inputs)
+    direct_engine = OMBasicICEngineWrapper.get_model(
+        {**inputs, "settings:propulsion:IC_engine:tabulated": 0.0}
+    )
+    np.testing.assert_allclose(engine.compute_weight(), direct_engine.compute_weight())
+    np.testing.assert_allclose(engine.compute_dimensions(), direct_engine.compute_dimensions())
+    # noinspection PyProtectedMember
+    assert engine.engine._table_interpolators is None
@@ -15,6 +15,7 @@
 
 import os.path as pth
 import logging
+from collections import OrderedDict
 from typing import Union, Sequence, Tuple, Optional
 from scipy.interpolate import interp2d, interp1d
 from scipy.optimize import fsolve
@@ -54,6 +55,15 @@ NACELLE_LABELS = {
     "width": dict(doc="Width in meters."),
 }
 
+# Significant digits of the altitude, mach number and fuel flow identifying an off-design point
+# already solved
+SOLUTION_KEY_DIGITS = 12
+# Size of the cells of altitude (in m), mach number and fuel flow (in kg/s) in which the last
+# converged gas generator state is used as initial values of the new points
+SEED_RESOLUTION = (500.0, 0.05, 5e-3)
+# Maximum number of off-design points and of cells kept by an engine
+GAS_GENERATOR_CACHE_SIZE = 10000
+
 
 class BasicTPEngine(AbstractFuelPropulsion):
     def __init__(
@@ -295,6 +305,16 @@ class BasicTPEngine(AbstractFuelPropulsion):
         self.power_sol = [0.0]
         self.thrust_sol = [0.0]
 
+        # Off-design points already solved, and converged gas generator states of the last point
+        # solved in each cell of flight conditions and fuel flow, both with the most recently used
+        # last
+        self._solutions = OrderedDict()
+        self._seeds = OrderedDict()
+        # Fuel flows found for each limit in the cells of flight conditions, with the limit value
+        # and the slope of the limited quantity
+        self._fuel_flow_seeds = OrderedDict()
+        self.solve_counts = dict(solves=0, cache_hits=0, warm_starts=0, fallbacks=0)
+
     @staticmethod
     def air_coefficients_reader():
 
@@ -734,7 +754,8 @@ class BasicTPEngine(AbstractFuelPropulsion):
 
         p_41t = p_3t * self.pi_cc
 
-        return_array = np.zeros(5)
+        # Several points can be solved at once, their variables being given along the last axis
+        return_array = np.zeros(np.shape(var_to_solve))
         # Temperature change through the combustion chamber
         return_array[0] = 1.0 - air_mass_flow * (
             1 + f_fuel_ratio - g_r - self.cooling_ratio - icb
@@ -1065,6 +1086,403 @@ class BasicTPEngine(AbstractFuelPropulsion):
 
         return fuel, power_sol[0], thrust_sol[0]
 
+    def gas_generator_cache_info(self) -> dict:
+        """
+        Returns the number of off-design points found in the saved solutions (hits) or solved
+        (misses), the ratio of hits, the number of solved points that started from a saved state
+        and the number of saved solutions.
+        """
+        hits = self.solve_counts["cache_hits"]
+        misses = self.solve_counts["solves"]
+
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses > 0 else 0.0,
+            "warm_starts": self.solve_counts["warm_starts"],
+            "size": len(self._solutions),
+        }
+
+    def clear_gas_generator_cache(self):
+        """Forgets the saved off-design solutions and resets the solve counts."""
+        self._solutions.clear()
+        self._seeds.clear()
+        self._fuel_flow_seeds.clear()
+        for name in self.solve_counts:
+            self.solve_counts[name] = 0
+
+    def turboshaft_performance_real_gas_batch(
+        self, altitude, flight_mach, m_c, initial_values=None
+    ):
+
+        """
+        Same as turboshaft_performance_real_gas for several flight points at once: the gas
+        generator and exhaust equations of all the points are solved together with a damped Newton
+        method. Points for which it does not converge are solved with fsolve, as in
+        turboshaft_performance_real_gas.
+
+        Results are kept by the engine: points already solved are not solved again and, when no
+        initial values are given, new points start from the gas generator state of the last point
+        solved in the same cell of altitude, mach number and fuel flow (see SEED_RESOLUTION).
+
+        :param altitude: the flight altitudes, in m
+        :param flight_mach: the flight mach numbers
+        :param m_c: the fuel flows injected in the turboprop, in kg/s
+        :param initial_values: the initial values of the gas generator variables (see
+        turboshaft_performance_solver_real_gas) for each point, of shape (5, number of points),
+        default values being the saved states or the ones of turboshaft_performance_real_gas
+
+        :return t_4t: the turbine entry temperatures, in K
+        :return m: the air mass flows, in kg/s
+        :return power: the power outputs of the engine, in kW
+        :return f_fuel_ratio: the ratios between the fuel mass flow and the air mass flow
+        :return p_41t: the pressures after the mixing of cold air, in Pa
+        :return opr: the overall pressure ratios
+        :return t_41t: the temperatures after the mixing of cold air, in K
+        :return t_45t: the temperatures between the turbines, in K
+        :return thrust_exhaust: the exhaust thrusts, in N
+        :return var_solution: the solutions of the gas generator equations, of shape (5, number
+        of points), to be used as initial values of close points
+        """
+
+        altitude, flight_mach, m_c = (
+            np.ravel(value).astype(float)
+            for value in np.broadcast_arrays(altitude, flight_mach, m_c)
+        )
+        if initial_values is None:
+            initial_values = np.tile(
+                np.array([[300.0], [500.0], [1200.0], [3.0], [400000.0]]), np.size(altitude)
+            )
+            use_seeds = True
+        else:
+            initial_values = np.array(initial_values, dtype=float)
+            use_seeds = False
+
+        # Each point is saved as a column of 14 values: the 9 characteristics of the engine
+        # followed by the gas generator state
+        results = np.zeros((14, np.size(altitude)))
+        to_solve = np.ones(np.size(altitude), dtype=bool)
+        solution_keys = [
+            tuple(float("%.*g" % (SOLUTION_KEY_DIGITS, value)) for value in point)
+            for point in zip(altitude, flight_mach, m_c)
+        ]
+        seed_keys = [
+            tuple(
+                int(np.floor(value / resolution))
+                for value, resolution in zip(point, SEED_RESOLUTION)
+            )
+            for point in zip(altitude, flight_mach, m_c)
+        ]
+        for idx, (solution_key, seed_key) in enumerate(zip(solution_keys, seed_keys)):
+            if solution_key in self._solutions:
+                self._solutions.move_to_end(solution_key)
+                results[:, idx] = self._solutions[solution_key]
+                to_solve[idx] = False
+            elif use_seeds and seed_key in self._seeds:
+                initial_values[:, idx] = self._seeds[seed_key]
+                self.solve_counts["warm_starts"] += 1
+        self.solve_counts["cache_hits"] += int(np.sum(~to_solve))
+
+        if np.any(to_solve):
+            performance = self._turboshaft_performance_real_gas_batch(
+                altitude[to_solve],
+                flight_mach[to_solve],
+                m_c[to_solve],
+                initial_values[:, to_solve],
+            )
+            results[:, to_solve] = np.vstack(performance)
+            # Copies are saved since the returned arrays may be modified
+            for idx in np.where(to_solve)[0]:
+                _save(self._solutions, solution_keys[idx], np.copy(results[:, idx]))
+                _save(self._seeds, seed_keys[idx], np.copy(results[9:, idx]))
+
+        return tuple(results[:9]) + (results[9:],)
+
+    def _turboshaft_performance_real_gas_batch(self, altitude, flight_mach, m_c, initial_values):
+        """
+        Solves the points of turboshaft_performance_real_gas_batch that are not saved, from the
+        given initial values.
+        """
+
+        performance_atmosphere = Atmosphere(altitude, altitude_in_feet=False)
+
+        p_0 = performance_atmosphere.pressure
+        t_0 = performance_atmosphere.temperature
+        if self.bleed_control == 1.0:
+            bleed_control = "high"
+        else:
+            bleed_control = "low"
+        m_air = self.air_renewal(altitude, bleed_control)
+        r_g = 287.0
+
+        # Computing atmospheric conditions
+        p_0t = p_0 * (1 + (1.4 - 1) / 2 * flight_mach ** 2) ** 3.5
+        t_0t = t_0 * (1 + (1.4 - 1) / 2 * flight_mach ** 2)
+
+        # Entry of the compressor
+        p_2t = p_0t * self.pi_02
+        t_2t = t_0t
+
+        # Solving the gas generator equation
+        var_solution, converged = _damped_newton(
+            lambda var_to_solve: self.turboshaft_performance_solver_real_gas(
+                var_to_solve, m_c, p_2t, t_2t, m_air
+            ),
+            initial_values,
+        )
+        self.solve_counts["solves"] += np.size(altitude)
+        self.solve_counts["fallbacks"] += int(np.sum(~converged))
+        for idx in np.where(~converged)[0]:
+            var_solution[:, idx] = fsolve(
+                self.turboshaft_performance_solver_real_gas,
+                np.array([300, 500, 1200, 3, 400000]),
+                (m_c[idx], p_2t[idx], t_2t[idx], m_air[idx]),
+                xtol=1e-8,
+            )
+
+        # Evaluation at the solution to get the other characteristics of the engine
+        self.turboshaft_performance_solver_real_gas(var_solution, m_c, p_2t, t_2t, m_air)
+        t_4t = self.t_4t_int
+        t_41t = self.t_41t_int
+        t_45t = self.t_45t_int
+        p_41t = self.p_41t_int
+        opr = self.opr_int
+        g_r = self.g_int
+        f_fuel_ratio = self.f_fuel_ratio_int
+        air_mass_flow = self.m_int
+
+        p_45t = p_41t * self.alfa_p
+        icb = self.inter_compressor_bleed / air_mass_flow
+
+        # Solving the exhaust equation
+        t_5t_0 = np.full((1, np.size(altitude)), 900.0)
+        t_5t, converged = _damped_newton(
+            lambda t_5t_to_solve: self.exhaust_mach_solver_real_gas(
+                t_5t_to_solve, t_45t, p_45t, p_0
+            ),
+            t_5t_0,
+        )
+        t_5t = t_5t[0]
+        for idx in np.where(~converged)[0]:
+            t_5t[idx] = fsolve(
+                self.exhaust_mach_solver_real_gas,
+                t_5t_0[:, idx],
+                (t_45t[idx], p_45t[idx], p_0[idx]),
+            )[0]
+
+        self.exhaust_mach_solver_real_gas(t_5t, t_45t, p_45t, p_0)
+        mach_8 = self.mach_8_int
+
+        cp_45, _, _ = self.compute_cp_cv_gamma(t_45t)
+        cp_5, _, gamma5 = self.compute_cp_cv_gamma(t_5t)
+
+        # Computing the shaft power output
+        power = (
+            air_mass_flow
+            * (1 - g_r + f_fuel_ratio - icb)
+            * (cp_45 * t_45t - cp_5 * t_5t)
+            * self.gearbox_efficiency
+        )
+
+        t_8 = t_5t / (1 + (gamma5 - 1) / 2 * mach_8 ** 2)
+        v_8 = mach_8 * np.sqrt(gamma5 * r_g * t_8)
+
+        # Computing the exhaust thrust
+        thrust_exhaust = (
+            air_mass_flow
+            * (1 + f_fuel_ratio - icb - g_r)
+            * (v_8 - flight_mach * np.sqrt(t_0 * 287.0 * 1.4))
+        )
+
+        return (
+            t_4t,
+            air_mass_flow,
+            power / 1000.0,
+            f_fuel_ratio,
+            p_41t,
+            opr,
+            t_41t,
+            t_45t,
+            thrust_exhaust,
+            var_solution,
+        )
+
+    def turboshaft_performance_envelope_limits_real_gas_batch(
+        self, limit_name, limit_value, altitude, mach_vol, tolerance=1e-8, max_iterations=50
+    ):
+
+        """
+        Same as turboshaft_performance_envelope_limits_real_gas for several flight points at once:
+        the fuel flows of all the points are found together with a secant method, the gas
+        generator equations of each iteration being solved from the solution of the previous one.
+        Points for which it does not converge are solved with
+        turboshaft_performance_envelope_limits_real_gas.
+
+        :param limit_name: the name of the limit for which we want to find the performance, can be
+         "opr", "t_45t" or "power"
+        :param limit_value: the values of the limit, no unit for the opr, K for the t_45t and kW
+        for the power
+        :param altitude: the flight altitudes, in m
+        :param mach_vol: the flight mach numbers
+        :param tolerance: relative tolerance on the fuel flows
+        :param max_iterations: maximum number of secant iterations
+
+        :return fuel_flow: the fuel flows that constrain the engine to the desired limit, in kg/s
+        :return performance: the outputs of turboshaft_performance_real_gas_batch at these fuel
+        flows
+        """
+
+        limit_index = {"power": 2, "opr": 5, "t_45t": 7}
+        if limit_name not in limit_index:
+            raise FastBasicTPEngineUnknownLimit(
+                "Unknown limit provided, should be opr, t_45t or power"
+            )
+
+        altitude, mach_vol, limit_value = (
+            np.ravel(value).astype(float)
+            for value in np.broadcast_arrays(altitude, mach_vol, limit_value)
+        )
+
+        # Points start from the fuel flow predicted with the fuel flow and slope found for the same
+        # limit in the same cell of flight conditions, when the prediction stays close to it, and
+        # take a first Newton step with that slope. Others take a first step of 1% of the fuel flow.
+        fuel_flow = 0.046 * (1 - altitude / 29000)
+        slope = np.full(np.size(altitude), np.nan)
+        seed_keys = [
+            (
+                limit_name,
+                int(np.floor(altitude_point / SEED_RESOLUTION[0])),
+                int(np.floor(mach_point / SEED_RESOLUTION[1])),
+            )
+            for altitude_point, mach_point in zip(altitude, mach_vol)
+        ]
+        for idx, seed_key in enumerate(seed_keys):
+            if seed_key in self._fuel_flow_seeds:
+                seed_fuel_flow, seed_limit_value, seed_slope = self._fuel_flow_seeds[seed_key]
+                predicted_fuel_flow = (
+                    seed_fuel_flow + (limit_value[idx] - seed_limit_value) / seed_slope
+                )
+                if 0.5 * seed_fuel_flow < predicted_fuel_flow < 2.0 * seed_fuel_flow:
+                    fuel_flow[idx] = predicted_fuel_flow
+                    slope[idx] = seed_slope
+
+        # Performance at the last fuel flow evaluated for each point
+        performance = list(
+            self.turboshaft_performance_real_gas_batch(altitude, mach_vol, fuel_flow)
+        )
+        difference = performance[limit_index[limit_name]] - limit_value
+
+        seeded = np.isfinite(slope)
+        step = np.where(seeded, -difference / np.where(seeded, slope, 1.0), 0.01 * fuel_flow)
+        new_fuel_flow = fuel_flow + step
+        converged = seeded & (np.abs(step) <= tolerance * np.abs(fuel_flow))
+        active = ~converged & np.isfinite(new_fuel_flow)
+        for _ in range(max_iterations):
+            if not np.any(active):
+                break
+
+            new_performance = self.turboshaft_performance_real_gas_batch(
+                altitude[active],
+                mach_vol[active],
+                new_fuel_flow[active],
+                initial_values=performance[-1][:, active],
+            )
+            new_difference = new_performance[limit_index[limit_name]] - limit_value[active]
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                slope[active] = (new_difference - difference[active]) / (
+                    new_fuel_flow[active] - fuel_flow[active]
+                )
+                step = -new_difference / slope[active]
+
+            for value, new_value in zip(performance, new_performance):
+                value[..., active] = new_value
+            fuel_flow[active] = new_fuel_flow[active]
+            difference[active] = new_difference
+            new_fuel_flow[active] = fuel_flow[active] + step
+
+            converged[active] = np.abs(step) <= tolerance * np.abs(fuel_flow[active])
+            active = ~converged & np.isfinite(new_fuel_flow)
+
+        # Fuel flows that are not physical are searched again from the default starting point
+        converged &= fuel_flow > 0.0
+
+        for idx in np.where(converged)[0]:
+            _save(
+                self._fuel_flow_seeds,
+                seed_keys[idx],
+                (fuel_flow[idx], limit_value[idx], slope[idx]),
+            )
+
+        for idx in np.where(~converged)[0]:
+            fuel_flow[idx] = self.turboshaft_performance_envelope_limits_real_gas(
+                limit_name, limit_value[idx], altitude[idx], mach_vol[idx]
+            )
+            for value, new_value in zip(
+                performance,
+                self.turboshaft_performance_real_gas_batch(
+                    altitude[idx], mach_vol[idx], fuel_flow[idx]
+                ),
+            ):
+                value[..., idx] = new_value[..., 0]
+
+        return fuel_flow, tuple(performance)
+
+    def turboshaft_compute_within_limits_batch(self, target_power, altitude, mach_vol):
+
+        """
+        Same as turboshaft_compute_within_limits for several flight points at once, the limits
+        being checked for each point.
+
+        :param target_power: required powers, in kW.
+        :param altitude: the flight altitudes, in m.
+        :param mach_vol: the flight mach numbers.
+
+        :return fuel: the fuel flows giving the required powers or highest achievable powers, in
+        kg/s.
+        :return power_sol: the required powers or highest achievable powers, in kW.
+        :return thrust_sol: the exhaust thrusts, in N.
+        """
+
+        target_power, altitude, mach_vol = (
+            np.ravel(value).astype(float)
+            for value in np.broadcast_arrays(target_power, altitude, mach_vol)
+        )
+
+        # Check if we can get to the target power
+        fuel, performance = self.turboshaft_performance_envelope_limits_real_gas_batch(
+            "power", target_power, altitude, mach_vol
+        )
+
+        _, _, power_sol, _, _, opr_sol, _, t_45t_sol, thrust_sol, _ = performance
+
+        # If target can't be reached we see which limit we have attained and get the performances
+        # corresponding to that limit
+        itt_limited = t_45t_sol > self.itt_limit
+        if np.any(itt_limited):
+            (
+                fuel[itt_limited],
+                performance,
+            ) = self.turboshaft_performance_envelope_limits_real_gas_batch(
+                "t_45t", self.itt_limit, altitude[itt_limited], mach_vol[itt_limited]
+            )
+            power_sol[itt_limited] = performance[2]
+            opr_sol[itt_limited] = performance[5]
+            thrust_sol[itt_limited] = performance[8]
+
+        opr_limited = opr_sol > self.opr_limit
+        if np.any(opr_limited):
+            (
+                fuel[opr_limited],
+                performance,
+            ) = self.turboshaft_performance_envelope_limits_real_gas_batch(
+                "opr", self.opr_limit, altitude[opr_limited], mach_vol[opr_limited]
+            )
+            power_sol[opr_limited] = performance[2]
+            thrust_sol[opr_limited] = performance[8]
+
+        return fuel, power_sol, thrust_sol
+
     def compute_flight_points(self, flight_points: oad.FlightPoint):
         # pylint: disable=too-many-arguments
         # they define the trajectory
@@ -1343,10 +1761,13 @@ class BasicTPEngine(AbstractFuelPropulsion):
 
         h_vol = flight_points.altitude
         mach_vol = flight_points.mach
-        _, power_out, _ = self.turboshaft_compute_within_limits(
+        _, power_out, _ = self.turboshaft_compute_within_limits_batch(
             self.max_power_avail, h_vol, mach_vol
         )
 
+        if np.size(h_vol) == 1:
+            return power_out[0]
+
         return power_out
 
     def sfc(
@@ -1362,60 +1783,45 @@ class BasicTPEngine(AbstractFuelPropulsion):
         :return: SFC (in kg/s/W) and power (in W)
         """
 
-        # Compute sfc
-        power_shaft = np.zeros(np.size(thrust))
-        # torque = np.zeros(np.size(thrust))
-        sfc = np.zeros(np.size(thrust))
-        if np.size(thrust) == 1:
-            thrust_propeller = thrust
-            while True:
-                power_shaft = (
-                    thrust_propeller
-                    * atmosphere.true_airspeed
-                    / self.propeller_efficiency(thrust_propeller, atmosphere)
-                )
-                h_vol_point = atmosphere.get_altitude(altitude_in_feet=False)
-                mach_vol_point = atmosphere.mach
-
-                power_in_kw = power_shaft / 1000.0
-
-                fuel_point, power_out, thrust_exhaust = self.turboshaft_compute_within_limits(
-                    power_in_kw, h_vol_point, mach_vol_point
-                )
-                power_out_watts = power_out * 1000.0
+        # All the points are solved together, until the exhaust thrust of each point is consistent
+        # with its propeller thrust
+        thrust_vector, altitude, mach = (
+            np.ravel(value).astype(float)
+            for value in np.broadcast_arrays(
+                thrust, atmosphere.get_altitude(altitude_in_feet=False), atmosphere.mach
+            )
+        )
+        power_shaft = np.zeros(np.size(thrust_vector))
+        sfc = np.zeros(np.size(thrust_vector))
+        thrust_propeller = np.copy(thrust_vector)
+        active = np.ones(np.size(thrust_vector), dtype=bool)
+        while np.any(active):
+            local_atmosphere = Atmosphere(altitude[active], altitude_in_feet=False)
+            local_atmosphere.mach = mach[active]
+            power_in_kw = (
+                thrust_propeller[active]
+                * local_atmosphere.true_airspeed
+                / self.propeller_efficiency(thrust_propeller[active], local_atmosphere)
+                / 1000.0
+            )
+            fuel, power_out, thrust_exhaust = self.turboshaft_compute_within_limits_batch(
+                power_in_kw, altitude[active], mach[active]
+            )
+            power_out_watts = power_out * 1000.0
+            sfc[active] = fuel / power_out_watts
+            power_shaft[active] = power_out_watts
+            consistent = (
+                np.abs(thrust_vector[active] - thrust_propeller[active] - thrust_exhaust)
+                / thrust_vector[active]
+                < 1e-3
+            )
+            thrust_propeller[active] = np.where(
+                consistent, thrust_propeller[active], thrust_vector[active] - thrust_exhaust
+            )
+            active[active] = ~consistent
 
-                sfc = fuel_point / power_out_watts
-                power_shaft = power_out_watts
-                if abs(thrust - thrust_propeller - thrust_exhaust) / thrust < 1e-3:
-                    break
-                else:
-                    thrust_propeller = thrust - thrust_exhaust
-        else:
-            for idx in range(np.size(thrust)):
-                thrust_propeller = thrust[idx]
-                local_atmosphere = Atmosphere(
-                    atmosphere.get_altitude(altitude_in_feet=False)[idx], altitude_in_feet=False
-                )
-                local_atmosphere.mach = atmosphere.mach[idx]
-                while True:
-                    power_shaft[idx] = (
-                        thrust_propeller
-                        * local_atmosphere.true_airspeed
-                        / self.propeller_efficiency(thrust_propeller, local_atmosphere)
-                    )
-                    h_vol = local_atmosphere.get_altitude(altitude_in_feet=False)
-                    mach_vol = local_atmosphere.mach
-                    power_in_kw = power_shaft[idx] / 1000.0
-                    fuel, power_out, thrust_exhaust = self.turboshaft_compute_within_limits(
-                        power_in_kw, h_vol, mach_vol
-                    )
-                    power_out_watts = power_out * 1000.0
-                    sfc[idx] = fuel / power_out_watts
-                    power_shaft[idx] = power_out_watts
-                    if abs(thrust[idx] - thrust_propeller - thrust_exhaust) / thrust[idx] < 1e-3:
-                        break
-                    else:
-                        thrust_propeller = thrust[idx] - thrust_exhaust
+        if np.size(thrust) == 1:
+            return sfc[0], power_shaft[0]
 
         return sfc, power_shaft
 
@@ -1450,27 +1856,13 @@ class BasicTPEngine(AbstractFuelPropulsion):
         )
 
         altitudes_to_evaluate = atmosphere.get_altitude(altitude_in_feet=False)
+        _, power_out, exhaust_thrust_at_max_power = self.turboshaft_compute_within_limits_batch(
+            self.max_power_avail, altitudes_to_evaluate, atmosphere.mach
+        )
+        max_power = power_out * 1000.0
         if np.size(altitudes_to_evaluate) == 1:
-            h_vol = altitudes_to_evaluate
-            mach_vol = atmosphere.mach
-            _, power_out, thrust_exhaust = self.turboshaft_compute_within_limits(
-                self.max_power_avail, h_vol, mach_vol
-            )
-            power_out_watts = power_out * 1000.0
-            max_power = power_out_watts
-            exhaust_thrust_at_max_power = thrust_exhaust
-        else:
-            max_power = np.zeros(len(altitudes_to_evaluate))
-            exhaust_thrust_at_max_power = np.zeros(len(altitudes_to_evaluate))
-            for idx, h_vol in enumerate(altitudes_to_evaluate):
-                mach_vol = atmosphere.mach[idx]
-                _, power_out, thrust_exhaust = self.turboshaft_compute_within_limits(
-                    self.max_power_avail, h_vol, mach_vol
-                )
-                power_out_watts = power_out * 1000.0
-                # max_power = power_out_watts
-                max_power[idx] = power_out_watts
-                exhaust_thrust_at_max_power[idx] = thrust_exhaust
+            max_power = max_power[0]
+            exhaust_thrust_at_max_power = exhaust_thrust_at_max_power[0]
 
         # Max power --> Array containing the maximum available power at the given flight points
         # thrust_max_propeller --> Array containing the maximum available thrust at the given
@@ -1647,6 +2039,85 @@ class BasicTPEngine(AbstractFuelPropulsion):
         return drag_force
 
 
+def _save(cache: OrderedDict, key, value):
+    """Saves the value as the most recently used one, removing the oldest one if needed."""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > GAS_GENERATOR_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _damped_newton(function, initial_values, tolerance=1e-8, max_iterations=50):
+    """
+    Solves the independent systems of equations of several points at once with a damped Newton
+    method: the jacobian of each point is computed with forward differences and its Newton step is
+    halved until its residual decreases.
+
+    :param function: the residuals of the points, taking and returning arrays of shape (number of
+    variables, number of points)
+    :param initial_values: the initial values of the variables, of shape (number of variables,
+    number of points)
+    :param tolerance: relative tolerance on the variables
+    :param max_iterations: maximum number of Newton iterations
+
+    :return: the solutions, of shape (number of variables, number of points), and the boolean
+    array of the points for which the method converged
+    """
+
+    var = np.array(initial_values, dtype=float)
+    var_number, point_number = np.shape(var)
+    converged = np.zeros(point_number, dtype=bool)
+
+    # Residuals are not defined everywhere, invalid steps being rejected by the damping
+    with np.errstate(all="ignore"):
+        residual = function(var)
+        residual_norm = np.sum(residual ** 2.0, axis=0)
+
+        for _ in range(max_iterations):
+
+            # Jacobian of each point with forward differences
+            jacobian = np.empty((point_number, var_number, var_number))
+            for idx in range(var_number):
+                step = 1e-7 * np.maximum(np.abs(var[idx]), 1.0)
+                shifted_var = np.copy(var)
+                shifted_var[idx] += step
+                jacobian[:, :, idx] = np.transpose((function(shifted_var) - residual) / step)
+
+            # Newton step, points with an undefined jacobian are not moved
+            valid = np.all(np.isfinite(jacobian), axis=(1, 2)) & np.isfinite(residual_norm)
+            newton_step = np.zeros_like(var)
+            if np.any(valid):
+                newton_step[:, valid] = -np.einsum(
+                    "pij,jp->ip", np.linalg.pinv(jacobian[valid]), residual[:, valid]
+                )
+
+            # Damping of the steps that do not decrease the residual, the ones that still do not
+            # after 10 halvings being rejected
+            damping = np.ones(point_number)
+            for _ in range(10):
+                new_var = var + damping * newton_step
+                new_residual = function(new_var)
+                new_residual_norm = np.sum(new_residual ** 2.0, axis=0)
+                increasing = ~(new_residual_norm <= residual_norm)
+                if not np.any(increasing & valid):
+                    break
+                damping = np.where(increasing, 0.5 * damping, damping)
+            accepted = valid & ~increasing
+
+            converged |= valid & np.all(
+                np.abs(newton_step) <= tolerance * np.maximum(np.abs(var), 1.0), axis=0
+            )
+            var = np.where(accepted, new_var, var)
+            residual = np.where(accepted, new_residual, residual)
+            residual_norm = np.where(accepted, new_residual_norm, residual_norm)
+
+            # Points with a rejected step would not move anymore
+            if np.all(converged | ~accepted):
+                break
+
+    return var, converged
+
+
 @AddKeyAttributes(ENGINE_LABELS)
 class Engine(DynamicAttributeDict):
     """
@@ -15,6 +15,8 @@ Test module for basicIC_engine.py
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import copy
+
 import numpy as np
 
 import fastoad.api as oad
@@ -1148,3 +1150,132 @@ def test_compute_max_power():
     # At higher altitude, higher mach
     flight_points = oad.FlightPoint(altitude=9000, mach=0.8)
     np.testing.assert_allclose(_745_kW_engine.compute_max_power(flight_points), 502.70, atol=1)
+
+    # Several flight points at once
+    flight_points = oad.FlightPoint(altitude=np.array([0.0, 9000.0]), mach=np.array([0.5, 0.8]))
+    np.testing.assert_allclose(
+        _745_kW_engine.compute_max_power(flight_points), [521.99, 502.70], atol=1
+    )
+
+
+def test_compute_within_limits_batch():
+    _745_kW_engine = BasicTPEngine(
+        power_design=745.7,
+        t_41t_design=1350,
+        opr_design=9.5,
+        cruise_altitude_propeller=9000.0,
+        design_altitude=0.0,
+        design_mach=0.5,
+        prop_layout=1.0,
+        bleed_control=1.0,
+        itt_limit=1100.0,
+        power_limit=521.99,
+        opr_limit=12.0,
+        speed_SL=SPEED,
+        thrust_SL=THRUST_SL,
+        thrust_limit_SL=THRUST_SL_LIMIT,
+        efficiency_SL=EFFICIENCY_SL,
+        speed_CL=SPEED,
+        thrust_CL=THRUST_CL,
+        thrust_limit_CL=THRUST_CL_LIMIT,
+        efficiency_CL=EFFICIENCY_CL,
+        effective_J=0.95,  # Effective advance ratio factor
+        effective_efficiency_ls=0.97,  # Effective efficiency in low speed conditions
+        effective_efficiency_cruise=0.98,  # Effective efficiency in cruise conditions
+    )
+
+    # Points solved together should give the same results as points solved one by one, including
+    # the ones limited by the turbine temperature or the overall pressure ratio (the last two)
+    target_powers = np.array([300.0, 150.0, 521.99, 521.99])
+    altitudes = np.array([0.0, 3000.0, 9000.0, 9000.0])
+    machs = np.array([0.2, 0.4, 0.5, 0.8])
+
+    fuel, power, thrust = _745_kW_engine.turboshaft_compute_within_limits_batch(
+        target_powers, altitudes, machs
+    )
+
+    for idx in range(len(altitudes)):
+        (
+            expected_fuel,
+            expected_power,
+            expected_thrust,
+        ) = _745_kW_engine.turboshaft_compute_within_limits(
+            target_powers[idx], altitudes[idx], machs[idx]
+        )
+        np.testing.assert_allclose(fuel[idx], expected_fuel, rtol=1e-6)
+        np.testing.assert_allclose(power[idx], expected_power, rtol=1e-6)
+        np.testing.assert_allclose(thrust[idx], expected_thrust, rtol=1e-6)
+    np.testing.assert_allclose(power[:2], target_powers[:2], rtol=1e-6)
+    np.testing.assert_allclose(power[2:], [337.57, 502.70], atol=1)
+
+    # Solving the same points again should only use the saved solutions
+    solve_number = _745_kW_engine.gas_generator_cache_info()["misses"]
+    new_fuel, new_power, new_thrust = _745_kW_engine.turboshaft_compute_within_limits_batch(
+        target_powers, altitudes, machs
+    )
+    np.testing.assert_allclose(new_fuel, fuel, rtol=1e-12)
+    np.testing.assert_allclose(new_power, power, rtol=1e-12)
+    np.testing.assert_allclose(new_thrust, thrust, rtol=1e-12)
+    assert _745_kW_engine.gas_generator_cache_info()["misses"] == solve_number
+    assert _745_kW_engine.gas_generator_cache_info()["hit_rate"] > 0.0
+
+    _745_kW_engine.clear_gas_generator_cache()
+    assert _745_kW_engine.gas_generator_cache_info()["size"] == 0
+
+
+def test_warm_started_limits():
+    engine = BasicTPEngine(
+        power_design=745.7,
+        t_41t_design=1350,
+        opr_design=9.5,
+        cruise_altitude_propeller=9000.0,
+        design_altitude=0.0,
+        design_mach=0.5,
+        prop_layout=1.0,
+        bleed_control=1.0,
+        itt_limit=1100.0,
+        power_limit=521.99,
+        opr_limit=12.0,
+        speed_SL=SPEED,
+        thrust_SL=THRUST_SL,
+        thrust_limit_SL=THRUST_SL_LIMIT,
+        efficiency_SL=EFFICIENCY_SL,
+        speed_CL=SPEED,
+        thrust_CL=THRUST_CL,
+        thrust_limit_CL=THRUST_CL_LIMIT,
+        efficiency_CL=EFFICIENCY_CL,
+        effective_J=0.95,  # Effective advance ratio factor
+        effective_efficiency_ls=0.97,  # Effective efficiency in low speed conditions
+        effective_efficiency_cruise=0.98,  # Effective efficiency in cruise conditions
+    )
+
+    # Kept unused, to be copied each time a new engine is needed
+    fresh_engine = copy.deepcopy(engine)
+
+    # Limit searches done after low power points at the same flight conditions, whose saved fuel
+    # flows are far below the limit ones, should give the same results as on a new engine
+    altitudes = np.array([0.0, 0.0, 3000.0])
+    machs = np.array([0.05, 0.1, 0.1])
+    atmosphere = Atmosphere(altitudes, altitude_in_feet=False)
+    atmosphere.mach = machs
+    engine.sfc(np.array([100.0, 200.0, 150.0]), atmosphere)
+    engine.turboshaft_compute_within_limits_batch(np.full(3, 5.0), altitudes, machs)
+
+    max_thrust = engine.max_thrust(atmosphere)
+    max_power = engine.compute_max_power(oad.FlightPoint(altitude=altitudes, mach=machs))
+    assert np.shape(max_thrust) == np.shape(altitudes)
+    assert np.shape(max_power) == np.shape(altitudes)
+    assert np.all(max_thrust > 0.0)
+    for idx in range(len(altitudes)):
+        local_atmosphere = Atmosphere(altitudes[idx], altitude_in_feet=False)
+        local_atmosphere.mach = machs[idx]
+        np.testing.assert_allclose(
+            max_thrust[idx], copy.deepcopy(fresh_engine).max_thrust(local_atmosphere), rtol=1e-6
+        )
+        np.testing.assert_allclose(
+            max_power[idx],
+            copy.deepcopy(fresh_engine).compute_max_power(
+                oad.FlightPoint(altitude=altitudes[idx], mach=machs[idx])
+            ),
+            rtol=1e-6,
+        )
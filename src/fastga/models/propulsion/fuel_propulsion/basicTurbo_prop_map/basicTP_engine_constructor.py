@@ -13,7 +13,9 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import copy
 import logging
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 import openmdao.api as om
@@ -28,6 +30,7 @@ from fastga.models.aerodynamics.external.propeller_code.compute_propeller_aero i
     THRUST_PTS_NB,
     SPEED_PTS_NB,
 )
+from .turboprop_deck_store import TurbopropDeckStore
 
 # Logger for this module
 _LOGGER = logging.getLogger(__name__)
@@ -68,6 +71,22 @@ class ComputeTurbopropMap(om.ExplicitComponent):
             default=None,
             types=float,
         )
+        self.options.declare(
+            "table_workers",
+            default=1,
+            types=int,
+            lower=1,
+            desc="Number of processes computing the rows of the turboprop tables, i.e. each mach "
+            "number at sea level, cruise and intermediate altitude, at the same time, 1 meaning "
+            "they are computed one after the other",
+        )
+        self.options.declare(
+            "result_folder_path",
+            default="",
+            types=str,
+            desc="Folder in which the computed turboprop decks are saved, so that they are read "
+            "instead of being computed again for the same inputs, no deck saved if empty",
+        )
 
     def setup(self):
         self.add_input("data:propulsion:turboprop:design_point:power", np.nan, units="kW")
@@ -217,6 +236,9 @@ class ComputeTurbopropMap(om.ExplicitComponent):
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
         _LOGGER.debug("Entering turboprop computation")
+        if self.read_saved_deck(inputs, outputs):
+            return
+
         engine_params = {
             "power_design": inputs["data:propulsion:turboprop:design_point:power"],
             "t_41t_design": inputs[
@@ -273,196 +295,234 @@ class ComputeTurbopropMap(om.ExplicitComponent):
         }
         engine = BasicTPEngine(**engine_params)
 
-        cruise_altitude = inputs["data:aerodynamics:propeller:cruise_level:altitude"]
+        cruise_altitude = float(inputs["data:aerodynamics:propeller:cruise_level:altitude"])
 
-        (
-            mach_array_sl,
-            thrust_preliminary_intersect_sl,
-            sfc_general_sl,
-            max_thrust_array_sl,
-        ) = self.construct_table(0.0, inputs, engine)
+        if self.options["intermediate_altitude"] is None:
+            intermediate_altitude = cruise_altitude / 2.0
+        else:
+            intermediate_altitude = self.options["intermediate_altitude"]
 
-        sfc_general_sl, thrust_preliminary_intersect_sl = format_table(
-            sfc_general_sl, thrust_preliminary_intersect_sl
+        tables = self.construct_tables(
+            [0.0, cruise_altitude, intermediate_altitude], inputs, engine
         )
 
-        outputs["data:propulsion:turboprop:sea_level:mach"] = mach_array_sl
-        outputs["data:propulsion:turboprop:sea_level:thrust"] = thrust_preliminary_intersect_sl
-        outputs["data:propulsion:turboprop:sea_level:thrust_limit"] = max_thrust_array_sl
-        outputs["data:propulsion:turboprop:sea_level:sfc"] = sfc_general_sl
+        for level, (mach_array, thrust_preliminary_intersect, sfc_general, max_thrust_array) in zip(
+            ["sea_level", "cruise_level", "intermediate_level"], tables
+        ):
+            sfc_general, thrust_preliminary_intersect = format_table(
+                sfc_general, thrust_preliminary_intersect
+            )
 
-        (
-            mach_array_cl,
-            thrust_preliminary_intersect_cl,
-            sfc_general_cl,
-            max_thrust_array_cl,
-        ) = self.construct_table(cruise_altitude, inputs, engine)
+            outputs["data:propulsion:turboprop:" + level + ":mach"] = mach_array
+            outputs["data:propulsion:turboprop:" + level + ":thrust"] = thrust_preliminary_intersect
+            outputs["data:propulsion:turboprop:" + level + ":thrust_limit"] = max_thrust_array
+            outputs["data:propulsion:turboprop:" + level + ":sfc"] = sfc_general
 
-        sfc_general_cl, thrust_preliminary_intersect_cl = format_table(
-            sfc_general_cl, thrust_preliminary_intersect_cl
-        )
+        outputs["data:propulsion:turboprop:intermediate_level:altitude"] = intermediate_altitude
 
-        outputs["data:propulsion:turboprop:cruise_level:mach"] = mach_array_cl
-        outputs["data:propulsion:turboprop:cruise_level:thrust"] = thrust_preliminary_intersect_cl
-        outputs["data:propulsion:turboprop:cruise_level:thrust_limit"] = max_thrust_array_cl
-        outputs["data:propulsion:turboprop:cruise_level:sfc"] = sfc_general_cl
+        self.save_deck(inputs, outputs)
 
-        if self.options["intermediate_altitude"] is None:
-            intermediate_altitude = cruise_altitude / 2.0
-        else:
-            intermediate_altitude = self.options["intermediate_altitude"]
+        _LOGGER.debug("Finishing turboprop computation")
+
+    def read_saved_deck(self, inputs, outputs) -> bool:
+        """
+        Fills the outputs with the deck saved in the result folder for the same inputs, if any.
+
+        :return: True if a saved deck has been found.
+        """
+        if self.options["result_folder_path"] == "":
+            return False
 
-        (
-            mach_array_il,
-            thrust_preliminary_intersect_il,
-            sfc_general_il,
-            max_thrust_array_il,
-        ) = self.construct_table(intermediate_altitude, inputs, engine)
+        deck_store = TurbopropDeckStore(self.options["result_folder_path"])
+        deck_key = self._deck_key(inputs)
+        results = deck_store.search(deck_key)
+        if results is None:
+            return False
 
-        sfc_general_il, thrust_preliminary_intersect_il = format_table(
-            sfc_general_il, thrust_preliminary_intersect_il
+        for name, value in results.items():
+            outputs[name] = value
+        _LOGGER.debug("Turboprop deck read from %s", deck_store.deck_path(deck_key))
+
+        return True
+
+    def save_deck(self, inputs, outputs):
+        """Saves the outputs in the result folder, if defined."""
+        if self.options["result_folder_path"] == "":
+            return
+
+        TurbopropDeckStore(self.options["result_folder_path"]).save(
+            self._deck_key(inputs), {name: outputs[name] for name in outputs}
         )
 
-        outputs["data:propulsion:turboprop:intermediate_level:altitude"] = intermediate_altitude
-        outputs["data:propulsion:turboprop:intermediate_level:mach"] = mach_array_il
-        outputs[
-            "data:propulsion:turboprop:intermediate_level:thrust"
-        ] = thrust_preliminary_intersect_il
-        outputs["data:propulsion:turboprop:intermediate_level:thrust_limit"] = max_thrust_array_il
-        outputs["data:propulsion:turboprop:intermediate_level:sfc"] = sfc_general_il
+    def _deck_key(self, inputs) -> str:
 
-        _LOGGER.debug("Finishing turboprop computation")
+        options = {
+            name: self.options[name]
+            for name in ["number_of_thrust_subdivision", "intermediate_altitude"]
+        }
+
+        return TurbopropDeckStore.deck_key(inputs, options)
 
     def construct_table(self, altitude, inputs, engine):
         """Construct the sfc table for the given engine at the given altitude."""
+
+        return self.construct_tables([altitude], inputs, engine)[0]
+
+    def construct_tables(self, altitude_list, inputs, engine):
+        """
+        Construct the sfc tables of construct_table for the given engine at several altitudes. The
+        maximum thrusts of all the altitudes and mach numbers are computed at once, then the rows of
+        the tables, i.e. the sfc at each altitude and mach number, are computed in parallel
+        processes if the table_workers option allows it and put back in the same order.
+
+        :return: list of the (mach_array, thrust_preliminary_intersect, sfc_general,
+        max_thrust_array) tables at each altitude.
+        """
         nb_of_mach = MACH_PTS_NB_TURBOPROP
         nb_of_thrust = self.options["number_of_thrust_subdivision"]
+        altitude_list = [float(altitude) for altitude in altitude_list]
 
         cruise_velocity = inputs["data:TLAR:v_cruise"]
         cruise_altitude = inputs["data:aerodynamics:propeller:cruise_level:altitude"]
 
         atm_cruise = Atmosphere(cruise_altitude, altitude_in_feet=False)
 
-        cruise_mach = cruise_velocity / atm_cruise.speed_of_sound
+        cruise_mach = float(cruise_velocity / atm_cruise.speed_of_sound)
 
         # Since the cruise speed gives by construction the highest Mach number we know we will
         # never cross it, hence the following bounds for the mach array
         mach_array = np.linspace(1e-5, 1.3 * cruise_mach, nb_of_mach)
-        # print("\n", mach_array)
-
-        # We then compute the maximum thrust for those mach they are gonna be used to define the
-        # thrust for which we interpolate the fuel consumption
-        max_thrust_list = []
-
-        for mach in mach_array:
-            atm = Atmosphere(altitude=altitude, altitude_in_feet=False)
-            atm.mach = mach
-            max_thrust = engine.max_thrust(atm)
-            max_thrust_list.append(float(max_thrust))
-
-        max_thrust_array = np.array(max_thrust_list)
-        # print("\n", max_thrust_array)
-
-        # thrust_preliminary_intersect will contain the thrust at which we will interpolate our
-        # data. To minimize computation time we will try to build it at relevant point while
-        # keeping the overall number of points low. To do so we will create a linspace containing
-        # nb_of_thrust points for each max thrust and delete all the points that overlap with
-        # linspace covering lower thrust. We initialize slightly higher than the first interval
-        # to ensure that this point will be kept in the first overlap
-        thrust_preliminary_intersect = np.array([min(max_thrust_array) / (nb_of_thrust - 1e-5)])
-
-        for mach in np.flip(mach_array):
-            max_thrust_current_mach = max_thrust_array[np.where(mach_array == mach)[0][0]]
-            # The first element of the linspace
-            first_thrust_array = max_thrust_current_mach / nb_of_thrust
-
-            current_even_spacing = np.linspace(
-                first_thrust_array, max_thrust_current_mach, nb_of_thrust
+
+        # We then compute the maximum thrust for those mach at all altitudes at once, they are
+        # gonna be used to define the thrust for which we interpolate the fuel consumption
+        atm = Atmosphere(np.repeat(altitude_list, nb_of_mach), altitude_in_feet=False)
+        atm.mach = np.tile(mach_array, len(altitude_list))
+        max_thrust_arrays = np.reshape(
+            np.asarray(engine.max_thrust(atm), dtype=float), (len(altitude_list), nb_of_mach)
+        )
+
+        thrust_intersects = [
+            _thrust_intersect(mach_array, max_thrust_array, nb_of_thrust)
+            for max_thrust_array in max_thrust_arrays
+        ]
+
+        # We now compute the sfc everywhere in the validity domain (thrust < thrust_max(mach)),
+        # each row being computed with its own copy of the engine so that the results do not
+        # depend on the order of the computations nor on the number of processes
+        rows = [
+            (altitude, mach, thrust_intersect[thrust_intersect <= max_thrust])
+            for altitude, max_thrust_array, thrust_intersect in zip(
+                altitude_list, max_thrust_arrays, thrust_intersects
             )
+            for mach, max_thrust in zip(mach_array, max_thrust_array)
+        ]
+        workers = min(self.options["table_workers"], len(rows))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_compute_sfc_row, engine, *row) for row in rows]
+                valid_sfc_rows = [future.result() for future in futures]
+        else:
+            valid_sfc_rows = [_compute_sfc_row(copy.deepcopy(engine), *row) for row in rows]
+
+        tables = []
+        for altitude_idx, (max_thrust_array, thrust_preliminary_intersect) in enumerate(
+            zip(max_thrust_arrays, thrust_intersects)
+        ):
+            sfc_general = np.full(
+                (np.size(mach_array), np.size(thrust_preliminary_intersect)), INVALID_SFC
+            )
+            for mach_idx, max_thrust in enumerate(max_thrust_array):
+                valid_sfc = valid_sfc_rows[altitude_idx * nb_of_mach + mach_idx]
+                sfc_general[mach_idx, thrust_preliminary_intersect <= max_thrust] = valid_sfc
+
+            valid_idx_previous_mach = np.array([])
+            thrust_to_interpolate = np.zeros((1, 1))
+
+            # We now interpolate on the data that are missing but just enough to ensure that we
+            # will be able to do a 2D interpolation with value that are not INVALID_IDX
+            for mach_idx in range(nb_of_mach):
+                corresponding_sfc_array = sfc_general[mach_idx]
+
+                valid_idx = np.where(corresponding_sfc_array != INVALID_SFC)[0]
+
+                valid_thrust = thrust_preliminary_intersect[valid_idx]
+                valid_sfc = corresponding_sfc_array[valid_idx]
+                valid_fuel_flow = np.multiply(valid_thrust, valid_sfc)
+
+                valid_idx_set = set(valid_idx.tolist())
+                valid_idx_previous_mach_set = set(valid_idx_previous_mach.tolist())
+                idx_to_interpolate = np.array(list(valid_idx_previous_mach_set - valid_idx_set))
+
+                for idx in idx_to_interpolate:
+                    thrust_to_interpolate[0, 0] = thrust_preliminary_intersect[idx]
+                    predicted_fuel_flow = valid_fuel_flow[-1]
+                    predicted_sfc = np.divide(predicted_fuel_flow, thrust_to_interpolate)
+
+                    sfc_general[mach_idx, idx] = predicted_sfc
+
+                valid_idx_previous_mach = valid_idx
 
-            # We keep values that don't overlap and add a value slightly above the maximum thrust
-            # because we will need to interpolate the data to complete the table and we want a
-            # point that is not too far to reduce the error because of the over-fitting
-            retained_thrust_idx = np.where(
-                current_even_spacing > np.amax(thrust_preliminary_intersect)
-            )[0]
-            retained_thrust = np.append(
-                current_even_spacing[retained_thrust_idx], np.array([1.1 * max_thrust_current_mach])
+            tables.append(
+                (np.copy(mach_array), thrust_preliminary_intersect, sfc_general, max_thrust_array)
             )
 
-            thrust_preliminary_intersect = np.union1d(thrust_preliminary_intersect, retained_thrust)
-
-        thrust_preliminary_intersect = np.union1d(thrust_preliminary_intersect, max_thrust_array)
-        # print("\n", thrust_preliminary_intersect)
-
-        # We now compute the sfc everywhere in the validity domain (thrust < thrust_max(mach))
-        sfc_general = np.zeros((np.size(mach_array), np.size(thrust_preliminary_intersect)))
-
-        for mach in mach_array:
-            atm = Atmosphere(altitude, altitude_in_feet=False)
-            atm.mach = mach
-            for thrust in thrust_preliminary_intersect:
-                thrust = np.array([thrust])
-                flight_points = oad.FlightPoint(
-                    mach=mach,
-                    altitude=altitude,
-                    engine_setting=EngineSetting.CRUISE,
-                    thrust_is_regulated=True,
-                    thrust_rate=0.0,
-                    thrust=thrust,
-                )
-                if thrust > max_thrust_array[np.where(mach_array == mach)[0][0]]:
-                    sfc = INVALID_SFC
-                else:
-                    engine.compute_flight_points(flight_points)
-                    sfc = flight_points.sfc
-                sfc_general[
-                    np.where(mach_array == mach)[0][0],
-                    np.where(thrust_preliminary_intersect == float(thrust))[0][0],
-                ] = sfc
-
-        # sfc_general_before = np.copy(sfc_general)
-        # print("\n", sfc_general_before)
-
-        valid_idx_previous_mach = np.array([])
-        thrust_to_interpolate = np.zeros((1, 1))
-
-        # We now interpolate on the data that are missing but just enough to ensure that we will
-        # be able to do a 2D interpolation with value that are not INVALID_IDX
-        for mach in mach_array:
-            corresponding_sfc_array = sfc_general[np.where(mach_array == mach)[0]][0]
-
-            valid_idx = np.where(corresponding_sfc_array != INVALID_SFC)[0]
-
-            valid_thrust = thrust_preliminary_intersect[valid_idx]
-            valid_sfc = corresponding_sfc_array[valid_idx]
-            valid_fuel_flow = np.multiply(valid_thrust, valid_sfc)
-
-            valid_idx_set = set(valid_idx.tolist())
-            valid_idx_previous_mach_set = set(valid_idx_previous_mach.tolist())
-            idx_to_interpolate = np.array(list(valid_idx_previous_mach_set - valid_idx_set))
-            # print("\n", idx_to_interpolate)
-
-            for idx in idx_to_interpolate:
-                thrust_to_interpolate[0, 0] = thrust_preliminary_intersect[idx]
-                predicted_fuel_flow = valid_fuel_flow[-1]
-                predicted_sfc = np.divide(predicted_fuel_flow, thrust_to_interpolate)
-
-                sfc_general[np.where(mach_array == mach)[0][0], idx] = predicted_sfc
-
-            valid_idx_previous_mach = valid_idx
-
-        # thrust_plot, mach_plot = np.meshgrid(thrust_preliminary_intersect, mach_array)
-        # fig3d = plt.figure()
-        # ax = Axes3D(fig3d)
-        # ax.scatter(thrust_plot, mach_plot, sfc_general, cmap="viridis",
-        #   linewidth=0.25, label="predicted behaviour")
-        # ax.scatter(thrust_plot, mach_plot, sfc_general_before, cmap="viridis",
-        #   linewidth=0.25, label="reference data")
-        # ax.legend()
-        # plt.show()
-
-        return mach_array, thrust_preliminary_intersect, sfc_general, max_thrust_array
+        return tables
+
+
+def _thrust_intersect(mach_array, max_thrust_array, nb_of_thrust):
+    """Thrusts of the sfc table of an altitude, see ComputeTurbopropMap.construct_tables."""
+
+    # thrust_preliminary_intersect will contain the thrust at which we will interpolate our
+    # data. To minimize computation time we will try to build it at relevant point while
+    # keeping the overall number of points low. To do so we will create a linspace containing
+    # nb_of_thrust points for each max thrust and delete all the points that overlap with
+    # linspace covering lower thrust. We initialize slightly higher than the first interval
+    # to ensure that this point will be kept in the first overlap
+    thrust_preliminary_intersect = np.array([min(max_thrust_array) / (nb_of_thrust - 1e-5)])
+
+    for max_thrust_current_mach in np.flip(max_thrust_array):
+        # The first element of the linspace
+        first_thrust_array = max_thrust_current_mach / nb_of_thrust
+
+        current_even_spacing = np.linspace(
+            first_thrust_array, max_thrust_current_mach, nb_of_thrust
+        )
+
+        # We keep values that don't overlap and add a value slightly above the maximum thrust
+        # because we will need to interpolate the data to complete the table and we want a
+        # point that is not too far to reduce the error because of the over-fitting
+        retained_thrust_idx = np.where(
+            current_even_spacing > np.amax(thrust_preliminary_intersect)
+        )[0]
+        retained_thrust = np.append(
+            current_even_spacing[retained_thrust_idx], np.array([1.1 * max_thrust_current_mach])
+        )
+
+        thrust_preliminary_intersect = np.union1d(thrust_preliminary_intersect, retained_thrust)
+
+    return np.union1d(thrust_preliminary_intersect, max_thrust_array)
+
+
+def _compute_sfc_row(engine, altitude, mach, thrust_array):
+    """
+    Computes the sfc of the engine at the given thrusts, at the altitude and mach number of a row
+    of the sfc tables. Defined at module level so that it can be run in another process.
+    """
+    nb_of_points = np.size(thrust_array)
+    if nb_of_points == 0:
+        return np.array([])
+
+    flight_points = oad.FlightPoint(
+        mach=np.full(nb_of_points, mach),
+        altitude=np.full(nb_of_points, altitude),
+        engine_setting=np.full(nb_of_points, EngineSetting.CRUISE),
+        thrust_is_regulated=np.full(nb_of_points, True),
+        thrust_rate=np.zeros(nb_of_points),
+        thrust=np.array(thrust_array, dtype=float),
+    )
+    engine.compute_flight_points(flight_points)
+
+    return np.asarray(flight_points.sfc, dtype=float)
 
 
 def format_table(sfc_table, thrust_table):
@@ -16,7 +16,7 @@
 import logging
 from typing import Union, Sequence, Tuple, Optional
 import numpy as np
-from scipy.interpolate import interp2d, interp1d
+from scipy.interpolate import RectBivariateSpline
 
 import fastoad.api as oad
 from fastoad.constants import EngineSetting
@@ -233,6 +233,9 @@ class BasicTPEngineMapped(AbstractFuelPropulsion):
         self.turbo_sfc_IL = formatted_sfc_IL
         self.intermediate_altitude = float(level_IL)
 
+        # Sfc interpolators of the three levels, built at first use, see read_sfc_table
+        self._sfc_interpolators = None
+
         self.specific_shape = None
 
         # Declare sub-components attribute
@@ -458,58 +461,97 @@ class BasicTPEngineMapped(AbstractFuelPropulsion):
 
         return self.turboprop.compute_max_power(flight_points)
 
-    def read_sfc_table(self, thrust: float, atmosphere: float) -> float:
-        """Reads the turboprop table and gives corresponding sfc."""
+    def read_sfc_table(
+        self, thrust: Union[float, Sequence[float]], atmosphere: Atmosphere
+    ) -> Union[float, np.ndarray]:
+        """
+        Reads the turboprop tables and gives corresponding sfc, blending the tables of the two
+        levels around each altitude.
+
+        :param thrust: Thrust (in N)
+        :param atmosphere: Atmosphere instance at intended altitude
+        :return: SFC (in kg/s/N)
+        """
         altitude = atmosphere.get_altitude(altitude_in_feet=False)
-        if altitude > self.intermediate_altitude:
-            mach_il = np.clip(atmosphere.mach, 1e-5, max(self.turbo_mach_IL))
-            mach_cl = np.clip(atmosphere.mach, 1e-5, max(self.turbo_mach_CL))
-            sfc_interp_IL = interp2d(self.turbo_thrust_IL, self.turbo_mach_IL, self.turbo_sfc_IL)
-            max_thrust_interp_IL = interp1d(self.turbo_mach_IL, self.turbo_thrust_max_IL)
-            sfc_interp_CL = interp2d(self.turbo_thrust_CL, self.turbo_mach_CL, self.turbo_sfc_CL)
-            max_thrust_interp_CL = interp1d(self.turbo_mach_CL, self.turbo_thrust_max_CL)
-            thrust_interp_IL = np.clip(
-                thrust, min(self.turbo_thrust_IL), max_thrust_interp_IL(mach_il)
-            )
-            thrust_interp_CL = np.clip(
-                thrust, min(self.turbo_thrust_CL), max_thrust_interp_CL(mach_cl)
-            )
-            lower_bound = float(sfc_interp_IL(thrust_interp_IL, mach_il))
-            upper_bound = float(sfc_interp_CL(thrust_interp_CL, mach_cl))
-            sfc = float(
-                interp1d(
-                    [self.intermediate_altitude, self.cruise_altitude_propeller],
-                    [lower_bound, upper_bound],
-                )(max(float(altitude), 0.0))
-            )
-        else:
-            mach_sl = np.clip(atmosphere.mach, 1e-5, max(self.turbo_mach_SL))
-            mach_il = np.clip(atmosphere.mach, 1e-5, max(self.turbo_mach_IL))
-            sfc_interp_SL = interp2d(self.turbo_thrust_SL, self.turbo_mach_SL, self.turbo_sfc_SL)
-            max_thrust_interp_SL = interp1d(self.turbo_mach_SL, self.turbo_thrust_max_SL)
-            sfc_interp_IL = interp2d(self.turbo_thrust_IL, self.turbo_mach_IL, self.turbo_sfc_IL)
-            max_thrust_interp_IL = interp1d(self.turbo_mach_IL, self.turbo_thrust_max_IL)
-            thrust_interp_SL = np.clip(
-                thrust, min(self.turbo_thrust_SL), max_thrust_interp_SL(mach_sl)
-            )
-            thrust_interp_IL = np.clip(
-                thrust, min(self.turbo_thrust_IL), max_thrust_interp_IL(mach_il)
-            )
-            lower_bound = float(sfc_interp_SL(thrust_interp_SL, mach_sl))
-            upper_bound = float(sfc_interp_IL(thrust_interp_IL, mach_il))
-            sfc = float(
-                interp1d([0.0, self.intermediate_altitude], [lower_bound, upper_bound])(
-                    max(float(altitude), 0.0)
+        sfc_interp_SL, sfc_interp_IL, sfc_interp_CL = self.sfc_interpolators()
+        sfc_SL = _read_level_sfc(
+            thrust,
+            atmosphere.mach,
+            self.turbo_mach_SL,
+            self.turbo_thrust_SL,
+            self.turbo_thrust_max_SL,
+            sfc_interp_SL,
+        )
+        sfc_IL = _read_level_sfc(
+            thrust,
+            atmosphere.mach,
+            self.turbo_mach_IL,
+            self.turbo_thrust_IL,
+            self.turbo_thrust_max_IL,
+            sfc_interp_IL,
+        )
+        sfc_CL = _read_level_sfc(
+            thrust,
+            atmosphere.mach,
+            self.turbo_mach_CL,
+            self.turbo_thrust_CL,
+            self.turbo_thrust_max_CL,
+            sfc_interp_CL,
+        )
+        sfc = self._blend_levels(altitude, sfc_SL, sfc_IL, sfc_CL)
+
+        if np.ndim(sfc) == 0:
+            return float(sfc)
+
+        return sfc
+
+    def sfc_interpolators(
+        self,
+    ) -> Tuple[RectBivariateSpline, RectBivariateSpline, RectBivariateSpline]:
+        """
+        Returns the linear interpolators of the sfc with respect to mach and thrust at sea level,
+        intermediate level and cruise level. They are built at first call only.
+
+        :return: sea level, intermediate level and cruise level interpolators
+        """
+        if self._sfc_interpolators is None:
+            self._sfc_interpolators = tuple(
+                RectBivariateSpline(turbo_mach, turbo_thrust, turbo_sfc, kx=1, ky=1)
+                for turbo_mach, turbo_thrust, turbo_sfc in (
+                    (self.turbo_mach_SL, self.turbo_thrust_SL, self.turbo_sfc_SL),
+                    (self.turbo_mach_IL, self.turbo_thrust_IL, self.turbo_sfc_IL),
+                    (self.turbo_mach_CL, self.turbo_thrust_CL, self.turbo_sfc_CL),
                 )
             )
 
-        return sfc
+        return self._sfc_interpolators
+
+    def _blend_levels(self, altitude, value_SL, value_IL, value_CL):
+        """
+        Interpolates linearly with respect to altitude between the values at sea level and
+        intermediate level below the intermediate altitude, and between the values at intermediate
+        level and cruise level above it.
+        """
+        altitude = np.maximum(altitude, 0.0)
+        ratio_low = np.minimum(altitude / self.intermediate_altitude, 1.0)
+        ratio_high = np.clip(
+            (altitude - self.intermediate_altitude)
+            / (self.cruise_altitude_propeller - self.intermediate_altitude),
+            0.0,
+            1.0,
+        )
+
+        return np.where(
+            altitude > self.intermediate_altitude,
+            value_IL + (value_CL - value_IL) * ratio_high,
+            value_SL + (value_IL - value_SL) * ratio_low,
+        )
 
     def sfc(
         self,
         thrust: Union[float, Sequence[float]],
         atmosphere: Atmosphere,
-    ) -> Tuple[np.ndarray, np.ndarray]:
+    ) -> Union[float, np.ndarray]:
         """
         Computation of the SFC.
 
@@ -518,19 +560,7 @@ class BasicTPEngineMapped(AbstractFuelPropulsion):
         :return: SFC (in kg/s/N)
         """
 
-        # torque = np.zeros(np.size(thrust))
-        sfc = np.zeros(np.size(thrust))
-        if np.size(thrust) == 1:
-            sfc = self.read_sfc_table(thrust, atmosphere)
-        else:
-            for idx in range(np.size(thrust)):
-                local_atmosphere = Atmosphere(
-                    atmosphere.get_altitude(altitude_in_feet=False)[idx], altitude_in_feet=False
-                )
-                local_atmosphere.mach = atmosphere.mach[idx]
-                sfc[idx] = self.read_sfc_table(thrust[idx], local_atmosphere)
-
-        return sfc
+        return self.read_sfc_table(thrust, atmosphere)
 
     def max_thrust(
         self,
@@ -544,52 +574,36 @@ class BasicTPEngineMapped(AbstractFuelPropulsion):
         """
 
         altitude = atmosphere.get_altitude(altitude_in_feet=False)
-        if np.size(altitude) == 1:
-            mach = atmosphere.mach
-            max_thrust = self._max_thrust(altitude, mach)
-            if isinstance(max_thrust, float):
-                max_thrust = np.array([max_thrust])
-        else:
-            max_thrust = np.zeros(np.size(altitude))
-            mach_array = atmosphere.mach
-            for idx in range(np.size(altitude)):
-                max_thrust[idx] = self._max_thrust(altitude[idx], mach_array[idx])
-
-        return max_thrust
-
-    def _max_thrust(self, altitude: float, mach: float) -> np.ndarray:
-
-        if altitude > self.intermediate_altitude:
-            max_thrust_interp_IL = interp1d(self.turbo_mach_IL, self.turbo_thrust_max_IL)
-            max_thrust_interp_CL = interp1d(self.turbo_mach_CL, self.turbo_thrust_max_CL)
-            max_thrust_IL = float(
-                max_thrust_interp_IL(np.clip(mach, 1e-5, max(self.turbo_mach_IL)))
-            )
-            max_thrust_CL = float(
-                max_thrust_interp_CL(np.clip(mach, 1e-5, max(self.turbo_mach_CL)))
-            )
-            max_thrust = float(
-                interp1d(
-                    [self.intermediate_altitude, self.cruise_altitude_propeller],
-                    [max_thrust_IL, max_thrust_CL],
-                )(max(float(altitude), 0.0))
-            )
-        else:
-            max_thrust_interp_SL = interp1d(self.turbo_mach_SL, self.turbo_thrust_max_SL)
-            max_thrust_interp_IL = interp1d(self.turbo_mach_CL, self.turbo_thrust_max_CL)
-            max_thrust_SL = float(
-                max_thrust_interp_SL(np.clip(mach, 1e-5, max(self.turbo_mach_SL)))
-            )
-            max_thrust_IL = float(
-                max_thrust_interp_IL(np.clip(mach, 1e-5, max(self.turbo_mach_IL)))
-            )
-            max_thrust = float(
-                interp1d([0.0, self.intermediate_altitude], [max_thrust_SL, max_thrust_IL])(
-                    max(float(altitude), 0.0)
-                )
-            )
+        mach = atmosphere.mach
+        max_thrust_SL = np.interp(
+            np.clip(mach, 1e-5, max(self.turbo_mach_SL)),
+            self.turbo_mach_SL,
+            self.turbo_thrust_max_SL,
+        )
+        max_thrust_IL = np.interp(
+            np.clip(mach, 1e-5, max(self.turbo_mach_IL)),
+            self.turbo_mach_IL,
+            self.turbo_thrust_max_IL,
+        )
+        max_thrust_CL = np.interp(
+            np.clip(mach, 1e-5, max(self.turbo_mach_CL)),
+            self.turbo_mach_CL,
+            self.turbo_thrust_max_CL,
+        )
+        # Below the intermediate altitude, the upper bound is read in the cruise level table at the
+        # mach numbers clipped to the intermediate level ones, as done so far, not to change results
+        max_thrust_IL_low = np.interp(
+            np.clip(mach, 1e-5, max(self.turbo_mach_IL)),
+            self.turbo_mach_CL,
+            self.turbo_thrust_max_CL,
+        )
+        max_thrust = np.where(
+            altitude > self.intermediate_altitude,
+            self._blend_levels(altitude, max_thrust_SL, max_thrust_IL, max_thrust_CL),
+            self._blend_levels(altitude, max_thrust_SL, max_thrust_IL_low, max_thrust_CL),
+        )
 
-        return max_thrust
+        return np.atleast_1d(max_thrust)
 
     def propeller_efficiency(
         self, thrust: Union[float, Sequence[float]], atmosphere: Atmosphere
@@ -679,6 +693,16 @@ class Nacelle(DynamicAttributeDict):
     """
 
 
+def _read_level_sfc(thrust, mach, turbo_mach, turbo_thrust, turbo_thrust_max, sfc_interpolator):
+    """
+    Reads the sfc in the table of one level, mach and thrust being clipped to the table limits.
+    """
+    mach = np.clip(mach, 1e-5, max(turbo_mach))
+    thrust = np.clip(thrust, min(turbo_thrust), np.interp(mach, turbo_mach, turbo_thrust_max))
+
+    return sfc_interpolator.ev(mach, thrust)
+
+
 def reformat_table(thrust_table, sfc_table):
     """Reformat to fit the OpenMDAO formalism."""
     valid_idx_array = np.where(thrust_table != 0.0)[0]
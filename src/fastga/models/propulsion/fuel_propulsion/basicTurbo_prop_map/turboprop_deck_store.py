@@ -0,0 +1,121 @@
+"""Persistent storage of the turboprop decks computed with the parametric turboprop model."""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import glob
+import logging
+import os
+import os.path as pth
+from typing import Optional
+
+import numpy as np
+
+from fastga.utils.resource_management.file_lock import FileLock, atomic_write
+from fastga.utils.resource_management.input_hash import hash_inputs
+
+# Version of the deck computation, saved in each deck: decks of another version are ignored
+TURBOPROP_DECK_VERSION = 1
+DECK_FILE_PREFIX = "turboprop_deck_"
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TurbopropDeckStore:
+    """
+    Folder of the turboprop decks (sfc and maximum thrust tables at each altitude) indexed by the
+    hash of everything they are computed from: the design point, the off-design limits, the
+    propeller tables and the efficiencies, losses and bleeds of the engine.
+
+    Each deck is saved in its own npz file named after its hash, together with the hash and the
+    version of the computation, so that a deck saved by another version is never read.
+    """
+
+    def __init__(self, result_folder_path: str):
+        """
+        :param result_folder_path: folder in which the decks are saved.
+        """
+        self.result_folder_path = result_folder_path
+
+    @staticmethod
+    def deck_key(inputs, options: dict) -> str:
+        """
+        Returns the hash identifying a deck.
+
+        :param inputs: the inputs of the deck computation, vectors being allowed.
+        :param options: the options of the deck computation.
+        """
+        return hash_inputs(inputs, version=TURBOPROP_DECK_VERSION, options=options)
+
+    def deck_path(self, deck_key: str) -> str:
+        """Returns the path of the file of a deck."""
+        return pth.join(self.result_folder_path, DECK_FILE_PREFIX + deck_key + ".npz")
+
+    def search(self, deck_key: str) -> Optional[dict]:
+        """
+        Searches a deck.
+
+        :param deck_key: the hash of the deck, see deck_key.
+        :return: dictionary of the saved arrays, None if not found or saved by another version.
+        """
+        deck_path = self.deck_path(deck_key)
+        if not pth.exists(deck_path):
+            return None
+
+        # noinspection PyBroadException
+        try:
+            with np.load(deck_path) as deck:
+                if int(deck["version"]) != TURBOPROP_DECK_VERSION or str(deck["key"]) != deck_key:
+                    return None
+                return {name: deck[name] for name in deck.files if name not in ["version", "key"]}
+        except Exception:
+            _LOGGER.info("Error while trying to read %s turboprop deck!", deck_path)
+            return None
+
+    def save(self, deck_key: str, results: dict):
+        """
+        Saves a deck. It is written in a temporary file first, then renamed, so that an
+        interrupted computation never leaves a partial deck, while other processes are kept from
+        saving it at the same time.
+
+        :param deck_key: the hash of the deck, see deck_key.
+        :param results: dictionary of the results, values being floats or arrays.
+        """
+        os.makedirs(self.result_folder_path, exist_ok=True)
+        saved_results = {name: np.asarray(value, dtype=float) for name, value in results.items()}
+
+        deck_path = self.deck_path(deck_key)
+        with FileLock(deck_path):
+            with atomic_write(deck_path) as tmp_file_path:
+                with open(tmp_file_path, "wb") as tmp_file:
+                    np.savez(
+                        tmp_file,
+                        version=np.array(TURBOPROP_DECK_VERSION),
+                        key=np.array(deck_key),
+                        **saved_results,
+                    )
+
+    def invalidate(self, deck_key: Optional[str] = None):
+        """
+        Removes a deck, so that it is computed again at next run.
+
+        :param deck_key: the hash of the deck, see deck_key, all the decks of the folder being
+        removed if None.
+        """
+        if deck_key is None:
+            deck_paths = glob.glob(pth.join(self.result_folder_path, DECK_FILE_PREFIX + "*.npz"))
+        else:
+            deck_paths = [self.deck_path(deck_key)]
+
+        for deck_path in deck_paths:
+            if pth.exists(deck_path):
+                os.remove(deck_path)
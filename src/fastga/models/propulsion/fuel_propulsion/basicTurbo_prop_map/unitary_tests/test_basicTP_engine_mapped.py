@@ -115,6 +115,67 @@ def test_compute_flight_points():
     np.testing.assert_allclose(solo_flight_point.sfc, 1.828453757365673e-05, rtol=1e-2)
 
 
+def test_read_sfc_table():
+    engine = BasicTPEngineMapped(
+        power_design=485.429,
+        t_41t_design=1200,
+        opr_design=8.0,
+        cruise_altitude_propeller=6096.0,
+        design_altitude=0.0,
+        design_mach=0.2,
+        prop_layout=1.0,
+        bleed_control=0.0,
+        itt_limit=1000.0,
+        power_limit=404.524,
+        opr_limit=11.0,
+        speed_SL=SPEED,
+        thrust_SL=THRUST_SL,
+        thrust_limit_SL=THRUST_SL_LIMIT,
+        efficiency_SL=EFFICIENCY_SL,
+        speed_CL=SPEED,
+        thrust_CL=THRUST_CL,
+        thrust_limit_CL=THRUST_CL_LIMIT,
+        efficiency_CL=EFFICIENCY_CL,
+        effective_J=1.0,
+        effective_efficiency_ls=1.0,
+        effective_efficiency_cruise=1.0,
+        turbo_mach_SL=MACH_ARRAY,
+        turbo_thrust_SL=THRUST_ARRAY_SL,
+        turbo_thrust_max_SL=THRUST_MAX_ARRAY_SL,
+        turbo_sfc_SL=SFC_SL,
+        turbo_mach_CL=MACH_ARRAY,
+        turbo_thrust_CL=THRUST_ARRAY_CL,
+        turbo_thrust_max_CL=THRUST_MAX_ARRAY_CL,
+        turbo_sfc_CL=SFC_CL,
+        turbo_mach_IL=MACH_ARRAY,
+        turbo_thrust_IL=THRUST_ARRAY_IL,
+        turbo_thrust_max_IL=THRUST_MAX_ARRAY_IL,
+        turbo_sfc_IL=SFC_IL,
+        level_IL=3048,
+    )
+    interpolators = engine.sfc_interpolators()
+
+    # Array reading should give the scalar values point by point, on both sides of the
+    # intermediate level
+    thrusts = np.array([8723.73643444, 4352.43513423, 3670.56367899, 2378.52672608, 2754.44695866])
+    altitudes = np.array([0.0, 1500.0, 3048.0, 4000.0, 6096.0])
+    machs = np.array([0.06, 0.12, 0.18, 0.22, 0.375])
+    atmosphere = Atmosphere(altitudes, altitude_in_feet=False)
+    atmosphere.mach = machs
+    sfc = engine.read_sfc_table(thrusts, atmosphere)
+    max_thrust = engine.max_thrust(atmosphere)
+    for idx in range(len(thrusts)):
+        local_atmosphere = Atmosphere(altitudes[idx], altitude_in_feet=False)
+        local_atmosphere.mach = machs[idx]
+        np.testing.assert_allclose(
+            engine.read_sfc_table(thrusts[idx], local_atmosphere), sfc[idx], rtol=1e-12
+        )
+        np.testing.assert_allclose(engine.max_thrust(local_atmosphere), max_thrust[idx], rtol=1e-12)
+
+    # Interpolators are built only once
+    assert engine.sfc_interpolators() is interpolators
+
+
 def test_engine_weight():
     engine = BasicTPEngineMapped(
         power_design=485.429,
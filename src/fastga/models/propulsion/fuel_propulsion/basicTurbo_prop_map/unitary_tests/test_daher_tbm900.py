@@ -15,14 +15,32 @@ Test module for basicTP_engine_constructor.py
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import copy
+import os.path as pth
+import tempfile
+
 import pytest
 import numpy as np
+import fastoad.api as oad
+from fastoad.constants import EngineSetting
+from stdatm import Atmosphere
+
+from fastga.models.propulsion.fuel_propulsion.basicTurbo_prop.basicTP_engine import BasicTPEngine
 
+from .. import basicTP_engine_constructor
 from ..basicTP_engine_constructor import ComputeTurbopropMap
+from ..turboprop_deck_store import TurbopropDeckStore, TURBOPROP_DECK_VERSION
 
 from tests.testing_utilities import run_system, get_indep_var_comp, list_inputs
 
 from .data.dummy_maps import (
+    SPEED,
+    THRUST_SL,
+    THRUST_SL_LIMIT,
+    EFFICIENCY_SL,
+    THRUST_CL,
+    THRUST_CL_LIMIT,
+    EFFICIENCY_CL,
     MACH_ARRAY,
     THRUST_ARRAY_CL,
     THRUST_ARRAY_IL,
@@ -154,3 +172,139 @@ def test_table_construction():
         )
         < 1e-2
     )
+
+
+def test_construct_tables(monkeypatch):
+    """Tests the tables computed together, in one or several processes, on a reduced grid."""
+
+    monkeypatch.setattr(basicTP_engine_constructor, "MACH_PTS_NB_TURBOPROP", 3)
+    engine = BasicTPEngine(
+        power_design=485.429,
+        t_41t_design=1200,
+        opr_design=8.0,
+        cruise_altitude_propeller=6096.0,
+        design_altitude=0.0,
+        design_mach=0.2,
+        prop_layout=1.0,
+        bleed_control=0.0,
+        itt_limit=1000.0,
+        power_limit=404.524,
+        opr_limit=11.0,
+        speed_SL=SPEED,
+        thrust_SL=THRUST_SL,
+        thrust_limit_SL=THRUST_SL_LIMIT,
+        efficiency_SL=EFFICIENCY_SL,
+        speed_CL=SPEED,
+        thrust_CL=THRUST_CL,
+        thrust_limit_CL=THRUST_CL_LIMIT,
+        efficiency_CL=EFFICIENCY_CL,
+        effective_J=1.0,
+        effective_efficiency_ls=1.0,
+        effective_efficiency_cruise=1.0,
+    )
+    inputs = {
+        "data:TLAR:v_cruise": np.array([140.0]),
+        "data:aerodynamics:propeller:cruise_level:altitude": np.array([6096.0]),
+    }
+    altitude_list = [0.0, 6096.0]
+
+    tables = ComputeTurbopropMap(number_of_thrust_subdivision=3).construct_tables(
+        altitude_list, inputs, copy.deepcopy(engine)
+    )
+    parallel_tables = ComputeTurbopropMap(
+        number_of_thrust_subdivision=3, table_workers=2
+    ).construct_tables(altitude_list, inputs, copy.deepcopy(engine))
+
+    for table, parallel_table in zip(tables, parallel_tables):
+        for value, parallel_value in zip(table, parallel_table):
+            np.testing.assert_allclose(parallel_value, value, rtol=1e-12)
+
+    # Same maximum thrusts and sfc as computed point by point
+    for altitude, (mach_array, thrust_array, sfc_table, max_thrust_array) in zip(
+        altitude_list, tables
+    ):
+        assert len(mach_array) == 3
+        for mach, sfc_array, max_thrust in zip(mach_array, sfc_table, max_thrust_array):
+            local_engine = copy.deepcopy(engine)
+            atmosphere = Atmosphere(altitude, altitude_in_feet=False)
+            atmosphere.mach = mach
+            np.testing.assert_allclose(max_thrust, local_engine.max_thrust(atmosphere), rtol=1e-6)
+            for thrust, sfc in zip(thrust_array, sfc_array):
+                # Points above the maximum thrust are extrapolated or left invalid
+                if thrust > max_thrust:
+                    continue
+                flight_point = oad.FlightPoint(
+                    mach=mach,
+                    altitude=altitude,
+                    engine_setting=EngineSetting.CRUISE,
+                    thrust_is_regulated=True,
+                    thrust_rate=0.0,
+                    thrust=np.array([thrust]),
+                )
+                local_engine.compute_flight_points(flight_point)
+                np.testing.assert_allclose(sfc, flight_point.sfc, rtol=1e-6)
+
+
+@pytest.mark.skipif(
+    SKIP_STEPS,
+    reason="Skipping test because it is too long",
+)
+def test_saved_table():
+    """Tests that the tables computed for the same inputs are read."""
+
+    results_folder = tempfile.TemporaryDirectory()
+    ivc = get_indep_var_comp(list_inputs(ComputeTurbopropMap()), __file__, XML_FILE)
+    problem = run_system(ComputeTurbopropMap(result_folder_path=results_folder.name), ivc)
+    saved_problem = run_system(ComputeTurbopropMap(result_folder_path=results_folder.name), ivc)
+
+    for level in ["sea_level", "cruise_level", "intermediate_level"]:
+        for name in ["mach", "thrust", "thrust_limit", "sfc"]:
+            variable_name = "data:propulsion:turboprop:" + level + ":" + name
+            assert saved_problem[variable_name] == pytest.approx(problem[variable_name], rel=1e-12)
+
+    results_folder.cleanup()
+
+
+def test_deck_store():
+    """Tests the saving of the turboprop decks."""
+
+    results_folder = tempfile.TemporaryDirectory()
+
+    # Decks are identified by all their inputs and options
+    inputs = {
+        "data:propulsion:turboprop:design_point:power": np.array([634.0]),
+        "data:aerodynamics:propeller:sea_level:thrust_limit": np.array([5000.0, 4000.0, 3000.0]),
+    }
+    key = TurbopropDeckStore.deck_key(inputs, {"number_of_thrust_subdivision": 10})
+    assert TurbopropDeckStore.deck_key(dict(inputs), {"number_of_thrust_subdivision": 10}) == key
+    assert TurbopropDeckStore.deck_key(inputs, {"number_of_thrust_subdivision": 11}) != key
+    inputs["data:aerodynamics:propeller:sea_level:thrust_limit"][1] = 4001.0
+    assert TurbopropDeckStore.deck_key(inputs, {"number_of_thrust_subdivision": 10}) != key
+
+    deck_store = TurbopropDeckStore(results_folder.name)
+    assert deck_store.search(key) is None
+    deck_store.save(key, {"data:propulsion:turboprop:sea_level:thrust": np.array([1.0, 2.0])})
+    deck = deck_store.search(key)
+    assert list(deck) == ["data:propulsion:turboprop:sea_level:thrust"]
+    assert np.all(deck["data:propulsion:turboprop:sea_level:thrust"] == np.array([1.0, 2.0]))
+
+    # Decks of other versions are not read
+    np.savez(
+        deck_store.deck_path(key),
+        version=np.array(TURBOPROP_DECK_VERSION + 1),
+        key=np.array(key),
+        thrust=np.array([1.0, 2.0]),
+    )
+    assert deck_store.search(key) is None
+
+    # Decks are removed one by one or all together
+    other_key = TurbopropDeckStore.deck_key(inputs, {"number_of_thrust_subdivision": 10})
+    deck_store.save(key, {"thrust": np.array([1.0, 2.0])})
+    deck_store.save(other_key, {"thrust": np.array([3.0, 4.0])})
+    deck_store.invalidate(key)
+    assert deck_store.search(key) is None
+    assert deck_store.search(other_key) is not None
+    deck_store.invalidate()
+    assert not pth.exists(deck_store.deck_path(other_key))
+
+    results_folder.cleanup()
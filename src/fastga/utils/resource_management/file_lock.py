@@ -0,0 +1,144 @@
+"""Tools to safely share result files between processes."""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import os.path as pth
+import stat
+import tempfile
+import time
+from contextlib import contextmanager
+
+_LOCK_FILE_EXTENSION = ".lock"
+_REPLACE_ATTEMPTS = 20
+
+
+class FileLock:
+    """
+    Inter-process lock on a file, to be used as a context manager.
+
+    The lock is a <file>.lock file created exclusively next to the locked file, which works the
+    same way on every platform. A lock file older than stale_timeout is considered to be left by a
+    killed process and is removed.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        timeout: float = 60.0,
+        stale_timeout: float = 600.0,
+        poll_interval: float = 0.05,
+    ):
+        """
+        :param file_path: path of the file to lock, it does not need to exist.
+        :param timeout: maximum waiting time for the lock, in s.
+        :param stale_timeout: age of a lock file after which it is removed, in s.
+        :param poll_interval: time between two attempts to get the lock, in s.
+        """
+        self.lock_file_path = file_path + _LOCK_FILE_EXTENSION
+        self.timeout = timeout
+        self.stale_timeout = stale_timeout
+        self.poll_interval = poll_interval
+        self.is_locked = False
+
+    def acquire(self):
+        """Waits until the lock is obtained, raises TimeoutError after timeout."""
+        start_time = time.time()
+        while True:
+            try:
+                file_descriptor = os.open(self.lock_file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except (FileExistsError, PermissionError):
+                # On Windows a lock file being removed raises a PermissionError, otherwise the
+                # folder is not writable
+                if not pth.exists(self.lock_file_path):
+                    if not os.access(pth.dirname(pth.abspath(self.lock_file_path)), os.W_OK):
+                        raise
+                self._remove_stale_lock()
+                if time.time() - start_time > self.timeout:
+                    raise TimeoutError("Unable to lock %s!" % self.lock_file_path)
+                time.sleep(self.poll_interval)
+            else:
+                os.write(file_descriptor, str(os.getpid()).encode("utf-8"))
+                os.close(file_descriptor)
+                self.is_locked = True
+                return
+
+    def release(self):
+        """Releases the lock."""
+        if self.is_locked:
+            try:
+                os.remove(self.lock_file_path)
+            except FileNotFoundError:
+                pass
+            self.is_locked = False
+
+    def _remove_stale_lock(self):
+
+        try:
+            if time.time() - pth.getmtime(self.lock_file_path) > self.stale_timeout:
+                os.remove(self.lock_file_path)
+        except OSError:
+            # Lock released or removed by another process meanwhile
+            pass
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+@contextmanager
+def atomic_write(file_path: str):
+    """
+    Context manager that yields a temporary file path, in the same folder as file_path, and
+    renames it to file_path once written. Other processes thus either read the previous file or
+    the complete new one, never a partially written one.
+
+    The written file keeps the permissions of the file it replaces. A new file gets the default
+    permissions of the process, the temporary file being readable by its owner only.
+
+    :param file_path: path of the file to write.
+    """
+    folder_path, file_name = pth.split(pth.abspath(file_path))
+    file_descriptor, tmp_file_path = tempfile.mkstemp(
+        prefix=file_name + ".", suffix=".tmp", dir=folder_path
+    )
+    os.close(file_descriptor)
+    try:
+        yield tmp_file_path
+        os.chmod(tmp_file_path, _file_mode(file_path))
+        for attempt in range(_REPLACE_ATTEMPTS):
+            try:
+                os.replace(tmp_file_path, file_path)
+                break
+            except PermissionError:
+                # On Windows, the target cannot be replaced while another process reads it
+                if attempt == _REPLACE_ATTEMPTS - 1:
+                    raise
+                time.sleep(0.1)
+    finally:
+        if pth.exists(tmp_file_path):
+            os.remove(tmp_file_path)
+
+
+def _file_mode(file_path: str) -> int:
+    """Returns the permissions of file_path, or the default ones if it does not exist."""
+    try:
+        return stat.S_IMODE(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        # The umask can only be read by setting it
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
@@ -0,0 +1,43 @@
+"""Identification of the results saved for given inputs."""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import hashlib
+import json
+
+import numpy as np
+
+INPUT_SIGNIFICANT_DIGITS = 10
+
+
+def hash_inputs(inputs, **key_items) -> str:
+    """
+    Returns the hash identifying results computed from the given inputs. Input values are rounded
+    to INPUT_SIGNIFICANT_DIGITS significant digits, so that results are found again despite
+    round-off differences.
+
+    :param inputs: the inputs of the computation, vectors being allowed.
+    :param key_items: other JSON serializable items identifying the results, e.g. the version of
+    the computation or its options.
+    """
+    key = dict(key_items)
+    # Adding 0.0 turns -0.0 into 0.0 so that they share the same key
+    key["inputs"] = {
+        name: [
+            "%.*g" % (INPUT_SIGNIFICANT_DIGITS, value + 0.0)
+            for value in np.ravel(np.asarray(inputs[name], dtype=float))
+        ]
+        for name in inputs
+    }
+
+    return hashlib.sha1(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
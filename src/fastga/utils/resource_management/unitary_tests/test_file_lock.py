@@ -0,0 +1,106 @@
+"""Test module for the inter-process file lock."""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import os.path as pth
+import stat
+from multiprocessing import Pool
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from ..file_lock import FileLock, atomic_write
+
+PROCESS_COUNT = 4
+WRITE_COUNT = 20
+
+
+def _append_lines(file_path: str, process_id: int):
+    """Appends lines to the file by reading and rewriting it completely."""
+    for idx in range(WRITE_COUNT):
+        with FileLock(file_path):
+            lines = []
+            if pth.exists(file_path):
+                with open(file_path) as file:
+                    lines = file.readlines()
+            lines.append("%d,%d\n" % (process_id, idx))
+            with atomic_write(file_path) as tmp_file_path:
+                with open(tmp_file_path, "w") as file:
+                    file.writelines(lines)
+
+
+def test_concurrent_writes():
+    """Tests that no line is lost when several processes rewrite the same file."""
+    with TemporaryDirectory() as tmp_folder:
+        file_path = pth.join(tmp_folder, "results.csv")
+        with Pool(PROCESS_COUNT) as pool:
+            pool.starmap(_append_lines, [(file_path, idx) for idx in range(PROCESS_COUNT)])
+
+        with open(file_path) as file:
+            lines = file.readlines()
+        assert len(lines) == PROCESS_COUNT * WRITE_COUNT
+        assert len(set(lines)) == PROCESS_COUNT * WRITE_COUNT
+        # Neither lock nor temporary files should remain
+        assert os.listdir(tmp_folder) == ["results.csv"]
+
+
+def test_lock_timeout():
+    """Tests that a lock held elsewhere is waited for, and that stale locks are removed."""
+    with TemporaryDirectory() as tmp_folder:
+        file_path = pth.join(tmp_folder, "results.csv")
+        with FileLock(file_path):
+            with pytest.raises(TimeoutError):
+                FileLock(file_path, timeout=0.2).acquire()
+            with FileLock(file_path, stale_timeout=0.0) as lock:
+                assert lock.is_locked
+        assert not pth.exists(file_path + ".lock")
+
+
+def test_atomic_write_failure():
+    """Tests that the original file is kept if the writing fails."""
+    with TemporaryDirectory() as tmp_folder:
+        file_path = pth.join(tmp_folder, "results.csv")
+        with open(file_path, "w") as file:
+            file.write("original")
+
+        with pytest.raises(RuntimeError):
+            with atomic_write(file_path) as tmp_file_path:
+                with open(tmp_file_path, "w") as file:
+                    file.write("partial")
+                raise RuntimeError()
+
+        with open(file_path) as file:
+            assert file.read() == "original"
+        assert os.listdir(tmp_folder) == ["results.csv"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Only the read-only flag can be set on Windows")
+def test_atomic_write_mode():
+    """Tests that written files get the default permissions, or keep those of the replaced file."""
+    umask = os.umask(0o022)
+    try:
+        with TemporaryDirectory() as tmp_folder:
+            file_path = pth.join(tmp_folder, "results.csv")
+            with atomic_write(file_path) as tmp_file_path:
+                with open(tmp_file_path, "w") as file:
+                    file.write("new")
+            assert stat.S_IMODE(os.stat(file_path).st_mode) == 0o644
+
+            os.chmod(file_path, 0o640)
+            with atomic_write(file_path) as tmp_file_path:
+                with open(tmp_file_path, "w") as file:
+                    file.write("replaced")
+            assert stat.S_IMODE(os.stat(file_path).st_mode) == 0o640
+    finally:
+        os.umask(umask)
@@ -0,0 +1,36 @@
+"""
+Test module for input_hash.py
+"""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+from ..input_hash import hash_inputs
+
+
+def test_hash_inputs():
+    """Tests that the hash only depends on the rounded input values and on the key items."""
+    inputs = {"diameter": np.array([1.9]), "twist": np.array([20.0, 10.0, -0.0])}
+    key = hash_inputs(inputs, version=1, options={"elements_number": 5})
+
+    # Order of the inputs, round-off differences and signed zeros do not matter
+    same_inputs = {"twist": [20.0, 10.0 * (1.0 + 1e-13), 0.0], "diameter": 1.9}
+    assert hash_inputs(same_inputs, version=1, options={"elements_number": 5}) == key
+
+    # Other values or key items give another hash
+    assert (
+        hash_inputs({**inputs, "diameter": 1.91}, version=1, options={"elements_number": 5}) != key
+    )
+    assert hash_inputs(inputs, version=2, options={"elements_number": 5}) != key
+    assert hash_inputs(inputs, version=1, options={"elements_number": 6}) != key